@@ -0,0 +1,87 @@
+"""Measure the memory used to hold PEP records.
+
+Usage:
+
+    python benchmarks/pep_memory.py [peps.json]
+
+If no PEP index is given, the local copy the application uses is measured.
+"""
+
+##############################################################################
+# Python imports.
+import sys
+from gc import collect
+from json import loads
+from pathlib import Path
+from sys import getsizeof
+from tracemalloc import get_traced_memory, start, stop
+
+##############################################################################
+# Local imports.
+from peplum.app.data import (
+    PEP,
+    Containing,
+    Facets,
+    Notes,
+    PEPs,
+    WithStatus,
+    WithType,
+    pep_data,
+)
+
+
+##############################################################################
+def main() -> None:
+    """Measure the memory used to hold PEP records."""
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else pep_data()
+    text = source.read_text(encoding="utf-8")
+    notes = Notes()
+
+    # Measure what is still held once the raw data has been thrown away,
+    # as happens when the application loads the PEPs.
+    collect()
+    start()
+    baseline, _ = get_traced_memory()
+    raw = list(loads(text).values())
+    peps = [PEP.from_storage(pep, notes) for pep in raw]
+    del raw
+    collect()
+    used, _ = get_traced_memory()
+    stop()
+
+    records = getsizeof(peps[0]) + getsizeof(getattr(peps[0], "__dict__", None))
+    print(f"PEPs:                   {len(peps)}")
+    print(f"Traced bytes in total:  {used - baseline:,}")
+    print(f"Traced bytes per PEP:   {(used - baseline) / len(peps):,.0f}")
+    print(f"Bytes per PEP record:   {records:,}")
+    print(f"PEP has a __dict__:     {hasattr(peps[0], '__dict__')}")
+
+    # Measure what is held by a chain of filtered and sorted views of the
+    # PEPs, as made when the user narrows down the PEPs on display.
+    views = [PEPs(peps, facets=Facets(peps))]
+    filters = (WithType("Standards Track"), WithStatus("Final"), Containing("a"))
+    for pep_filter in filters:
+        # Get any per-PEP caches the filters use built before measuring.
+        _ = views[0] & pep_filter
+    collect()
+    start()
+    baseline, _ = get_traced_memory()
+    for pep_filter in (
+        WithType("Standards Track"),
+        WithStatus("Final"),
+        Containing("a"),
+    ):
+        views.append(views[-1] & pep_filter)
+        views.append(views[-1].sorted_by("title"))
+    collect()
+    used, _ = get_traced_memory()
+    stop()
+    print(f"PEPs in the last view:  {len(views[-1])}")
+    print(f"Traced bytes per view:  {(used - baseline) / (len(views) - 1):,.0f}")
+
+
+##############################################################################
+if __name__ == "__main__":
+    main()
+
+### pep_memory.py ends here
@@ -0,0 +1,126 @@
+"""Measure the time taken to search the text of a collection of PEPs.
+
+Usage:
+
+    python benchmarks/pep_search.py [peps.json]
+
+If no PEP index is given, the local copy the application uses is measured.
+"""
+
+##############################################################################
+# Python imports.
+import sys
+from json import loads
+from pathlib import Path
+from time import perf_counter
+from typing import Callable
+
+##############################################################################
+# Local imports.
+from peplum.app.data import (
+    PEP,
+    Containing,
+    Facets,
+    Notes,
+    PEPs,
+    Resembling,
+    WithStatus,
+    pep_data,
+)
+
+##############################################################################
+SEARCHES = ("pattern matching", "pattern matchng", "packaging", "guido")
+"""The text to search for."""
+
+
+##############################################################################
+def timed(title: str, action: Callable[[], object], repeat: int = 1) -> None:
+    """Time an action and report on it.
+
+    Args:
+        title: The title of the action.
+        action: The action to time.
+        repeat: How many times to repeat the action; the best time is reported.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        started = perf_counter()
+        action()
+        best = min(best, perf_counter() - started)
+    print(f"{title:<44}{best * 1000:10.3f}ms")
+
+
+##############################################################################
+def typing(peps: PEPs, text: str, narrowing: bool) -> None:
+    """Search some PEPs for some text, as if it were being typed.
+
+    Args:
+        peps: The PEPs to search.
+        text: The text to type.
+        narrowing: Should each search narrow the last one?
+    """
+    found = peps
+    for length in range(1, len(text) + 1):
+        searching = Containing(text[:length])
+        if narrowing and length > 1:
+            found = found.narrowed(Containing(text[: length - 1]), searching)
+        else:
+            found = PEPs(filters=(searching,)).rebuild_from(peps)
+        len(found)
+
+
+##############################################################################
+def main() -> None:
+    """Measure the time taken to search the text of a collection of PEPs."""
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else pep_data()
+    notes = Notes()
+    records = [
+        PEP.from_storage(pep, notes)
+        for pep in loads(source.read_text(encoding="utf-8")).values()
+    ]
+    print(f"PEPs: {len(records)}")
+    facets = Facets(records)
+    timed("Building the trigram index", lambda: facets.resembling("", 0))
+    for text in SEARCHES:
+        timed(
+            f"Resembling {text!r}",
+            lambda: facets.resembling(text, facets.everything),
+            repeat=10,
+        )
+    peps = PEPs(records, facets=facets)
+    for text in SEARCHES:
+        timed(
+            f"Containing {text!r}",
+            lambda: len(PEPs(filters=(Containing(text),)).rebuild_from(peps)),
+        )
+        timed(
+            f"Like {text!r}",
+            lambda: len(PEPs(filters=(Resembling(text),)).rebuild_from(peps)),
+        )
+    for text in SEARCHES:
+        # Each time, use a fresh collection so there are no remembered results.
+        timed(
+            f"Typing {text!r}, searching afresh",
+            lambda: typing(PEPs(records, facets=facets), text, False),
+        )
+        timed(
+            f"Typing {text!r}, narrowing",
+            lambda: typing(PEPs(records, facets=facets), text, True),
+        )
+    final = peps & WithStatus("Final")
+    for text in SEARCHES:
+        timed(
+            f"Ranking Final by {text!r}",
+            lambda: list(
+                PEPs(filters=(Resembling(text),), sort_order="relevance")
+                .rebuild_from(final)
+                .sorted_by("relevance")
+            ),
+        )
+
+
+##############################################################################
+if __name__ == "__main__":
+    main()
+
+### pep_search.py ends here
@@ -0,0 +1,65 @@
+"""Measure the time taken to put a collection of PEPs in order.
+
+Usage:
+
+    python benchmarks/pep_sorting.py [peps.json]
+
+If no PEP index is given, the local copy the application uses is measured.
+"""
+
+##############################################################################
+# Python imports.
+import sys
+from json import loads
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, get_args
+
+##############################################################################
+# Local imports.
+from peplum.app.data import PEP, Facets, Notes, PEPs, SortOrder, WithStatus, pep_data
+
+
+##############################################################################
+def timed(title: str, action: Callable[[], object]) -> None:
+    """Time an action and report on it.
+
+    Args:
+        title: The title of the action.
+        action: The action to time.
+    """
+    started = perf_counter()
+    action()
+    print(f"{title:<36}{(perf_counter() - started) * 1000:10.2f}ms")
+
+
+##############################################################################
+def main() -> None:
+    """Measure the time taken to put a collection of PEPs in order."""
+    source = Path(sys.argv[1]) if len(sys.argv) > 1 else pep_data()
+    notes = Notes()
+    records = [
+        PEP.from_storage(pep, notes)
+        for pep in loads(source.read_text(encoding="utf-8")).values()
+    ]
+    print(f"PEPs: {len(records)}")
+    facets = Facets(records)
+    timed("Building the indexes", lambda: Facets(records))
+    peps = PEPs(records, facets=facets)
+    for order in get_args(SortOrder):
+        timed(f"Sorting all by {order}", lambda: list(peps.sorted_by(order)))
+        timed(
+            f"Sorting all by {order}, reversed",
+            lambda: list(peps.sorted_by(order).reversed(True)),
+        )
+    final = peps & WithStatus("Final")
+    print(f"Final PEPs: {len(final)}")
+    for order in get_args(SortOrder):
+        timed(f"Sorting Final by {order}", lambda: list(final.sorted_by(order)))
+
+
+##############################################################################
+if __name__ == "__main__":
+    main()
+
+### pep_sorting.py ends here
@@ -0,0 +1,47 @@
+"""Measure the time taken to index a collection of PEP sources.
+
+Usage:
+
+    python benchmarks/source_indexing.py [directory]
+
+If no directory of PEP sources is given, the local cache the application
+uses is measured. The sources are indexed from scratch, once for each count
+of worker processes.
+"""
+
+##############################################################################
+# Python imports.
+import sys
+from os import cpu_count
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+##############################################################################
+# Local imports.
+from peplum.app.data import cache_dir
+from peplum.peps import API, SourceCache, SourceIndex
+
+
+##############################################################################
+def main() -> None:
+    """Measure the time taken to index a collection of PEP sources."""
+    cache = SourceCache(API(), Path(sys.argv[1]) if len(sys.argv) > 1 else cache_dir())
+    print(f"PEP sources: {len(list(cache.cached()))}")
+    workers = 1
+    with TemporaryDirectory() as scratch:
+        while True:
+            index = SourceIndex(Path(scratch) / f"sources-{workers}.db", workers)
+            started = perf_counter()
+            index.catch_up(cache)
+            print(f"Workers: {workers:<4}{(perf_counter() - started) * 1000:10.3f}ms")
+            if workers >= (cpu_count() or 1):
+                break
+            workers = min(workers * 2, cpu_count() or 1)
+
+
+##############################################################################
+if __name__ == "__main__":
+    main()
+
+### source_indexing.py ends here
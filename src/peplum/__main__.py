@@ -10,7 +10,7 @@ from typing import get_args as get_literal_values
 ##############################################################################
 # Local imports.
 from . import __doc__, __version__
-from .app import Peplum
+from .app import Peplum, api_client
 from .app.data import SortOrder
 
 
@@ -65,6 +65,16 @@ def get_args() -> Namespace:
         ),
     )
 
+    # Add --warm-cache
+    parser.add_argument(
+        "--warm-cache",
+        help="Download the sources of all PEPs into the local cache, then exit; "
+        "either one PEP at a time or as one archive of all PEPs",
+        nargs="?",
+        const="pep",
+        choices=("pep", "archive"),
+    )
+
     # Add --theme
     parser.add_argument(
         "-t",
@@ -110,6 +120,78 @@ def show_themes() -> None:
             print(theme)
 
 
+##############################################################################
+def warm_cache(method: str) -> None:
+    """Download the sources of all PEPs into the local cache.
+
+    Args:
+        method: The method to use; either `pep` or `archive`.
+    """
+    from asyncio import run
+    from json import loads
+
+    from .app.data import cache_dir, load_configuration, pep_data, pep_source_index
+    from .peps import (
+        API,
+        ArchiveError,
+        SourceCache,
+        SourceIndex,
+        SourceIndexError,
+        WarmingProgress,
+        WarmingResult,
+    )
+
+    def report(progress: WarmingProgress) -> None:
+        if progress.error:
+            print(f"\rPEP{progress.pep}: {progress.error}")
+        print(
+            f"\rDownloaded {progress.done}"
+            + ("" if progress.total is None else f" of {progress.total}"),
+            end="",
+            flush=True,
+        )
+
+    async def warm() -> tuple[SourceCache, WarmingResult]:
+        configuration = load_configuration()
+        async with api_client(configuration) as api:
+            cache = SourceCache(api, cache_dir())
+            if method == "archive":
+                return cache, await cache.sync(report)
+            raw_data = (
+                loads(pep_data().read_text(encoding="utf-8"))
+                if pep_data().exists()
+                else (await api.get_peps()).peps or {}
+            )
+            return cache, await cache.warm(
+                (pep["number"] for pep in raw_data.values() if pep.get("number")),
+                configuration.source_download_concurrency,
+                report,
+            )
+
+    try:
+        cache, result = run(warm())
+    except KeyboardInterrupt:
+        print("\nCancelled; run again to carry on where this left off.")
+        return
+    except (API.Error, ArchiveError, OSError) as error:
+        print(f"\nUnable to download the PEP sources: {error}")
+        return
+    print(
+        f"\nDownloaded {result.downloaded}, "
+        f"already cached {result.skipped}, "
+        f"failed {len(result.failed)}."
+    )
+    print("Updating the index of the PEP sources...")
+    try:
+        updated = SourceIndex(
+            pep_source_index(), load_configuration().source_index_workers
+        ).catch_up(cache)
+    except SourceIndexError as error:
+        print(f"Unable to update the index of the PEP sources: {error}")
+        return
+    print(f"Indexed {updated} changed PEP sources.")
+
+
 ##############################################################################
 def main() -> None:
     """Main entry point."""
@@ -120,6 +202,8 @@ def main() -> None:
         show_bindable_commands()
     elif args.theme == "?":
         show_themes()
+    elif args.warm_cache:
+        warm_cache(args.warm_cache)
     else:
         Peplum(args).run()
 
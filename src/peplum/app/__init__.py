@@ -2,10 +2,10 @@
 
 ##############################################################################
 # Local imports.
-from .peplum import Peplum
+from .peplum import Peplum, api_client
 
 ##############################################################################
 # Exports.
-__all__ = ["Peplum"]
+__all__ = ["Peplum", "api_client"]
 
 ### __init__.py ends here
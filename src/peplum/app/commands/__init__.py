@@ -8,9 +8,15 @@ information, etc.
 ##############################################################################
 # Local imports.
 from .filtering import (
+    NextFilter,
+    PreviousFilter,
     Search,
+    SearchAsYouType,
     SearchAuthor,
     SearchPythonVersion,
+    SearchQuery,
+    SearchSimilar,
+    SearchSources,
     SearchStatus,
     SearchType,
     ShowAll,
@@ -22,6 +28,8 @@ from .main import (
     RedownloadPEPs,
     TogglePEPDetails,
     ViewPEP,
+    WarmCache,
+    WarmCacheFromArchive,
 )
 from .navigation_sorting import (
     ToggleAuthorsSortOrder,
@@ -29,7 +37,13 @@ from .navigation_sorting import (
     ToggleStatusesSortOrder,
     ToggleTypesSortOrder,
 )
-from .peps_sorting import SortByCreated, SortByNumber, SortByTitle, ToggleSortOrder
+from .peps_sorting import (
+    SortByCreated,
+    SortByNumber,
+    SortByRelevance,
+    SortByTitle,
+    ToggleSortOrder,
+)
 
 ##############################################################################
 # Exports.
@@ -37,15 +51,22 @@ __all__ = [
     "EditNotes",
     "Escape",
     "FindPEP",
+    "NextFilter",
+    "PreviousFilter",
     "RedownloadPEPs",
     "Search",
+    "SearchAsYouType",
     "SearchAuthor",
     "SearchPythonVersion",
+    "SearchQuery",
+    "SearchSimilar",
+    "SearchSources",
     "SearchStatus",
     "SearchType",
     "ShowAll",
     "SortByCreated",
     "SortByNumber",
+    "SortByRelevance",
     "SortByTitle",
     "ToggleAuthorsSortOrder",
     "TogglePEPDetails",
@@ -54,6 +75,8 @@ __all__ = [
     "ToggleStatusesSortOrder",
     "ToggleTypesSortOrder",
     "ViewPEP",
+    "WarmCache",
+    "WarmCacheFromArchive",
 ]
 
 ### __init__.py ends here
@@ -12,6 +12,20 @@ class ShowAll(Command):
     BINDING_KEY = "a"
 
 
+##############################################################################
+class PreviousFilter(Command):
+    """Go back to the previous filter of the PEPs"""
+
+    BINDING_KEY = ("left_square_bracket", "[")
+
+
+##############################################################################
+class NextFilter(Command):
+    """Go forward to the next filter of the PEPs, after going back"""
+
+    BINDING_KEY = ("right_square_bracket", "]")
+
+
 ##############################################################################
 class Search(Command):
     """Search for text anywhere in the PEPs"""
@@ -19,6 +33,13 @@ class Search(Command):
     BINDING_KEY = "/"
 
 
+##############################################################################
+class SearchAsYouType(Command):
+    """Search for text anywhere in the PEPs, updating the PEPs as the text is typed"""
+
+    BINDING_KEY = "l"
+
+
 ##############################################################################
 class SearchAuthor(Command):
     """Search for an author then filter by them"""
@@ -33,6 +54,27 @@ class SearchPythonVersion(Command):
     BINDING_KEY = "v"
 
 
+##############################################################################
+class SearchQuery(Command):
+    """Filter the PEPs with a query of their status, type, Python version, authors and text"""
+
+    BINDING_KEY = "q"
+
+
+##############################################################################
+class SearchSimilar(Command):
+    """Search for text that resembles the titles, authors, topics or notes of the PEPs"""
+
+    BINDING_KEY = ("tilde", "~")
+
+
+##############################################################################
+class SearchSources(Command):
+    """Search for text within the cached sources of the PEPs"""
+
+    BINDING_KEY = "f"
+
+
 ##############################################################################
 class SearchStatus(Command):
     """Search for a PEP status and then filter by it"""
@@ -50,4 +50,18 @@ class ViewPEP(Command):
     SHOW_IN_FOOTER = True
 
 
+##############################################################################
+class WarmCache(Command):
+    """Download the sources of the PEPs being viewed, for quick offline viewing"""
+
+    COMMAND = "Download PEP Sources"
+
+
+##############################################################################
+class WarmCacheFromArchive(Command):
+    """Download the sources of all PEPs as a single archive, for quick offline viewing"""
+
+    COMMAND = "Download All PEP Sources As An Archive"
+
+
 ### main.py ends here
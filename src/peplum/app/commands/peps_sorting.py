@@ -26,6 +26,13 @@ class SortByTitle(Command):
     BINDING_KEY = "3"
 
 
+##############################################################################
+class SortByRelevance(Command):
+    """Sort PEPs by their relevance to the text being searched for"""
+
+    BINDING_KEY = "4"
+
+
 ##############################################################################
 class ToggleSortOrder(Command):
     """Toggle the current sort order"""
@@ -8,16 +8,23 @@ from .config import (
     save_configuration,
     update_configuration,
 )
+from .delta import IndexDelta, RawIndex
+from .facets import Facets, IndexedSortOrder, SortOrder
 from .locations import cache_dir
 from .notes import Notes
-from .pep import PEP, PEPStatus, PEPType, PostHistory
+from .pep import PEP, PEPStatus, PEPType, PostHistory, SearchDocument
 from .peps import (
+    AuthorContaining,
     AuthorCount,
     Containing,
+    Filters,
+    InSource,
+    Matching,
     PEPCount,
     PEPs,
+    PlanStep,
     PythonVersionCount,
-    SortOrder,
+    Resembling,
     StatusCount,
     TypeCount,
     WithAuthor,
@@ -25,26 +32,46 @@ from .peps import (
     WithStatus,
     WithType,
     pep_data,
+    pep_data_is_stale,
+    pep_data_validators,
+    pep_source_index,
 )
+from .query import QueryError, parse_query
 
 ##############################################################################
 # Exports.
 __all__ = [
+    "AuthorContaining",
     "AuthorCount",
     "cache_dir",
     "Configuration",
     "Containing",
+    "Facets",
+    "Filters",
+    "IndexDelta",
+    "IndexedSortOrder",
+    "InSource",
+    "Matching",
     "load_configuration",
     "Notes",
     "PEP",
     "pep_data",
+    "pep_data_is_stale",
+    "pep_data_validators",
+    "pep_source_index",
     "PEPCount",
     "PEPs",
     "PEPStatus",
     "PEPType",
+    "PlanStep",
     "PostHistory",
+    "parse_query",
     "PythonVersionCount",
+    "QueryError",
+    "RawIndex",
+    "Resembling",
     "save_configuration",
+    "SearchDocument",
     "SortOrder",
     "StatusCount",
     "TypeCount",
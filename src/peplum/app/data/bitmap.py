@@ -0,0 +1,25 @@
+"""Provides a way of making bitmaps of sets of PEPs."""
+
+##############################################################################
+# Python imports.
+from typing import Iterable
+
+
+##############################################################################
+def make_bitmap(ordinals: Iterable[int], size: int) -> int:
+    """Make a bitmap from some ordinals.
+
+    Args:
+        ordinals: The ordinals to set in the bitmap.
+        size: The count of ordinals the bitmap can hold.
+
+    Returns:
+        The bitmap.
+    """
+    bitmap = bytearray((size + 7) // 8)
+    for ordinal in ordinals:
+        bitmap[ordinal >> 3] |= 1 << (ordinal & 7)
+    return int.from_bytes(bitmap, "little")
+
+
+### bitmap.py ends here
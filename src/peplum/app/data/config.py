@@ -11,8 +11,8 @@ from typing import Iterator
 
 ##############################################################################
 # Local imports.
+from .facets import SortOrder
 from .locations import config_dir
-from .peps import SortOrder
 
 
 ##############################################################################
@@ -47,6 +47,49 @@ class Configuration:
     bindings: dict[str, str] = field(default_factory=dict)
     """Command keyboard binding overrides."""
 
+    api_timeout: float = 10.0
+    """The timeout, in seconds, for network operations with the PEP API."""
+
+    api_max_connections: int = 10
+    """The maximum number of concurrent connections to the PEP API."""
+
+    api_max_keepalive_connections: int = 10
+    """The maximum number of idle connections to keep alive."""
+
+    api_keepalive_expiry: float = 30.0
+    """How long, in seconds, to keep an idle connection alive."""
+
+    api_retries: int = 3
+    """The number of times to retry a failed request of the PEP API."""
+
+    api_retry_backoff: float = 0.5
+    """The base delay, in seconds, before retrying a failed request."""
+
+    api_retry_max_backoff: float = 10.0
+    """The maximum delay, in seconds, before retrying a failed request."""
+
+    api_breaker_threshold: int = 5
+    """The number of consecutive failures that stop calls to a server for a while."""
+
+    api_breaker_cool_down: float = 30.0
+    """How long, in seconds, calls to a failing server are stopped for."""
+
+    source_download_concurrency: int = 8
+    """The maximum number of PEP sources to download at once."""
+
+    source_index_workers: int = 0
+    """The number of processes used to prepare PEP sources for searching.
+
+    A value of zero or less uses one process for each CPU core; a value of
+    one prepares the sources within the application itself.
+    """
+
+    pep_data_max_age: float = 24 * 60 * 60
+    """How long, in seconds, before the local PEP data is checked for updates on startup.
+
+    A value of zero or less turns off checking for updates on startup.
+    """
+
 
 ##############################################################################
 def configuration_file() -> Path:
@@ -0,0 +1,96 @@
+"""Provides code for working out what changed between two copies of the PEP index."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, TypeAlias
+
+##############################################################################
+# Local imports.
+from .notes import Notes
+from .pep import PEP
+
+##############################################################################
+RawIndex: TypeAlias = Mapping[str, Mapping[str, Any]]
+"""The type of the raw PEP index, as downloaded from the API."""
+
+
+##############################################################################
+@dataclass(frozen=True)
+class IndexDelta:
+    """The differences between two copies of the raw PEP index."""
+
+    added: frozenset[int] = frozenset()
+    """The numbers of the PEPs that have been added."""
+    removed: frozenset[int] = frozenset()
+    """The numbers of the PEPs that have been removed."""
+    changed: Mapping[int, frozenset[str]] = field(default_factory=dict)
+    """The numbers of the PEPs that have changed, with the names of the fields that changed."""
+
+    @classmethod
+    def between(cls, old: RawIndex, new: RawIndex) -> IndexDelta:
+        """Work out the differences between two copies of the raw PEP index.
+
+        Args:
+            old: The old copy of the index.
+            new: The new copy of the index.
+
+        Returns:
+            The differences between the two copies.
+        """
+        old_keys = old.keys()
+        new_keys = new.keys()
+        changed: dict[int, frozenset[str]] = {}
+        for key in old_keys & new_keys:
+            if (was := old[key]) != (now := new[key]):
+                changed[int(key)] = frozenset(
+                    name
+                    for name in was.keys() | now.keys()
+                    if was.get(name) != now.get(name)
+                )
+        return cls(
+            added=frozenset(int(key) for key in new_keys - old_keys),
+            removed=frozenset(int(key) for key in old_keys - new_keys),
+            changed=changed,
+        )
+
+    def __bool__(self) -> bool:
+        """Are there any differences?"""
+        return bool(self.added or self.removed or self.changed)
+
+    @property
+    def affected(self) -> frozenset[int]:
+        """The numbers of all the PEPs that were added, removed or changed."""
+        return self.added | self.removed | self.changed.keys()
+
+    def apply(self, peps: Iterable[PEP], new: RawIndex, notes: Notes) -> list[PEP]:
+        """Apply the differences to a collection of PEPs.
+
+        Args:
+            peps: The PEPs that were made from the old copy of the index.
+            new: The new copy of the index.
+            notes: The local notes about PEPs.
+
+        Returns:
+            The PEPs for the new copy of the index.
+
+        Notes:
+            Only PEPs that were added or changed are parsed from the raw
+            data; any PEP that is unchanged is carried over as the very same
+            object.
+        """
+        existing = {pep.number: pep for pep in peps}
+        return [
+            pep
+            if (pep := existing.get(number := int(key))) is not None
+            and number not in self.changed
+            else PEP.from_storage(dict(data), notes)
+            for key, data in new.items()
+        ]
+
+
+### delta.py ends here
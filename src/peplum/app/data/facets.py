@@ -0,0 +1,380 @@
+"""Provides bitmap indexes of the facets, text and sort orders of a collection of PEPs."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from copy import copy
+from typing import Final, Iterable, Iterator, Literal, TypeAlias, get_args
+
+##############################################################################
+# Local imports.
+from .bitmap import make_bitmap
+from .pep import PEP
+from .trigrams import TrigramIndex, indexed_text
+
+##############################################################################
+Facet: TypeAlias = Literal["status", "type", "python_version", "author", "author_name"]
+"""The facets of a PEP that are indexed.
+
+`author` is the casefolded name of an author, for case-insensitive lookup;
+`author_name` is the name of an author as given, for counting.
+"""
+
+##############################################################################
+SortOrder: TypeAlias = Literal["number", "created", "title", "relevance"]
+"""Sort orders for PEPs."""
+
+IndexedSortOrder: TypeAlias = Literal["number", "created", "title"]
+"""Sort orders for PEPs that are held in the indexes.
+
+These are the sort orders that sort on a property of the PEPs; sorting by
+relevance depends on what is being searched for.
+"""
+
+##############################################################################
+RANK_SORT_LIMIT: Final[int] = 8
+"""How many times bigger than a set of PEPs the whole collection must be to sort the set.
+
+When putting a set of PEPs in order, if the whole collection is at least
+this many times bigger than the set, the PEPs in the set are sorted by
+their rank; otherwise the whole collection, in order, is walked and the
+PEPs in the set are picked out.
+"""
+
+
+##############################################################################
+class Facets:
+    """Bitmap indexes of the facets of a collection of PEPs.
+
+    Each PEP is given an ordinal, its position within the collection. A set
+    of PEPs is then held as a bitmap, an integer with the bit for the
+    ordinal of each PEP in the set turned on. For each of the status, type,
+    Python version and author of the PEPs, each value of that facet maps to
+    the bitmap of the PEPs that have that value. PEPs with no Python
+    version are indexed under an empty version.
+
+    For each sort order the ordinals are also held in that order, along
+    with the rank of each ordinal within it. PEPs that sort the same are
+    put in order of their number, so that going backwards through a sort
+    order is the same as that order reversed.
+
+    The title, authors, topic and notes of the PEPs are also indexed by
+    trigram, for typo-tolerant searching and ranking by relevance; this
+    index is only built when it's first needed.
+    """
+
+    def __init__(self, peps: Iterable[PEP] = (), index_text: bool = False) -> None:
+        """Initialise the object.
+
+        Args:
+            peps: The PEPs to index.
+            index_text: Index the text of the PEPs now, rather than when needed?
+        """
+        self._ordinals: dict[int, int] = {}
+        """The ordinal of each PEP, keyed by PEP number."""
+        self._numbers: list[int] = []
+        """The PEP number for each ordinal."""
+        ordinals: dict[Facet, dict[str, list[int]]] = {
+            facet: {} for facet in get_args(Facet)
+        }
+        self._peps: list[PEP] = []
+        """The PEP for each ordinal."""
+        self._trigrams: TrigramIndex | None = None
+        """The trigram index of the text of the PEPs, if it's been built."""
+        indexed = self._peps
+        for pep in peps:
+            if pep.number not in self._ordinals:
+                self._ordinals[pep.number] = len(self._numbers)
+                self._numbers.append(pep.number)
+                indexed.append(pep)
+            else:
+                indexed[self._ordinals[pep.number]] = pep
+            for facet, key in self.entries(pep):
+                ordinals[facet].setdefault(key, []).append(self._ordinals[pep.number])
+        self._indexes: dict[Facet, dict[str, int]] = {
+            facet: {
+                key: make_bitmap(found, len(self._numbers))
+                for key, found in index.items()
+            }
+            for facet, index in ordinals.items()
+        }
+        """The indexes, keyed by facet."""
+        self._orders: dict[IndexedSortOrder, list[int]] = {
+            order: sorted(
+                range(len(indexed)),
+                key=[(getattr(pep, order), pep.number) for pep in indexed].__getitem__,
+            )
+            for order in get_args(IndexedSortOrder)
+        }
+        """The ordinals in each of the sort orders."""
+        self._ranks: dict[IndexedSortOrder, list[int]] = {
+            order: self._rank(ordinals) for order, ordinals in self._orders.items()
+        }
+        """The rank of each ordinal in each of the sort orders."""
+        if index_text:
+            self._trigrams = TrigramIndex([indexed_text(pep) for pep in indexed])
+
+    @staticmethod
+    def entries(pep: PEP) -> tuple[tuple[Facet, str], ...]:
+        """Get the index entries for a PEP.
+
+        Args:
+            pep: The PEP to get the entries for.
+
+        Returns:
+            The facet, and the key within the index of that facet, for each entry.
+        """
+        return (
+            ("status", pep.status),
+            ("type", pep.type),
+            *(("python_version", version) for version in pep.python_version or ("",)),
+            *(("author", author.casefold()) for author in pep.author_names),
+            *(("author_name", author) for author in pep.author_names),
+        )
+
+    @staticmethod
+    def affected_by(old: PEP, new: PEP) -> bool:
+        """Would replacing a PEP with another change how it is indexed?
+
+        Args:
+            old: The PEP being replaced.
+            new: The PEP replacing it.
+
+        Returns:
+            `True` if the index entries or the sort keys of the PEPs differ.
+        """
+        return Facets.entries(old) != Facets.entries(new) or any(
+            getattr(old, order) != getattr(new, order)
+            for order in get_args(IndexedSortOrder)
+        )
+
+    def patched(self, pep: PEP) -> Facets:
+        """Get a copy of these indexes with a PEP replaced.
+
+        Args:
+            pep: The new version of the PEP.
+
+        Returns:
+            The patched indexes.
+
+        Notes:
+            The new version of the PEP must be indexed, and sorted, the same
+            as the version it replaces; see
+            [`affected_by`][peplum.app.data.Facets.affected_by]. The list of
+            PEPs, and the trigram index, are copied; everything else is
+            shared with these indexes.
+        """
+        patched = copy(self)
+        ordinal = self._ordinals[pep.number]
+        patched._peps = [*self._peps]
+        patched._peps[ordinal] = pep
+        if self._trigrams is not None:
+            patched._trigrams = self._trigrams.patched(
+                ordinal, indexed_text(self._peps[ordinal]), indexed_text(pep)
+            )
+        return patched
+
+    def same_ordinals(self, other: Facets) -> bool:
+        """Do these indexes give the same ordinals to PEPs as some others?
+
+        Args:
+            other: The other indexes.
+
+        Returns:
+            `True` if bitmaps of PEPs are the same for both indexes.
+        """
+        return self._ordinals is other._ordinals
+
+    @staticmethod
+    def _rank(ordinals: list[int]) -> list[int]:
+        """Get the rank of each ordinal within a sort order.
+
+        Args:
+            ordinals: The ordinals, in sort order.
+
+        Returns:
+            The position in the sort order of each ordinal.
+        """
+        ranks = [0] * len(ordinals)
+        for rank, ordinal in enumerate(ordinals):
+            ranks[ordinal] = rank
+        return ranks
+
+    def lookup(self, facet: Facet, key: str) -> int:
+        """Look up the PEPs with a given value for a facet.
+
+        Args:
+            facet: The facet to look in.
+            key: The value to look for.
+
+        Returns:
+            The bitmap of the PEPs with that value.
+        """
+        return self._indexes[facet].get(key, 0)
+
+    def matching(self, facet: Facet, text: str) -> int:
+        """Look up the PEPs with a value for a facet that contains some text.
+
+        Args:
+            facet: The facet to look in.
+            text: The text to look for in the values.
+
+        Returns:
+            The bitmap of the PEPs with a value that contains the text.
+        """
+        found = 0
+        for key, bitmap in self._indexes[facet].items():
+            if text in key:
+                found |= bitmap
+        return found
+
+    def counts(self, facet: Facet, peps: int) -> Iterator[tuple[str, int]]:
+        """Count the values of a facet within a set of PEPs.
+
+        Args:
+            facet: The facet to count the values of.
+            peps: The bitmap of the PEPs to count within.
+
+        Yields:
+            Each value of the facet found in the PEPs, and its count.
+        """
+        for key, bitmap in self._indexes[facet].items():
+            if count := (bitmap & peps).bit_count():
+                yield key, count
+
+    def bitmap(self, peps: Iterable[int]) -> int:
+        """Get the bitmap for a set of PEPs.
+
+        Args:
+            peps: The numbers of the PEPs.
+
+        Returns:
+            The bitmap of the PEPs.
+
+        Raises:
+            KeyError: If any of the PEPs aren't indexed.
+        """
+        return make_bitmap((self._ordinals[pep] for pep in peps), len(self._numbers))
+
+    @property
+    def everything(self) -> int:
+        """The bitmap of all of the indexed PEPs."""
+        return (1 << len(self._numbers)) - 1
+
+    def member(self, pep: int, peps: int) -> bool:
+        """Is a PEP within a set of PEPs?
+
+        Args:
+            pep: The number of the PEP.
+            peps: The bitmap of the PEPs.
+
+        Returns:
+            `True` if the PEP is indexed and in the set, `False` if not.
+        """
+        return (ordinal := self._ordinals.get(pep)) is not None and bool(
+            peps >> ordinal & 1
+        )
+
+    @staticmethod
+    def _set_ordinals(peps: int) -> Iterator[int]:
+        """Get the ordinals that are set in a bitmap.
+
+        Args:
+            peps: The bitmap of the PEPs.
+
+        Yields:
+            Each ordinal that is set, in order.
+        """
+        bits = f"{peps:b}"[::-1]
+        ordinal = bits.find("1")
+        while ordinal >= 0:
+            yield ordinal
+            ordinal = bits.find("1", ordinal + 1)
+
+    def numbers(self, peps: int) -> Iterator[int]:
+        """Get the numbers of the PEPs in a bitmap.
+
+        Args:
+            peps: The bitmap of the PEPs.
+
+        Yields:
+            The number of each PEP in the bitmap, in ordinal order.
+        """
+        numbers = self._numbers
+        for ordinal in self._set_ordinals(peps):
+            yield numbers[ordinal]
+
+    @property
+    def _text(self) -> TrigramIndex:
+        """The trigram index of the text of the PEPs."""
+        if self._trigrams is None:
+            self._trigrams = TrigramIndex([indexed_text(pep) for pep in self._peps])
+        return self._trigrams
+
+    def resembling(self, text: str, peps: int) -> int:
+        """Find the PEPs that resemble some text.
+
+        Args:
+            text: The text to look for.
+            peps: The bitmap of the PEPs to look within.
+
+        Returns:
+            The bitmap of the PEPs whose title, authors, topic or notes
+            contain enough of the trigrams of the text.
+        """
+        return self._text.resembling(text, peps)
+
+    def ordered(self, sort_order: IndexedSortOrder, peps: int) -> list[int]:
+        """Put a set of PEPs in a sort order.
+
+        Args:
+            sort_order: The sort order to put the PEPs in.
+            peps: The bitmap of the PEPs.
+
+        Returns:
+            The numbers of the PEPs in the sort order.
+        """
+        numbers = self._numbers
+        if peps == self.everything:
+            return [numbers[ordinal] for ordinal in self._orders[sort_order]]
+        if peps.bit_count() * RANK_SORT_LIMIT <= len(numbers):
+            return [
+                numbers[ordinal]
+                for ordinal in sorted(
+                    self._set_ordinals(peps),
+                    key=self._ranks[sort_order].__getitem__,
+                )
+            ]
+        wanted = f"{peps:0{len(numbers)}b}"[::-1]
+        return [
+            numbers[ordinal]
+            for ordinal in self._orders[sort_order]
+            if wanted[ordinal] == "1"
+        ]
+
+    def ranked(self, text: str, peps: int) -> list[int]:
+        """Put a set of PEPs in order of their relevance to some text.
+
+        Args:
+            text: The text to rank the PEPs against.
+            peps: The bitmap of the PEPs.
+
+        Returns:
+            The numbers of the PEPs, most relevant first.
+
+        Notes:
+            PEPs are ranked by how many of the trigrams of the text are in
+            their title, authors, topic or notes; PEPs with the same rank
+            are put in order of their number.
+        """
+        return [
+            number
+            for found in self._text.ranked(text, peps)
+            for number in self.ordered("number", found)
+        ]
+
+
+### facets.py ends here
@@ -0,0 +1,66 @@
+"""Provides a bounded cache that forgets what was least recently used."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, TypeVar
+
+##############################################################################
+KeyT = TypeVar("KeyT", bound=Hashable)
+"""The type of the key for a cached value."""
+
+ValueT = TypeVar("ValueT")
+"""The type of a cached value."""
+
+
+##############################################################################
+class LRUCache(Generic[KeyT, ValueT]):
+    """A bounded cache that forgets what was least recently used."""
+
+    def __init__(self, size: int) -> None:
+        """Initialise the object.
+
+        Args:
+            size: The most values to hold.
+        """
+        self._size = size
+        """The most values to hold."""
+        self._values: OrderedDict[KeyT, ValueT] = OrderedDict()
+        """The values, from least to most recently used."""
+
+    def __contains__(self, key: KeyT) -> bool:
+        """Is a value for the given key cached?"""
+        return key in self._values
+
+    def __len__(self) -> int:
+        """The number of values that are cached."""
+        return len(self._values)
+
+    def get(self, key: KeyT, make_value: Callable[[], ValueT]) -> ValueT:
+        """Get a value, making and caching it if it isn't cached.
+
+        Args:
+            key: The key for the value.
+            make_value: A function that makes the value.
+
+        Returns:
+            The value.
+
+        Notes:
+            If caching a value means there are too many values, the value
+            that was least recently used is forgotten.
+        """
+        if key in self._values:
+            self._values.move_to_end(key)
+            return self._values[key]
+        value = self._values[key] = make_value()
+        if len(self._values) > self._size:
+            self._values.popitem(last=False)
+        return value
+
+
+### lru_cache.py ends here
@@ -6,9 +6,10 @@ from __future__ import annotations
 
 ##############################################################################
 # Python imports.
-from dataclasses import dataclass, replace
+from dataclasses import dataclass, field, replace
 from datetime import date
 from re import Pattern, compile
+from sys import intern
 from typing import Any, Final, Literal, cast
 
 ##############################################################################
@@ -107,7 +108,7 @@ DATE_AND_URL: Final[Pattern[str]] = compile(
 
 
 ##############################################################################
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PostHistory:
     """Details of an item in a PEP's post history."""
 
@@ -138,7 +139,39 @@ class PostHistory:
 
 
 ##############################################################################
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class SearchDocument:
+    """The pre-normalised, searchable, content of a PEP."""
+
+    text: str
+    """The casefolded searchable text of the PEP, with fields separated by NUL."""
+    related: frozenset[str]
+    """The numbers of the PEPs this PEP requires, replaces or is superseded by."""
+
+    SEPARATOR = "\0"
+    """The separator placed between fields in the text."""
+
+    def __contains__(self, search_text: str) -> bool:
+        """Is the given text in the document?
+
+        Args:
+            search_text: The casefolded text to search for.
+
+        Returns:
+            `True` if the text can be found, `False` if not.
+
+        Notes:
+            The text is looked for within each of the fields of the PEP;
+            related PEPs are only matched if the text is exactly the number
+            of a related PEP.
+        """
+        return (
+            self.SEPARATOR not in search_text and search_text in self.text
+        ) or search_text in self.related
+
+
+##############################################################################
+@dataclass(frozen=True, slots=True)
 class PEP:
     """A class that holds data about a PEP."""
 
@@ -180,6 +213,10 @@ class PEP:
     """The URL for the PEP."""
     notes: str = ""
     """The user's notes associated with this PEP."""
+    _search_document: SearchDocument | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """The cached search document for the PEP."""
 
     def annotate(self, *, notes: str | None = None) -> PEP:
         """Annotate the PEP.
@@ -191,6 +228,45 @@ class PEP:
             return replace(self, notes=notes)
         return self
 
+    @property
+    def search_document(self) -> SearchDocument:
+        """The searchable content of the PEP.
+
+        Notes:
+            The document is built on first use and then cached. Because a
+            PEP is immutable, and annotating a PEP makes a new PEP, the
+            document never needs invalidating.
+        """
+        if self._search_document is None:
+            object.__setattr__(
+                self,
+                "_search_document",
+                SearchDocument(
+                    SearchDocument.SEPARATOR.join(
+                        (
+                            str(self.number),
+                            self.title,
+                            " ".join(self.author_names),
+                            self.sponsor or "",
+                            self.delegate or "",
+                            self.status,
+                            self.type,
+                            self.topic,
+                            str(self.created),
+                            " ".join(self.python_version),
+                            self.url,
+                            self.notes,
+                        )
+                    ).casefold(),
+                    frozenset(
+                        str(pep)
+                        for pep in (*self.requires, *self.replaces, *self.superseded_by)
+                    ),
+                ),
+            )
+        assert self._search_document is not None
+        return self._search_document
+
     def __contains__(self, search_text: str) -> bool:
         """Perhaps a case-insensitive search for the text anywhere in the PEP's data.
 
@@ -200,24 +276,7 @@ class PEP:
         Returns:
             `True` if the text can be found, `False` if not.
         """
-        search_text = search_text.casefold()
-        return (
-            search_text in str(self.number)
-            or search_text in self.title.casefold()
-            or search_text in " ".join(self.author_names).casefold()
-            or search_text in (self.sponsor or "").casefold()
-            or search_text in (self.delegate or "").casefold()
-            or search_text in self.status.casefold()
-            or search_text in self.type.casefold()
-            or search_text in self.topic.casefold()
-            or search_text in (str(pep) for pep in self.requires)
-            or search_text in str(self.created)
-            or search_text in " ".join(str(version) for version in self.python_version)
-            or search_text in (str(pep) for pep in self.replaces)
-            or search_text in (str(pep) for pep in self.superseded_by)
-            or search_text in self.url.casefold()
-            or search_text in self.notes.casefold()
-        )
+        return search_text.casefold() in self.search_document
 
     @classmethod
     def _parse(cls, data: dict[str, Any]) -> dict[str, Any]:
@@ -228,8 +287,16 @@ class PEP:
 
         Returns:
             The data turned into locally-useful values.
+
+        Notes:
+            Values that are heavily repeated across PEPs, such as statuses,
+            types and author names, are interned so that all PEPs share a
+            single copy of each.
         """
 
+        def shared(value: str | None) -> str | None:
+            return value if value is None else intern(value)
+
         def get_ints(field: str) -> tuple[int, ...]:
             if isinstance(values := data[field], str):
                 return tuple(int(value) for value in values.split(","))
@@ -238,18 +305,18 @@ class PEP:
         return dict(
             number=data.get("number", -1),
             title=data.get("title", ""),
-            authors=data.get("authors"),
-            author_names=tuple(data.get("author_names", [])),
-            sponsor=data.get("sponsor"),
-            delegate=data.get("delegate"),
+            authors=shared(data.get("authors")),
+            author_names=tuple(intern(name) for name in data.get("author_names", [])),
+            sponsor=shared(data.get("sponsor")),
+            delegate=shared(data.get("delegate")),
             discussions_to=data.get("discussions_to"),
-            status=cast(PEPStatus, data.get("status")),
-            type=cast(PEPType, data.get("type")),
-            topic=data.get("topic", ""),
+            status=cast(PEPStatus, shared(data.get("status"))),
+            type=cast(PEPType, shared(data.get("type"))),
+            topic=shared(data.get("topic", "")),
             requires=get_ints("requires"),
             created=parse_date(data.get("created", "")),
             python_version=tuple(
-                version.strip()
+                intern(version.strip())
                 for version in (data.get("python_version") or "").split(",")
                 if version
             ),
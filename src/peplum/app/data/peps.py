@@ -6,13 +6,13 @@ from __future__ import annotations
 
 ##############################################################################
 # Python imports.
-from collections import Counter
 from dataclasses import dataclass
 from functools import total_ordering
-from itertools import chain
+from itertools import chain, count
 from operator import attrgetter
 from pathlib import Path
-from typing import Iterable, Iterator, Literal, TypeAlias
+from time import perf_counter, time
+from typing import Final, Hashable, Iterable, Iterator, Mapping, TypeAlias, cast
 
 ##############################################################################
 # Packaging imports.
@@ -24,8 +24,11 @@ from typing_extensions import Self
 
 ##############################################################################
 # Local imports.
-from .locations import data_dir
+from .facets import Facets, SortOrder
+from .locations import cache_dir, data_dir
+from .lru_cache import LRUCache
 from .pep import PEP, PEPStatus, PEPType
+from .trigrams import indexed_text, resembles
 
 
 ##############################################################################
@@ -34,6 +37,38 @@ def pep_data() -> Path:
     return data_dir() / "peps.json"
 
 
+##############################################################################
+def pep_data_validators() -> Path:
+    """The path to the cache validators for the local copy of the PEP data."""
+    return data_dir() / "peps.validators.json"
+
+
+##############################################################################
+def pep_source_index() -> Path:
+    """The path to the full-text index of the locally-cached PEP sources."""
+    return cache_dir() / "sources.db"
+
+
+##############################################################################
+def pep_data_is_stale(max_age: float) -> bool:
+    """Is the local copy of the PEP data stale?
+
+    Args:
+        max_age: The age, in seconds, after which the data is stale.
+
+    Returns:
+        `True` if the data is older than the maximum age, or doesn't exist.
+
+    Notes:
+        The age of the data is the time since it was last downloaded, or
+        last confirmed as being up to date.
+    """
+    try:
+        return (time() - pep_data().stat().st_mtime) > max_age
+    except OSError:
+        return True
+
+
 ##############################################################################
 @dataclass(frozen=True)
 @total_ordering
@@ -141,9 +176,61 @@ Filters: TypeAlias = tuple["Filter", ...]
 class Filter:
     """Base class for the raindrop filters."""
 
+    COST: int = 1
+    """The relative cost of testing a PEP against this filter."""
+
     def __rand__(self, _: PEP) -> bool:
         return False
 
+    def lookup(self, facets: Facets) -> int | None:
+        """Look up the PEPs that match this filter.
+
+        Args:
+            facets: The indexes of the facets of the PEPs.
+
+        Returns:
+            The bitmap of the matching PEPs, or `None` if this filter can't
+            be looked up and needs testing against each PEP instead.
+        """
+        return None
+
+    def select(self, facets: Facets, candidates: int, peps: Mapping[int, PEP]) -> int:
+        """Select the PEPs that match this filter from some candidates.
+
+        Args:
+            facets: The indexes of the facets of the PEPs.
+            candidates: The bitmap of the candidate PEPs.
+            peps: The PEPs, keyed by their number.
+
+        Returns:
+            The bitmap of the candidate PEPs that match this filter.
+
+        Notes:
+            If this filter can be looked up in the indexes it is; otherwise
+            each of the candidates is tested against it.
+        """
+        if (found := self.lookup(facets)) is not None:
+            return candidates & found
+        return facets.bitmap(
+            number for number in facets.numbers(candidates) if peps[number] & self
+        )
+
+    def narrows(self, other: Filter) -> bool:
+        """Does this filter only match PEPs that another filter matches?
+
+        Args:
+            other: The other filter.
+
+        Returns:
+            `True` if every PEP that matches this filter matches the other.
+
+        Notes:
+            This is used to filter just the PEPs found with the other
+            filter, rather than all of the PEPs, when swapping it for this
+            filter. It's always safe to say `False`.
+        """
+        return self == other
+
     def __radd__(self, filters: Filters) -> Filters:
         return (*filters, self)
 
@@ -152,6 +239,9 @@ class Filter:
             return str(value) == str(self)
         return False
 
+    def __hash__(self) -> int:
+        return hash((self.__class__, str(self)))
+
 
 ##############################################################################
 class WithStatus(Filter):
@@ -169,6 +259,9 @@ class WithStatus(Filter):
     def __rand__(self, pep: PEP) -> bool:
         return pep.status == self._status
 
+    def lookup(self, facets: Facets) -> int:
+        return facets.lookup("status", self._status)
+
     def __str__(self) -> str:
         return str(self._status)
 
@@ -189,6 +282,9 @@ class WithType(Filter):
     def __rand__(self, pep: PEP) -> bool:
         return pep.type == self._type
 
+    def lookup(self, facets: Facets) -> int:
+        return facets.lookup("type", self._type)
+
     def __str__(self) -> str:
         return str(self._type)
 
@@ -213,6 +309,9 @@ class WithPythonVersion(Filter):
             else not pep.python_version
         )
 
+    def lookup(self, facets: Facets) -> int:
+        return facets.lookup("python_version", self._version)
+
     def __str__(self) -> str:
         return self._version or "None"
 
@@ -232,17 +331,61 @@ class WithAuthor(Filter):
         self._folded_author = author.casefold()
         """The folded version of the author for case-insensitive lookup."""
 
+    COST = 2
+
     def __rand__(self, pep: PEP) -> bool:
         return self._folded_author in (author.casefold() for author in pep.author_names)
 
+    def lookup(self, facets: Facets) -> int:
+        return facets.lookup("author", self._folded_author)
+
     def __str__(self) -> str:
         return str(self._author)
 
 
+##############################################################################
+class AuthorContaining(Filter):
+    """Filter on text found within the name of one of a PEP's authors."""
+
+    COST = 2
+
+    def __init__(self, text: str) -> None:
+        """Initialise the object.
+
+        Args:
+            text: The text to look for in the names of the authors.
+        """
+        self._text = text
+        """The text to look for in the names of the authors."""
+        self._folded_text = text.casefold()
+        """The folded version of the text for case-insensitive lookup."""
+
+    def __rand__(self, pep: PEP) -> bool:
+        return any(
+            self._folded_text in author.casefold() for author in pep.author_names
+        )
+
+    def lookup(self, facets: Facets) -> int:
+        return facets.matching("author", self._folded_text)
+
+    def __str__(self) -> str:
+        return self._text
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, AuthorContaining):
+            return str(value).casefold() == self._folded_text
+        return super().__eq__(value)
+
+    def __hash__(self) -> int:
+        return hash((AuthorContaining, self._folded_text))
+
+
 ##############################################################################
 class Containing(Filter):
     """Filter on text found within a PEP's data."""
 
+    COST = 4
+
     def __init__(self, text: str) -> None:
         """Initialise the object.
 
@@ -251,9 +394,23 @@ class Containing(Filter):
         """
         self._text = text
         """The text to look for."""
+        self._folded_text = text.casefold()
+        """The folded version of the text for case-insensitive lookup."""
 
     def __rand__(self, pep: PEP) -> bool:
-        return self._text in pep
+        return self._folded_text in pep.search_document
+
+    def narrows(self, other: Filter) -> bool:
+        # Any PEP containing this text contains any part of it too; except
+        # that text that's all digits can also match the number of a related
+        # PEP, and only ever exactly, so a PEP found by that needn't contain
+        # any longer text.
+        if isinstance(other, Containing):
+            return (
+                not other._folded_text.isdigit()
+                and other._folded_text in self._folded_text
+            )
+        return super().narrows(other)
 
     def __str__(self) -> str:
         return self._text
@@ -263,15 +420,362 @@ class Containing(Filter):
             return str(value).casefold() == self._text.casefold()
         return super().__eq__(value)
 
+    def __hash__(self) -> int:
+        return hash((Containing, self._folded_text))
+
+
+##############################################################################
+class Resembling(Filter):
+    """Filter on text that resembles a PEP's title, authors, topic or notes.
+
+    Unlike [`Containing`][peplum.app.data.Containing], the text doesn't need
+    to be found exactly; it's enough for most of the trigrams of the text to
+    be found, so slight misspellings still match.
+    """
+
+    COST = 3
+
+    def __init__(self, text: str) -> None:
+        """Initialise the object.
+
+        Args:
+            text: The text to filter on.
+        """
+        self._text = text
+        """The text to look for."""
+
+    def __rand__(self, pep: PEP) -> bool:
+        return resembles(self._text, indexed_text(pep))
+
+    def lookup(self, facets: Facets) -> int:
+        return facets.resembling(self._text, facets.everything)
+
+    def select(self, facets: Facets, candidates: int, peps: Mapping[int, PEP]) -> int:
+        return facets.resembling(self._text, candidates)
+
+    def __str__(self) -> str:
+        return self._text
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, Resembling):
+            return str(value).casefold() == self._text.casefold()
+        return super().__eq__(value)
+
+    def __hash__(self) -> int:
+        return hash((Resembling, self._text.casefold()))
+
+
+##############################################################################
+class InSource(Filter):
+    """Filter on the result of a full-text search of the sources of PEPs.
+
+    The search itself is done against the index of the PEP sources; this
+    filter holds the PEPs that were found, in order of how well they
+    matched, along with a snippet of the matching text of each.
+    """
+
+    def __init__(self, text: str, found: Mapping[int, str]) -> None:
+        """Initialise the object.
+
+        Args:
+            text: The text that was searched for.
+            found: The snippet of each PEP that was found, best match first.
+        """
+        self._text = text
+        """The text that was searched for."""
+        self._found = dict(found)
+        """The snippet of each PEP that was found, best match first."""
+
+    def __rand__(self, pep: PEP) -> bool:
+        return pep.number in self._found
+
+    def lookup(self, facets: Facets) -> int:
+        return facets.bitmap(
+            pep for pep in self._found if facets.member(pep, facets.everything)
+        )
+
+    @property
+    def ranked(self) -> tuple[int, ...]:
+        """The numbers of the PEPs that were found, best match first."""
+        return tuple(self._found)
+
+    def snippet(self, pep: int) -> str | None:
+        """Get the snippet of the matching text of a PEP.
+
+        Args:
+            pep: The number of the PEP.
+
+        Returns:
+            The snippet, or `None` if the PEP wasn't found.
+        """
+        return self._found.get(pep)
+
+    def __str__(self) -> str:
+        return self._text
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, InSource):
+            return value._text == self._text and value._found == self._found
+        return False
+
+    def __hash__(self) -> int:
+        return hash((InSource, self._text, frozenset(self._found)))
+
+
+##############################################################################
+class AllOf(Filter):
+    """Filter on a PEP matching all of a collection of filters."""
+
+    def __init__(self, filters: Iterable[Filter]) -> None:
+        """Initialise the object.
+
+        Args:
+            filters: The filters that must all match.
+        """
+        self._filters = tuple(filters)
+        """The filters that must all match."""
+        self.COST = sum(check.COST for check in self._filters)
+        """The relative cost of testing a PEP against all of the filters."""
+
+    def __rand__(self, pep: PEP) -> bool:
+        return all(pep & check for check in self._filters)
+
+    def lookup(self, facets: Facets) -> int | None:
+        found = facets.everything
+        for check in self._filters:
+            if (matches := check.lookup(facets)) is None:
+                return None
+            found &= matches
+        return found
+
+    def select(self, facets: Facets, candidates: int, peps: Mapping[int, PEP]) -> int:
+        tests: list[Filter] = []
+        for check in self._filters:
+            if (found := check.lookup(facets)) is None:
+                tests.append(check)
+            else:
+                candidates &= found
+        for check in sorted(tests, key=attrgetter("COST")):
+            if not candidates:
+                break
+            candidates = check.select(facets, candidates, peps)
+        return candidates
+
+    def __str__(self) -> str:
+        return " ".join(str(check) for check in self._filters)
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, AllOf):
+            return value._filters == self._filters
+        return False
+
+    def __hash__(self) -> int:
+        return hash((AllOf, self._filters))
+
+
+##############################################################################
+class AnyOf(Filter):
+    """Filter on a PEP matching any of a collection of filters."""
+
+    def __init__(self, filters: Iterable[Filter]) -> None:
+        """Initialise the object.
+
+        Args:
+            filters: The filters, any of which must match.
+        """
+        self._filters = tuple(filters)
+        """The filters, any of which must match."""
+        self.COST = sum(check.COST for check in self._filters)
+        """The relative cost of testing a PEP against all of the filters."""
+
+    def __rand__(self, pep: PEP) -> bool:
+        return any(pep & check for check in self._filters)
+
+    def lookup(self, facets: Facets) -> int | None:
+        found = 0
+        for check in self._filters:
+            if (matches := check.lookup(facets)) is None:
+                return None
+            found |= matches
+        return found
+
+    def select(self, facets: Facets, candidates: int, peps: Mapping[int, PEP]) -> int:
+        # Filters that can be looked up go first, so that only the
+        # candidates none of them match need testing against the rest.
+        found = 0
+        for looked_up, check in sorted(
+            ((check.lookup(facets), check) for check in self._filters),
+            key=lambda pair: (pair[0] is None, pair[1].COST),
+        ):
+            if not candidates:
+                break
+            matches = (
+                check.select(facets, candidates, peps)
+                if looked_up is None
+                else candidates & looked_up
+            )
+            found |= matches
+            candidates &= ~matches
+        return found
+
+    def __str__(self) -> str:
+        terms = (
+            f"({check})" if isinstance(check, AllOf) else str(check)
+            for check in self._filters
+        )
+        return f"({' OR '.join(terms)})"
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, AnyOf):
+            return value._filters == self._filters
+        return False
+
+    def __hash__(self) -> int:
+        return hash((AnyOf, self._filters))
+
+
+##############################################################################
+class Excluding(Filter):
+    """Filter on a PEP not matching a filter."""
+
+    def __init__(self, excluded: Filter) -> None:
+        """Initialise the object.
+
+        Args:
+            excluded: The filter that must not match.
+        """
+        self._excluded = excluded
+        """The filter that must not match."""
+        self.COST = excluded.COST
+        """The relative cost of testing a PEP against the filter."""
+
+    def __rand__(self, pep: PEP) -> bool:
+        return not (pep & self._excluded)
+
+    def lookup(self, facets: Facets) -> int | None:
+        if (found := self._excluded.lookup(facets)) is None:
+            return None
+        return facets.everything & ~found
+
+    def select(self, facets: Facets, candidates: int, peps: Mapping[int, PEP]) -> int:
+        return candidates & ~self._excluded.select(facets, candidates, peps)
+
+    def __str__(self) -> str:
+        return f"-{self._excluded}"
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, Excluding):
+            return value._excluded == self._excluded
+        return False
+
+    def __hash__(self) -> int:
+        return hash((Excluding, self._excluded))
+
+
+##############################################################################
+class Matching(Filter):
+    """Filter on a PEP matching a query."""
+
+    def __init__(self, query: str, compiled: Filter) -> None:
+        """Initialise the object.
+
+        Args:
+            query: The text of the query.
+            compiled: The filter the query was compiled to.
+
+        Notes:
+            Rather than make one of these directly, use
+            [`parse_query`][peplum.app.data.parse_query].
+        """
+        self._query = query
+        """The text of the query."""
+        self._compiled = compiled
+        """The filter the query was compiled to."""
+        self.COST = compiled.COST
+        """The relative cost of testing a PEP against the query."""
+
+    def __rand__(self, pep: PEP) -> bool:
+        return pep & self._compiled
+
+    def lookup(self, facets: Facets) -> int | None:
+        return self._compiled.lookup(facets)
+
+    def select(self, facets: Facets, candidates: int, peps: Mapping[int, PEP]) -> int:
+        return self._compiled.select(facets, candidates, peps)
+
+    def __str__(self) -> str:
+        return self._query
+
+    def __eq__(self, value: object) -> bool:
+        if isinstance(value, Matching):
+            return value._compiled == self._compiled
+        return False
+
+    def __hash__(self) -> int:
+        return hash((Matching, self._compiled))
+
+
+##############################################################################
+@dataclass(frozen=True)
+class PlanStep:
+    """A step in filtering a collection of PEPs, and how it went."""
+
+    pep_filter: Filter
+    """The filter applied in this step."""
+    indexed: bool
+    """Was the filter looked up in the facet indexes?
+
+    If not, each of the candidate PEPs was tested against it.
+    """
+    candidates: int
+    """The count of PEPs still selected after this step."""
+    elapsed: float
+    """The time taken by this step, in seconds."""
+    skipped: bool = False
+    """Was the step skipped because no PEPs were still selected?"""
+
+
+##############################################################################
+RESULTS_CACHE_SIZE: Final[int] = 32
+"""The most filter results to remember for a store of PEPs."""
+
+##############################################################################
+Plan: TypeAlias = tuple[PlanStep, ...]
+"""The type of the record of the steps taken to filter PEPs."""
+
+##############################################################################
+OrderKey: TypeAlias = tuple[SortOrder, str]
+"""The type of the key for a set of PEPs put in order.
+
+This is the sort order, and for sorting by relevance the text the PEPs are
+ranked against.
+"""
+
+##############################################################################
+Selection: TypeAlias = tuple[int, Plan, dict[OrderKey, tuple[PEP, ...]]]
+"""The type of the result of filtering PEPs.
+
+This is the bitmap of the PEPs that were selected, the steps taken to
+select them, and the PEPs in each sort order they've been put in so far.
+"""
 
 ##############################################################################
-SortOrder: TypeAlias = Literal["number", "created", "title"]
-"""Sort orders for PEPs."""
+_generations = count()
+"""The source of generation numbers for stores of PEPs."""
 
 
 ##############################################################################
 class PEPs:
-    """Class that holds a collection of PEPs."""
+    """Class that holds a collection of PEPs.
+
+    A collection made by filtering or sorting another collection is a view
+    of the same store of PEPs, and shares its facet indexes; all it holds of
+    its own is the bitmap of the PEPs within it, and how they're sorted.
+
+    The results of filtering are remembered for each generation of the
+    store, so going back to a filter that has been used recently doesn't
+    need the filtering doing again.
+    """
 
     def __init__(
         self,
@@ -279,6 +783,7 @@ class PEPs:
         filters: Filters | None = None,
         sort_order: SortOrder = "number",
         sort_reversed: bool = False,
+        facets: Facets | None = None,
     ) -> None:
         """Initialise the object.
 
@@ -287,17 +792,71 @@ class PEPs:
             filters: The filters that got to this set of PEPs.
             sort_order: The sort order for the PEPs.
             sort_reversed: Should the sort order be reversed?
+            facets: The facet indexes for the PEPs.
+
+        Notes:
+            The facet indexes, if given, must be of exactly the given PEPs.
+            If not given they will be built from the PEPs when first needed.
         """
-        self._peps: dict[int, PEP] = (
+        self._store: dict[int, PEP] = (
             {} if peps is None else {pep.number: pep for pep in peps}
         )
-        """The PEPs."""
+        """The store of PEPs that this collection is a view of."""
         self._filters = () if filters is None else filters
         """The filters that got to this set of PEPs."""
         self._sort_order: SortOrder = sort_order
         """The sort order for the PEPs."""
         self._sort_reversed = sort_reversed
         """Should we reverse the sort order?"""
+        self._facets = facets
+        """The facet indexes for the store of PEPs."""
+        self._members_: int | None = None
+        """The bitmap of the PEPs in this collection, or `None` if it's all of the store."""
+        self._ordered: dict[OrderKey, tuple[PEP, ...]] = {}
+        """The PEPs in each sort order they've been put in so far."""
+        self._plan: Plan = ()
+        """The steps taken to filter the PEPs into this collection."""
+        self._generation = next(_generations)
+        """The generation of the store of PEPs."""
+        self._results: LRUCache[Hashable, Selection] = LRUCache(RESULTS_CACHE_SIZE)
+        """The recent results of filtering the store of PEPs."""
+
+    def _view(
+        self,
+        members: int | None,
+        filters: Filters,
+        sort_order: SortOrder,
+        sort_reversed: bool,
+    ) -> PEPs:
+        """Make a view of the store of PEPs of this collection.
+
+        Args:
+            members: The bitmap of the PEPs in the view, or `None` for all of the store.
+            filters: The filters that got to the view.
+            sort_order: The sort order for the view.
+            sort_reversed: Should the sort order of the view be reversed?
+
+        Returns:
+            The view of the PEPs.
+        """
+        view = PEPs(None, filters, sort_order, sort_reversed, self.facets)
+        view._store = self._store
+        view._members_ = members
+        view._generation = self._generation
+        view._results = self._results
+        return view
+
+    @property
+    def facets(self) -> Facets:
+        """The facet indexes for the PEPs."""
+        if self._facets is None:
+            self._facets = Facets(self._store.values())
+        return self._facets
+
+    @property
+    def _members(self) -> int:
+        """The bitmap of the PEPs in this collection."""
+        return self.facets.everything if self._members_ is None else self._members_
 
     def patch_pep(self, pep: PEP) -> Self:
         """Patch a PEP with a new instance.
@@ -307,10 +866,52 @@ class PEPs:
 
         Returns:
             Self.
+
+        Notes:
+            The store of PEPs may be shared with other collections, so the
+            patch is made to a copy of it. If the patch would change how
+            the PEP is indexed or sorted, or adds a PEP, this collection
+            stops sharing the facet indexes and has its own built for the
+            patched store; otherwise it has a copy of the indexes with the
+            text of the PEP reindexed. Either way, the patched store is a new
+            generation.
         """
-        self._peps[pep.number] = pep
+        if (old := self._store.get(pep.number)) is None or Facets.affected_by(old, pep):
+            members = (
+                None
+                if self._members_ is None
+                else (*self.facets.numbers(self._members_), pep.number)
+            )
+            self._store = {**self._store, pep.number: pep}
+            self._facets = None
+            self._members_ = None if members is None else self.facets.bitmap(members)
+        else:
+            self._store = {**self._store, pep.number: pep}
+            if self._facets is not None:
+                self._facets = self._facets.patched(pep)
+            if self._members_ is not None:
+                self._members_ |= self.facets.bitmap((pep.number,))
+        self._ordered = {}
+        self._generation = next(_generations)
         return self
 
+    @property
+    def filters(self) -> Filters:
+        """The filters that got to this set of PEPs."""
+        return self._filters
+
+    @property
+    def plan(self) -> Plan:
+        """The steps taken to filter the PEPs into this collection.
+
+        Notes:
+            This is for diagnostic purposes. If the PEPs were the
+            remembered result of filtering, the steps are those taken when
+            the filtering was first done. Collections that weren't made by
+            filtering have no steps.
+        """
+        return self._plan
+
     @property
     def is_filtered(self) -> bool:
         """Does this collection of PEPs have a filter?"""
@@ -320,16 +921,16 @@ class PEPs:
     def statuses(self) -> tuple[StatusCount, ...]:
         """The status and their counts as found in the PEPs."""
         return tuple(
-            StatusCount(status, count)
-            for status, count in Counter[PEPStatus](pep.status for pep in self).items()
+            StatusCount(cast(PEPStatus, status), count)
+            for status, count in self.facets.counts("status", self._members)
         )
 
     @property
     def types(self) -> tuple[TypeCount, ...]:
         """The types and their counts as found in the PEPs."""
         return tuple(
-            TypeCount(pep_type, count)
-            for pep_type, count in Counter[PEPType](pep.type for pep in self).items()
+            TypeCount(cast(PEPType, pep_type), count)
+            for pep_type, count in self.facets.counts("type", self._members)
         )
 
     @property
@@ -342,9 +943,7 @@ class PEPs:
         """
         return tuple(
             PythonVersionCount(version, count)
-            for version, count in Counter(
-                chain(*(pep.python_version or ("",) for pep in self))
-            ).items()
+            for version, count in self.facets.counts("python_version", self._members)
         )
 
     @property
@@ -352,9 +951,7 @@ class PEPs:
         """The authors and their counts as found in the PEPs."""
         return tuple(
             AuthorCount(author, count)
-            for author, count in Counter(
-                chain(*(pep.author_names for pep in self))
-            ).items()
+            for author, count in self.facets.counts("author_name", self._members)
         )
 
     def _describe(self, name: str, filter_type: type[Filter]) -> str | None:
@@ -388,10 +985,14 @@ class PEPs:
                 self._describe(name, filter_type)
                 for name, filter_type in (
                     ("Containing", Containing),
+                    ("Like", Resembling),
+                    ("Source containing", InSource),
+                    ("Matching", Matching),
                     ("Type", WithType),
                     ("Status", WithStatus),
                     ("Version", WithPythonVersion),
                     ("Author", WithAuthor),
+                    ("Author containing", AuthorContaining),
                 )
             ]
             if candidate
@@ -404,12 +1005,113 @@ class PEPs:
                 sort_order = "Date Created"
             case "title":
                 sort_order = "PEP Title"
+            case "relevance":
+                sort_order = "Relevance"
 
         if self._sort_reversed:
             sort_order += " (reversed)"
 
         return "; ".join(filters + ([f"Sorted by {sort_order}"] if sort_order else []))
 
+    @staticmethod
+    def _by_cost(filters: Iterable[Filter]) -> list[Filter]:
+        """Put some filters in the order they should be tested against a PEP.
+
+        Args:
+            filters: The filters.
+
+        Returns:
+            The filters, cheapest to test first.
+        """
+        return sorted(filters, key=attrgetter("COST"))
+
+    def _select(self, filters: Filters) -> tuple[int, Plan]:
+        """Select the PEPs in this collection that match some filters.
+
+        Args:
+            filters: The filters to apply.
+
+        Returns:
+            The bitmap of the PEPs that match all of the filters, and the
+            steps taken to select them.
+
+        Notes:
+            Filters that can be looked up in the facet indexes are applied
+            first, those that match the fewest PEPs before the others, by
+            intersecting their bitmaps with the bitmap of this collection.
+            Any other filters are then tested, cheapest first, against only
+            the PEPs still selected. As soon as no PEPs are selected the
+            remaining steps are skipped.
+        """
+        members = self._members
+        plan: list[PlanStep] = []
+        lookups: list[tuple[Filter, int, float]] = []
+        tests: list[Filter] = []
+        for check in filters:
+            started = perf_counter()
+            if (found := check.lookup(self.facets)) is None:
+                tests.append(check)
+            else:
+                lookups.append((check, found, perf_counter() - started))
+        for check, found, elapsed in sorted(
+            lookups, key=lambda step: step[1].bit_count()
+        ):
+            if not members:
+                plan.append(PlanStep(check, True, 0, 0.0, skipped=True))
+                continue
+            started = perf_counter()
+            members &= found
+            plan.append(
+                PlanStep(
+                    check,
+                    True,
+                    members.bit_count(),
+                    elapsed + perf_counter() - started,
+                )
+            )
+        for check in self._by_cost(tests):
+            if not members:
+                plan.append(PlanStep(check, False, 0, 0.0, skipped=True))
+                continue
+            started = perf_counter()
+            members = check.select(self.facets, members, self._store)
+            plan.append(
+                PlanStep(check, False, members.bit_count(), perf_counter() - started)
+            )
+        return members, tuple(plan)
+
+    def _filtered(
+        self,
+        apply: Filters,
+        filters: Filters,
+        sort_order: SortOrder,
+        sort_reversed: bool,
+    ) -> PEPs:
+        """Get a view of the PEPs in this collection that match some filters.
+
+        Args:
+            apply: The filters to apply.
+            filters: The filters that got to the view.
+            sort_order: The sort order for the view.
+            sort_reversed: Should the sort order of the view be reversed?
+
+        Returns:
+            The view of the PEPs that match all of the filters.
+
+        Notes:
+            The result is looked for amongst the recent results for this
+            generation of the store first, keyed on the PEPs in this
+            collection and the filters regardless of their order.
+        """
+        members, plan, ordered = self._results.get(
+            (self._generation, self._members, frozenset(apply)),
+            lambda: (*self._select(apply), {}),
+        )
+        view = self._view(members, filters, sort_order, sort_reversed)
+        view._plan = plan
+        view._ordered = ordered
+        return view
+
     def __and__(self, new_filter: Filter) -> PEPs:
         """Get the PEPs match a given filter.
 
@@ -424,14 +1126,63 @@ class PEPs:
         return (
             self
             if new_filter in self._filters
-            else PEPs(
-                (pep for pep in self if pep & new_filter),
+            else self._filtered(
+                (new_filter,),
                 self._filters + new_filter,
                 self._sort_order,
                 self._sort_reversed,
             )
         )
 
+    def narrowed(self, old_filter: Filter, new_filter: Filter) -> PEPs:
+        """Swap one of the filters of this collection for a narrower filter.
+
+        Args:
+            old_filter: The filter to swap out.
+            new_filter: The filter to swap in.
+
+        Returns:
+            The PEPs there would be had the new filter been applied in place
+            of the old filter.
+
+        Raises:
+            ValueError: If the old filter isn't one of the filters of this
+                collection, or the new filter doesn't narrow it.
+
+        Notes:
+            As every PEP that matches the new filter matches the old filter,
+            only the PEPs in this collection need to be checked against it.
+        """
+        if old_filter not in self._filters or not new_filter.narrows(old_filter):
+            raise ValueError(f"{new_filter} doesn't narrow {old_filter}")
+        return self._filtered(
+            (new_filter,),
+            tuple(
+                new_filter if candidate == old_filter else candidate
+                for candidate in self._filters
+            ),
+            self._sort_order,
+            self._sort_reversed,
+        )
+
+    def _reordered(self, sort_order: SortOrder, sort_reversed: bool) -> PEPs:
+        """Get these PEPs in a different order.
+
+        Args:
+            sort_order: The sort order.
+            sort_reversed: Should the sort order be reversed?
+
+        Returns:
+            The PEPs in the required order.
+
+        Notes:
+            The new collection shares any orders the PEPs have already been
+            put in with this collection.
+        """
+        peps = self._view(self._members_, self._filters, sort_order, sort_reversed)
+        peps._ordered = self._ordered
+        return peps
+
     def sorted_by(self, sort_order: SortOrder) -> PEPs:
         """Get the PEPs sorted in a particular way.
 
@@ -441,7 +1192,7 @@ class PEPs:
         Returns:
             The PEPs sorted in the required way.
         """
-        return PEPs(self, self._filters, sort_order, self._sort_reversed)
+        return self._reordered(sort_order, self._sort_reversed)
 
     def reversed(self, setting: bool | None = None) -> PEPs:
         """Get the PEPs with the current sort order reversed.
@@ -457,11 +1208,8 @@ class PEPs:
             it is now, otherwise `True` will be forward sort order, `False`
             will be reversed.
         """
-        return PEPs(
-            self,
-            self._filters,
-            self._sort_order,
-            not self._sort_reversed if setting is None else setting,
+        return self._reordered(
+            self._sort_order, not self._sort_reversed if setting is None else setting
         )
 
     def rebuild_from(self, peps: PEPs) -> PEPs:
@@ -476,30 +1224,140 @@ class PEPs:
         Returns:
             The new collection of PEPs.
         """
-        return PEPs(
-            (pep for pep in peps if all(pep & check for check in self._filters)),
+        return peps._filtered(
+            self._filters, self._filters, self._sort_order, self._sort_reversed
+        )
+
+    def refresh_from(self, peps: PEPs, affected: Iterable[int]) -> PEPs:
+        """Refresh a collection of PEPs from a refreshed collection.
+
+        Given a refreshed collection of PEPs, and the numbers of the PEPs
+        that were affected by the refresh, produce the collection this
+        would be had it been built from the refreshed collection.
+
+        Args:
+            peps: The refreshed PEPs.
+            affected: The numbers of the PEPs that were added, removed or changed.
+
+        Returns:
+            The new collection of PEPs.
+
+        Notes:
+            Unlike [`rebuild_from`][peplum.app.data.PEPs.rebuild_from], only
+            the affected PEPs are checked against the filters; every other
+            PEP keeps its place in this collection as it is.
+        """
+        affected = set(affected)
+        tests = self._by_cost(self._filters)
+        fresh = [
+            number
+            for number in affected
+            if (pep := peps._store.get(number)) is not None
+            and all(pep & check for check in tests)
+        ]
+        if peps.facets.same_ordinals(self.facets):
+            # Both collections are indexed the same, so the PEPs this
+            # collection has kept can be carried over as they are.
+            members = (
+                self._members & ~self.facets.bitmap(affected & peps._store.keys())
+            ) | self.facets.bitmap(fresh)
+        else:
+            members = peps.facets.bitmap(
+                chain(
+                    (
+                        number
+                        for number in self.facets.numbers(self._members)
+                        if number not in affected and number in peps._store
+                    ),
+                    fresh,
+                )
+            )
+        return peps._view(
+            members & peps._members,
             self._filters,
             self._sort_order,
             self._sort_reversed,
         )
 
+    def _by_relevance(self, searched_for: str) -> list[int]:
+        """Put the PEPs in order of relevance.
+
+        Args:
+            searched_for: The text of the text filters.
+
+        Returns:
+            The numbers of the PEPs, most relevant first.
+        """
+        for candidate in self._filters:
+            if isinstance(candidate, InSource):
+                return [pep for pep in candidate.ranked if pep in self]
+        return self.facets.ranked(searched_for, self._members)
+
+    def snippet(self, pep: int) -> str | None:
+        """Get the snippet of a PEP's source that was found by a search.
+
+        Args:
+            pep: The number of the PEP.
+
+        Returns:
+            The snippet, or `None` if the PEP's source wasn't searched.
+        """
+        for candidate in self._filters:
+            if isinstance(candidate, InSource):
+                return candidate.snippet(pep)
+        return None
+
+    @property
+    def _searched_for(self) -> str:
+        """The text of the text filters that got to this set of PEPs."""
+        return " ".join(
+            str(candidate)
+            for candidate in self._filters
+            if isinstance(candidate, (Containing, InSource, Resembling))
+        )
+
     def __contains__(self, pep: PEP | int) -> bool:
         """Is the given PEP in here?"""
-        return (pep.number if isinstance(pep, PEP) else pep) in self._peps
+        number = pep.number if isinstance(pep, PEP) else pep
+        if self._members_ is None:
+            return number in self._store
+        return self.facets.member(number, self._members_)
 
     def __iter__(self) -> Iterator[PEP]:
-        """The object as an iterator."""
-        return iter(
-            sorted(
-                self._peps.values(),
-                key=attrgetter(self._sort_order),
-                reverse=self._sort_reversed,
+        """The object as an iterator.
+
+        Notes:
+            The PEPs are put in order using the sort orders held in the
+            facet indexes, the first time they're wanted in a given order;
+            after that the ordered PEPs are reused until the collection is
+            patched. A reversed sort order is the same PEPs, iterated
+            backwards.
+
+            Sorting by relevance puts the PEPs in the order a search of
+            their sources found them, if they were searched; otherwise it
+            ranks the PEPs against the text of any text filters. Without
+            any, it's the same as sorting by number.
+        """
+        if self._sort_order == "relevance":
+            key: OrderKey = (self._sort_order, self._searched_for)
+        else:
+            key = (self._sort_order, "")
+        if (ordered := self._ordered.get(key)) is None:
+            ordered = self._ordered[key] = tuple(
+                map(
+                    self._store.__getitem__,
+                    self._by_relevance(key[1])
+                    if key[0] == "relevance"
+                    else self.facets.ordered(key[0], self._members),
+                )
             )
-        )
+        return reversed(ordered) if self._sort_reversed else iter(ordered)
 
     def __len__(self) -> int:
         """The count of PEPs in the object."""
-        return len(self._peps)
+        if self._members_ is None:
+            return len(self._store)
+        return self._members_.bit_count()
 
 
 ### peps.py ends here
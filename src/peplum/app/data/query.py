@@ -0,0 +1,282 @@
+"""Provides a parser for queries that filter PEPs.
+
+A query is made up of terms, all of which must match. A term is one of:
+
+- `status:<status>` -- PEPs with the given status.
+- `type:<type>` -- PEPs of the given type.
+- `python:<version>` (or `version:<version>`) -- PEPs relating to the
+  given Python version; `python:none` is PEPs with no Python version.
+- `author:<text>` -- PEPs with an author whose name contains the text.
+- Any other word, or a phrase in double quotes -- PEPs containing that text.
+
+Values that contain spaces can be given in double quotes. Terms can be
+joined with `OR`, and joined explicitly with `AND`; they can be excluded by
+putting `-` or `NOT` in front of them; and they can be grouped with
+parentheses. For example:
+
+    status:Final type:"Standards Track" -author:guido (python:3.12 OR python:3.13)
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from re import IGNORECASE, VERBOSE, Pattern, compile
+from typing import Final, Literal, TypeAlias, cast, get_args
+
+##############################################################################
+# Local imports.
+from .pep import PEPStatus, PEPType
+from .peps import (
+    AllOf,
+    AnyOf,
+    AuthorContaining,
+    Containing,
+    Excluding,
+    Filter,
+    Matching,
+    WithPythonVersion,
+    WithStatus,
+    WithType,
+)
+
+##############################################################################
+TOKEN: Final[Pattern[str]] = compile(
+    r"""\s*(?:
+        (?P<open>\()
+        | (?P<close>\))
+        | (?P<negate>-)(?=[^\s)])
+        | (?P<field>status|type|python|version|author):(?P<value>"[^"]*"|[^\s()"]+)
+        | "(?P<phrase>[^"]*)"
+        | (?P<word>[^\s()"]+)
+    )""",
+    IGNORECASE | VERBOSE,
+)
+"""Regular expression for pulling the next token from a query."""
+
+##############################################################################
+TokenKind: TypeAlias = Literal["open", "close", "negate", "and", "or", "term"]
+"""The kinds of token found in a query."""
+
+Token: TypeAlias = tuple[TokenKind, Filter | None]
+"""A token from a query, and the filter for it if it's a term."""
+
+OPERATORS: Final[dict[TokenKind, str]] = {
+    "open": "(",
+    "close": ")",
+    "negate": "-",
+    "and": "AND",
+    "or": "OR",
+}
+"""How each of the kinds of operator token appears in a query."""
+
+
+##############################################################################
+class QueryError(Exception):
+    """Exception raised if there is a problem with a query."""
+
+
+##############################################################################
+def _choice(name: str, value: str, choices: tuple[str, ...]) -> str:
+    """Find the choice a value refers to, regardless of case.
+
+    Args:
+        name: The name of what is being chosen.
+        value: The value given for the choice.
+        choices: The choices available.
+
+    Returns:
+        The choice.
+
+    Raises:
+        QueryError: If the value isn't one of the choices.
+    """
+    for choice in choices:
+        if choice.casefold() == value.casefold():
+            return choice
+    raise QueryError(
+        f"Unknown {name} '{value}'; it should be one of: {', '.join(choices)}"
+    )
+
+
+##############################################################################
+def _field(field: str, value: str) -> Filter:
+    """Make the filter for a field term in a query.
+
+    Args:
+        field: The name of the field.
+        value: The value to look for in the field.
+
+    Returns:
+        The filter for the term.
+
+    Raises:
+        QueryError: If the value isn't valid for the field.
+    """
+    value = value[1:-1] if value.startswith('"') else value
+    match field.casefold():
+        case "status":
+            return WithStatus(
+                cast(PEPStatus, _choice("status", value, get_args(PEPStatus)))
+            )
+        case "type":
+            return WithType(cast(PEPType, _choice("type", value, get_args(PEPType))))
+        case "python" | "version":
+            return WithPythonVersion("" if value.casefold() == "none" else value)
+    if not value.strip():
+        raise QueryError("Empty author in query")
+    return AuthorContaining(value)
+
+
+##############################################################################
+def _tokens(query: str) -> list[Token]:
+    """Split a query into tokens.
+
+    Args:
+        query: The query.
+
+    Returns:
+        The tokens.
+
+    Raises:
+        QueryError: If the query can't be split into tokens.
+    """
+    tokens: list[Token] = []
+    position = 0
+    while query[position:].strip():
+        if (found := TOKEN.match(query, position)) is None:
+            raise QueryError(f"Unterminated quote in '{query[position:].strip()}'")
+        position = found.end()
+        if found["open"]:
+            tokens.append(("open", None))
+        elif found["close"]:
+            tokens.append(("close", None))
+        elif found["negate"]:
+            tokens.append(("negate", None))
+        elif found["field"]:
+            tokens.append(("term", _field(found["field"], found["value"])))
+        elif found["phrase"] is not None:
+            if not found["phrase"].strip():
+                raise QueryError("Empty phrase in query")
+            tokens.append(("term", Containing(found["phrase"])))
+        elif found["word"] == "OR":
+            tokens.append(("or", None))
+        elif found["word"] == "AND":
+            tokens.append(("and", None))
+        elif found["word"] == "NOT":
+            tokens.append(("negate", None))
+        else:
+            tokens.append(("term", Containing(found["word"])))
+    return tokens
+
+
+##############################################################################
+class _Parser:
+    """A recursive-descent parser for the tokens of a query."""
+
+    def __init__(self, tokens: list[Token]) -> None:
+        """Initialise the object.
+
+        Args:
+            tokens: The tokens to parse.
+        """
+        self._tokens = tokens
+        """The tokens to parse."""
+        self._position = 0
+        """The position of the next token to parse."""
+
+    @property
+    def _next(self) -> TokenKind | None:
+        """The kind of the next token, or `None` at the end of the tokens."""
+        return (
+            self._tokens[self._position][0]
+            if self._position < len(self._tokens)
+            else None
+        )
+
+    def parse(self) -> Filter:
+        """Parse the tokens.
+
+        Returns:
+            The filter the tokens compile to.
+
+        Raises:
+            QueryError: If the tokens don't make a valid query.
+        """
+        compiled = self._any_of()
+        if self._next is not None:
+            raise QueryError("Unexpected ')' in query")
+        return compiled
+
+    def _any_of(self) -> Filter:
+        """Parse terms joined with `OR`.
+
+        Returns:
+            The filter for the terms.
+        """
+        filters = [self._all_of()]
+        while self._next == "or":
+            self._position += 1
+            filters.append(self._all_of())
+        return filters[0] if len(filters) == 1 else AnyOf(filters)
+
+    def _all_of(self) -> Filter:
+        """Parse terms that must all match.
+
+        Returns:
+            The filter for the terms.
+        """
+        filters = [self._unary()]
+        while self._next not in (None, "or", "close"):
+            if self._next == "and":
+                self._position += 1
+            filters.append(self._unary())
+        return filters[0] if len(filters) == 1 else AllOf(filters)
+
+    def _unary(self) -> Filter:
+        """Parse a single, possibly excluded, term or group of terms.
+
+        Returns:
+            The filter for the term.
+
+        Raises:
+            QueryError: If a term was expected and not found.
+        """
+        kind = self._next
+        if kind is None:
+            raise QueryError("Query is incomplete")
+        self._position += 1
+        if kind == "negate":
+            return Excluding(self._unary())
+        if kind == "open":
+            grouped = self._any_of()
+            if self._next != "close":
+                raise QueryError("Missing ')' in query")
+            self._position += 1
+            return grouped
+        if kind == "term" and (term := self._tokens[self._position - 1][1]):
+            return term
+        raise QueryError(f"Unexpected '{OPERATORS[kind]}' in query")
+
+
+##############################################################################
+def parse_query(query: str) -> Matching:
+    """Parse a query into a filter for PEPs.
+
+    Args:
+        query: The query to parse.
+
+    Returns:
+        The filter for the PEPs that match the query.
+
+    Raises:
+        QueryError: If the query isn't valid.
+    """
+    if not (tokens := _tokens(query)):
+        raise QueryError("The query is empty")
+    return Matching(query.strip(), _Parser(tokens).parse())
+
+
+### query.py ends here
@@ -0,0 +1,257 @@
+"""Provides a trigram index for typo-tolerant searching of PEPs."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from functools import lru_cache
+from math import ceil
+from re import Pattern, compile
+from typing import Final, Iterator, Sequence
+
+##############################################################################
+# Local imports.
+from .bitmap import make_bitmap
+from .pep import PEP
+
+##############################################################################
+WORD: Final[Pattern[str]] = compile(r"\w+")
+"""Regular expression for finding the words in some text."""
+
+##############################################################################
+SIMILARITY: Final[float] = 0.7
+"""The fraction of the trigrams of some text that must be found for a match."""
+
+
+##############################################################################
+def indexed_text(pep: PEP) -> str:
+    """Get the text of a PEP that goes in a trigram index.
+
+    Args:
+        pep: The PEP to get the text of.
+
+    Returns:
+        The title, authors, topic and notes of the PEP.
+    """
+    return " ".join((pep.title, pep.authors, pep.topic, pep.notes))
+
+
+##############################################################################
+def trigrams(text: str) -> frozenset[str]:
+    """Get the trigrams of some text.
+
+    Args:
+        text: The text to get the trigrams of.
+
+    Returns:
+        The trigrams.
+
+    Notes:
+        The text is casefolded, and each word is padded with two spaces in
+        front and one behind before being split into trigrams; so words
+        with the same start get credit for it, and short words still have
+        trigrams.
+    """
+    return frozenset(
+        trigram for word in WORD.findall(text.casefold()) for trigram in _word(word)
+    )
+
+
+##############################################################################
+@lru_cache(maxsize=4096)
+def _word(word: str) -> tuple[str, ...]:
+    """Get the trigrams of a word.
+
+    Args:
+        word: The casefolded word.
+
+    Returns:
+        The trigrams of the word.
+    """
+    padded = f"  {word} "
+    return tuple(padded[start : start + 3] for start in range(len(padded) - 2))
+
+
+##############################################################################
+def required(found: frozenset[str]) -> int:
+    """How many of some trigrams must be found for text to match?
+
+    Args:
+        found: The trigrams of the text being looked for.
+
+    Returns:
+        The count of the trigrams that must be found.
+    """
+    return max(1, ceil(len(found) * SIMILARITY))
+
+
+##############################################################################
+def resembles(text: str, document: str) -> bool:
+    """Does a document resemble some text?
+
+    Args:
+        text: The text to look for.
+        document: The document to look in.
+
+    Returns:
+        `True` if enough of the trigrams of the text are in the document.
+    """
+    wanted = trigrams(text)
+    return bool(wanted) and len(wanted & trigrams(document)) >= required(wanted)
+
+
+##############################################################################
+class TrigramIndex:
+    """A trigram index of some documents.
+
+    Each trigram maps to the bitmap of the ordinals of the documents that
+    contain it. Looking for some text counts, for every document at once,
+    how many of the trigrams of the text it contains; the counts are held
+    as bit-sliced bitmaps, so the whole search is a handful of bitmap
+    operations for each trigram of the text, however many documents there
+    are.
+    """
+
+    def __init__(self, documents: Sequence[str]) -> None:
+        """Initialise the object.
+
+        Args:
+            documents: The documents to index, in ordinal order.
+        """
+        self._size = len(documents)
+        """The count of documents in the index."""
+        # Documents share a lot of words, so the documents are first indexed
+        # by word, then each word's documents are added to its trigrams.
+        words: dict[str, list[int]] = {}
+        for ordinal, document in enumerate(documents):
+            for word in set(WORD.findall(document.casefold())):
+                words.setdefault(word, []).append(ordinal)
+        postings: dict[str, list[int]] = {}
+        for word, ordinals in words.items():
+            for trigram in _word(word):
+                postings.setdefault(trigram, []).extend(ordinals)
+        self._index = {
+            trigram: make_bitmap(ordinals, self._size)
+            for trigram, ordinals in postings.items()
+        }
+        """The bitmap of the documents containing each trigram."""
+
+    def patched(self, ordinal: int, old: str, new: str) -> TrigramIndex:
+        """Get a copy of the index with a document changed.
+
+        Args:
+            ordinal: The ordinal of the document.
+            old: The document as it was indexed.
+            new: The document as it is now.
+
+        Returns:
+            The patched index.
+
+        Notes:
+            The index is copied rather than changed, as it may be shared;
+            only the bitmaps of the trigrams that were added to, or removed
+            from, the document are remade.
+        """
+        patched = TrigramIndex(())
+        patched._size = self._size
+        patched._index = dict(self._index)
+        bit = 1 << ordinal
+        before = trigrams(old)
+        after = trigrams(new)
+        for trigram in before - after:
+            if remaining := patched._index[trigram] & ~bit:
+                patched._index[trigram] = remaining
+            else:
+                del patched._index[trigram]
+        for trigram in after - before:
+            patched._index[trigram] = patched._index.get(trigram, 0) | bit
+        return patched
+
+    def _counts(self, text: str, documents: int) -> tuple[list[int], int, int]:
+        """Count the trigrams of some text within some documents.
+
+        Args:
+            text: The text to count the trigrams of.
+            documents: The bitmap of the documents to count within.
+
+        Returns:
+            The bit-sliced counts, least significant slice first; the count
+            of trigrams in the text; and the count needed for a match.
+        """
+        wanted = trigrams(text)
+        slices = [0] * len(wanted).bit_length()
+        for trigram in wanted:
+            if carry := self._index.get(trigram, 0) & documents:
+                for position, counted in enumerate(slices):
+                    slices[position] = counted ^ carry
+                    carry &= counted
+                    if not carry:
+                        break
+        return slices, len(wanted), required(wanted)
+
+    @staticmethod
+    def _with_count(slices: list[int], count: int, documents: int) -> int:
+        """Find the documents with a given count.
+
+        Args:
+            slices: The bit-sliced counts.
+            count: The count to look for.
+            documents: The bitmap of the documents to look within.
+
+        Returns:
+            The bitmap of the documents with exactly that count.
+        """
+        for position, counted in enumerate(slices):
+            documents &= counted if count >> position & 1 else ~counted
+        return documents
+
+    def resembling(self, text: str, documents: int) -> int:
+        """Find the documents that resemble some text.
+
+        Args:
+            text: The text to look for.
+            documents: The bitmap of the documents to look within.
+
+        Returns:
+            The bitmap of the documents that contain enough of the trigrams
+            of the text.
+        """
+        slices, _, needed = self._counts(text, documents)
+        if not slices:
+            return 0
+        # Work down from the most significant slice, keeping track of the
+        # documents whose count is so far equal to what's needed, and those
+        # that are already known to have more.
+        more = 0
+        equal = documents
+        for position in reversed(range(len(slices))):
+            if needed >> position & 1:
+                equal &= slices[position]
+            else:
+                more |= equal & slices[position]
+                equal &= ~slices[position]
+        return more | equal
+
+    def ranked(self, text: str, documents: int) -> Iterator[int]:
+        """Rank some documents by how well they match some text.
+
+        Args:
+            text: The text to rank the documents against.
+            documents: The bitmap of the documents to rank.
+
+        Yields:
+            The bitmaps of the documents that contain the same count of
+            trigrams of the text, most trigrams first.
+        """
+        slices, most, _ = self._counts(text, documents)
+        for count in range(most, -1, -1):
+            if not documents:
+                break
+            if found := self._with_count(slices, count, documents):
+                yield found
+                documents &= ~found
+
+
+### trigrams.py ends here
@@ -15,13 +15,40 @@ from textual_enhanced.app import EnhancedApp
 ##############################################################################
 # Local imports.
 from .. import __version__
+from ..peps import API, RetryPolicy
 from .data import (
+    Configuration,
     load_configuration,
     update_configuration,
 )
 from .screens import Main
 
 
+##############################################################################
+def api_client(configuration: Configuration) -> API:
+    """Create a PEP API client configured for the application.
+
+    Args:
+        configuration: The configuration to create the client from.
+
+    Returns:
+        A configured API client.
+    """
+    return API(
+        timeout=configuration.api_timeout,
+        max_connections=configuration.api_max_connections,
+        max_keepalive_connections=configuration.api_max_keepalive_connections,
+        keepalive_expiry=configuration.api_keepalive_expiry,
+        retry=RetryPolicy(
+            retries=configuration.api_retries,
+            backoff=configuration.api_retry_backoff,
+            max_backoff=configuration.api_retry_max_backoff,
+        ),
+        breaker_threshold=configuration.api_breaker_threshold,
+        breaker_cool_down=configuration.api_breaker_cool_down,
+    )
+
+
 ##############################################################################
 class Peplum(EnhancedApp[None]):
     """The main application class."""
@@ -62,6 +89,8 @@ class Peplum(EnhancedApp[None]):
         """The command line arguments passed to the application."""
         super().__init__()
         configuration = load_configuration()
+        self._api = api_client(configuration)
+        """The API client used for the lifetime of the application."""
         if configuration.theme is not None:
             try:
                 self.theme = arguments.theme or configuration.theme
@@ -72,6 +101,10 @@ class Peplum(EnhancedApp[None]):
         except ScreenStackError:  # https://github.com/Textualize/textual/issues/5742
             pass
 
+    async def on_unmount(self) -> None:
+        """Tidy up when the application is shutting down."""
+        await self._api.close()
+
     def watch_theme(self) -> None:
         """Save the application's theme when it's changed."""
         with update_configuration() as config:
@@ -83,7 +116,7 @@ class Peplum(EnhancedApp[None]):
         Returns:
             The main screen.
         """
-        return Main(self._arguments)
+        return Main(self._arguments, self._api)
 
 
 ### peplum.py ends here
@@ -16,15 +16,22 @@ from ..commands import (
     EditNotes,
     Escape,
     FindPEP,
+    NextFilter,
+    PreviousFilter,
     RedownloadPEPs,
     Search,
+    SearchAsYouType,
     SearchAuthor,
     SearchPythonVersion,
+    SearchQuery,
+    SearchSimilar,
+    SearchSources,
     SearchStatus,
     SearchType,
     ShowAll,
     SortByCreated,
     SortByNumber,
+    SortByRelevance,
     SortByTitle,
     ToggleAuthorsSortOrder,
     TogglePEPDetails,
@@ -33,6 +40,8 @@ from ..commands import (
     ToggleStatusesSortOrder,
     ToggleTypesSortOrder,
     ViewPEP,
+    WarmCache,
+    WarmCacheFromArchive,
 )
 
 
@@ -51,16 +60,23 @@ class MainCommands(CommandsProvider):
         yield Escape()
         yield FindPEP()
         yield Help()
+        yield NextFilter()
+        yield PreviousFilter()
         yield Quit()
         yield RedownloadPEPs()
         yield Search()
+        yield SearchAsYouType()
         yield SearchAuthor()
         yield SearchPythonVersion()
+        yield SearchQuery()
+        yield SearchSimilar()
+        yield SearchSources()
         yield SearchStatus()
         yield SearchType()
         yield ShowAll()
         yield SortByCreated()
         yield SortByNumber()
+        yield SortByRelevance()
         yield SortByTitle()
         yield ToggleAuthorsSortOrder()
         yield TogglePEPDetails()
@@ -69,6 +85,8 @@ class MainCommands(CommandsProvider):
         yield ToggleStatusesSortOrder()
         yield ToggleTypesSortOrder()
         yield ViewPEP()
+        yield WarmCache()
+        yield WarmCacheFromArchive()
 
 
 ### main.py ends here
@@ -1,9 +1,5 @@
 """Commands for locating and jumping to a PEP."""
 
-##############################################################################
-# Python imports.
-from operator import attrgetter
-
 ##############################################################################
 # Textual enhanced imports.
 from textual_enhanced.commands import CommandHit, CommandHits, CommandsProvider
@@ -34,7 +30,7 @@ class PEPsCommands(CommandsProvider):
         """
         if self.peps is None:
             return
-        for pep in sorted(self.peps, key=attrgetter("number")):
+        for pep in self.peps.sorted_by("number").reversed(False):
             yield CommandHit(f"Jump to PEP{pep.number}", pep.title, GotoPEP(pep.number))
 
 
@@ -0,0 +1,146 @@
+"""A dialog for warming the cache of PEP sources."""
+
+##############################################################################
+# Python imports.
+from typing import Iterable
+
+##############################################################################
+# Textual imports.
+from textual import on, work
+from textual.app import ComposeResult
+from textual.containers import Horizontal, Vertical
+from textual.screen import ModalScreen
+from textual.widgets import Button, Label, ProgressBar
+
+##############################################################################
+# Textual enhanced imports.
+from textual_enhanced.tools import add_key
+
+##############################################################################
+# Local imports.
+from ...peps import API, ArchiveError, SourceCache, WarmingProgress, WarmingResult
+
+
+##############################################################################
+class CacheWarmer(ModalScreen[None]):
+    """A modal screen that downloads PEP sources into the local cache."""
+
+    CSS = """
+    CacheWarmer {
+        align: center middle;
+
+        &> Vertical {
+            width: 60%;
+            height: auto;
+            background: $panel;
+            border: solid $border;
+        }
+
+        Label, ProgressBar {
+            width: 1fr;
+            padding: 1 1 0 1;
+        }
+
+        #buttons {
+            height: auto;
+            margin-top: 1;
+            align-horizontal: right;
+            border-top: solid $border;
+        }
+    }
+    """
+
+    BINDINGS = [("escape", "close")]
+
+    def __init__(
+        self, sources: SourceCache, peps: Iterable[int] | None, concurrency: int = 8
+    ) -> None:
+        """Initialise the dialog.
+
+        Args:
+            sources: The cache of PEP sources to warm.
+            peps: The numbers of the PEPs to download the sources of.
+            concurrency: The maximum number of downloads to run at once.
+
+        Notes:
+            If `peps` is `None`, the sources of all PEPs are downloaded
+            using a single archive of the PEPs repository.
+        """
+        super().__init__()
+        self._sources = sources
+        """The cache of PEP sources to warm."""
+        self._peps = None if peps is None else tuple(peps)
+        """The numbers of the PEPs to download the sources of."""
+        self._concurrency = concurrency
+        """The maximum number of downloads to run at once."""
+
+    def compose(self) -> ComposeResult:
+        """Compose the dialog's content."""
+        with Vertical() as dialog:
+            dialog.border_title = "Downloading PEP sources"
+            yield Label(
+                "Downloading the PEP archive..."
+                if self._peps is None
+                else "Checking the local cache..."
+            )
+            yield ProgressBar(show_eta=False)
+            with Horizontal(id="buttons"):
+                yield Button(add_key("Cancel", "Esc", self), id="close")
+
+    def _progress(self, progress: WarmingProgress) -> None:
+        """Show the progress being made warming the cache.
+
+        Args:
+            progress: The details of the progress.
+        """
+        self.query_one(ProgressBar).update(total=progress.total, progress=progress.done)
+        self.query_one(Label).update(
+            f"PEP{progress.pep}: {progress.error}"
+            if progress.error
+            else f"Downloaded PEP{progress.pep}"
+        )
+
+    @work(exclusive=True)
+    async def _warm(self) -> None:
+        """Warm the cache."""
+        result: WarmingResult
+        try:
+            result = (
+                await self._sources.sync(self._progress)
+                if self._peps is None
+                else await self._sources.warm(
+                    self._peps, self._concurrency, self._progress
+                )
+            )
+        except (API.RequestError, ArchiveError, OSError) as error:
+            self.query_one(Label).update(str(error))
+            self.query_one(Button).label = add_key("Close", "Esc", self)
+            self.notify(
+                str(error), title="Error downloading PEP sources", severity="error"
+            )
+            return
+        self.query_one(ProgressBar).update(total=1, progress=1)
+        self.query_one(Label).update(
+            f"Downloaded {result.downloaded}, "
+            f"already cached {result.skipped}, "
+            f"failed {len(result.failed)}."
+        )
+        self.query_one(Button).label = add_key("Close", "Esc", self)
+        if result.failed:
+            self.notify(
+                "Some PEP sources could not be downloaded; warm the cache again to retry.",
+                severity="warning",
+            )
+
+    def on_mount(self) -> None:
+        """Start warming the cache once the DOM is ready."""
+        self._warm()
+
+    @on(Button.Pressed, "#close")
+    def action_close(self) -> None:
+        """Close the dialog, cancelling any outstanding downloads."""
+        self.workers.cancel_node(self)
+        self.dismiss(None)
+
+
+### cache_warmer.py ends here
@@ -0,0 +1,76 @@
+"""A dialog for searching the PEPs as the text to look for is typed."""
+
+##############################################################################
+# Python imports.
+from dataclasses import dataclass
+from functools import partial
+from typing import Final
+
+##############################################################################
+# Textual imports.
+from textual import on
+from textual.message import Message
+from textual.message_pump import MessagePump
+from textual.timer import Timer
+from textual.widgets import Input
+
+##############################################################################
+# Textual enhanced imports.
+from textual_enhanced.dialogs import ModalInput
+
+##############################################################################
+DEBOUNCE: Final[float] = 0.15
+"""How long, in seconds, typing has to pause before the text is searched for."""
+
+
+##############################################################################
+class LiveSearch(ModalInput):
+    """A modal input that reports the text to search for as it's typed.
+
+    The dialog sits at the top of the screen so the PEPs being searched can
+    be seen beneath it.
+    """
+
+    CSS = """
+    LiveSearch {
+        align: center top;
+        background: $background 0%;
+    }
+    """
+
+    @dataclass
+    class Changed(Message):
+        """A message sent when the text to search for changes."""
+
+        text: str
+        """The text to search for."""
+
+    def __init__(self, searcher: MessagePump, placeholder: str) -> None:
+        """Initialise the object.
+
+        Args:
+            searcher: The object to report the text to search for to.
+            placeholder: The placeholder text to use.
+        """
+        super().__init__(placeholder)
+        self._searcher = searcher
+        """The object to report the text to search for to."""
+        self._pending: Timer | None = None
+        """The timer for the latest report of the text to search for."""
+
+    @on(Input.Changed)
+    def _text_changed(self, message: Input.Changed) -> None:
+        """Report the text to search for once the typing pauses.
+
+        Args:
+            message: The message with the changed text.
+        """
+        if self._pending is not None:
+            self._pending.stop()
+        self._pending = self.set_timer(
+            DEBOUNCE,
+            partial(self._searcher.post_message, self.Changed(message.value.strip())),
+        )
+
+
+### live_search.py ends here
@@ -3,8 +3,12 @@
 ##############################################################################
 # Python imports.
 from argparse import Namespace
+from asyncio import to_thread
+from collections import deque
 from dataclasses import dataclass
 from json import dumps, loads
+from threading import Lock
+from typing import Final
 from webbrowser import open as visit_url
 
 ##############################################################################
@@ -14,6 +18,7 @@ from textual.app import ComposeResult
 from textual.message import Message
 from textual.reactive import var
 from textual.widgets import Footer, Header
+from textual.worker import get_current_worker
 
 ##############################################################################
 # Textual enhanced imports.
@@ -24,20 +29,34 @@ from textual_enhanced.screen import EnhancedScreen
 ##############################################################################
 # Local imports.
 from ... import __version__
-from ...peps import API
+from ...peps import (
+    API,
+    SourceCache,
+    SourceHit,
+    SourceIndex,
+    SourceIndexError,
+    Validators,
+)
 from ..commands import (
     EditNotes,
     Escape,
     FindPEP,
+    NextFilter,
+    PreviousFilter,
     RedownloadPEPs,
     Search,
+    SearchAsYouType,
     SearchAuthor,
     SearchPythonVersion,
+    SearchQuery,
+    SearchSimilar,
+    SearchSources,
     SearchStatus,
     SearchType,
     ShowAll,
     SortByCreated,
     SortByNumber,
+    SortByRelevance,
     SortByTitle,
     ToggleAuthorsSortOrder,
     TogglePEPDetails,
@@ -46,18 +65,32 @@ from ..commands import (
     ToggleStatusesSortOrder,
     ToggleTypesSortOrder,
     ViewPEP,
+    WarmCache,
+    WarmCacheFromArchive,
 )
 from ..data import (
     PEP,
     Containing,
+    Facets,
+    Filters,
+    IndexDelta,
+    InSource,
     Notes,
     PEPs,
+    QueryError,
+    RawIndex,
+    Resembling,
     WithAuthor,
     WithPythonVersion,
     WithStatus,
     WithType,
+    cache_dir,
     load_configuration,
+    parse_query,
     pep_data,
+    pep_data_is_stale,
+    pep_data_validators,
+    pep_source_index,
     update_configuration,
 )
 from ..messages import (
@@ -77,6 +110,8 @@ from ..providers import (
     TypeCommands,
 )
 from ..widgets import Navigation, PEPDetails, PEPsView
+from .cache_warmer import CacheWarmer
+from .live_search import LiveSearch
 from .notes_editor import NotesEditor
 from .pep_viewer import PEPViewer
 
@@ -157,26 +192,38 @@ class Main(EnhancedScreen[None]):
         ChangeTheme,
         Escape,
         FindPEP,
+        NextFilter,
+        PreviousFilter,
         Search,
+        SearchAsYouType,
         SearchAuthor,
         SearchPythonVersion,
+        SearchQuery,
+        SearchSimilar,
+        SearchSources,
         SearchStatus,
         SearchType,
         ShowAll,
         SortByCreated,
         SortByNumber,
+        SortByRelevance,
         SortByTitle,
         ToggleAuthorsSortOrder,
         TogglePythonVersionsSortOrder,
         ToggleSortOrder,
         ToggleStatusesSortOrder,
         ToggleTypesSortOrder,
+        WarmCache,
+        WarmCacheFromArchive,
     )
 
     BINDINGS = Command.bindings(*COMMAND_MESSAGES)
 
     COMMANDS = {MainCommands}
 
+    FILTER_HISTORY_LIMIT: Final[int] = 50
+    """The most filters to remember for going back to."""
+
     all_peps: var[PEPs] = var(PEPs)
     """All the PEPs that we know about."""
 
@@ -186,20 +233,64 @@ class Main(EnhancedScreen[None]):
     selected_pep: var[PEP | None] = var(None)
     """The currently-selected PEP."""
 
+    selected_snippet: var[str | None] = var(None)
+    """The snippet of the currently-selected PEP found by a search of the sources."""
+
     notes: var[Notes] = var(Notes)
     """The user's notes about PEPs."""
 
-    def __init__(self, arguments: Namespace) -> None:
+    def __init__(self, arguments: Namespace, api: API) -> None:
         """Initialise the main screen.
 
         Args:
             arguments: The arguments passed to the application on the command line.
+            api: The API client to use to talk to the PEP API.
         """
         self._arguments = arguments
         """The arguments passed on the command line."""
+        self._api = api
+        """The API client to use to talk to the PEP API."""
+        self._sources = SourceCache(api, cache_dir())
+        """The local cache of PEP sources."""
+        self._source_index = SourceIndex(
+            pep_source_index(), load_configuration().source_index_workers
+        )
+        """The full-text index of the local cache of PEP sources."""
         super().__init__()
         self._jump_to_on_load: str | None = self._arguments.pep
         """A PEP to jump to once the display is loaded."""
+        self._revalidate_on_load = False
+        """Should the PEP data be checked for updates once it is loaded?"""
+        self._refreshed_by: IndexDelta | None = None
+        """The changes made by a refresh of the PEP data that is being applied."""
+        self._back: deque[Filters] = deque(maxlen=self.FILTER_HISTORY_LIMIT)
+        """The filters that can be gone back to, the most recent last."""
+        self._forward: list[Filters] = []
+        """The filters that can be gone forward to, the next last."""
+        self._travelling = False
+        """Are we going back or forward through the filters?"""
+        self._live_base: PEPs | None = None
+        """The PEPs being searched as the text is typed, if they are."""
+        self._live_text = ""
+        """The latest text to search for as it's typed."""
+        self._live_found: tuple[Containing, PEPs] | None = None
+        """The latest search made as the text is typed, and the PEPs it found.
+
+        This is only used on the main thread; each search is handed it as it
+        stood when the search was started.
+        """
+        self._live_submitted = False
+        """Has the text to search for as it's typed been submitted?"""
+        self._live_lock = Lock()
+        """Held while the PEPs found by searching as the text is typed are worked with.
+
+        The PEPs a search finds are views that share their caches of results
+        and orderings with the PEPs on display. The lock is held by a search
+        while it makes, and puts in order, the PEPs it finds; and by the main
+        thread while it makes found PEPs active, which iterates them. So only
+        one search is made at once, and the shared caches are never worked
+        on by two threads at once.
+        """
 
     def compose(self) -> ComposeResult:
         """Compose the content of the main screen."""
@@ -208,7 +299,9 @@ class Main(EnhancedScreen[None]):
             Main.all_peps, Main.active_peps
         )
         yield PEPsView(classes="panel").data_bind(Main.active_peps)
-        yield PEPDetails(classes="panel").data_bind(pep=Main.selected_pep)
+        yield PEPDetails(classes="panel").data_bind(
+            pep=Main.selected_pep, snippet=Main.selected_snippet
+        )
         yield Footer()
 
     @dataclass
@@ -217,6 +310,8 @@ class Main(EnhancedScreen[None]):
 
         peps: PEPs
         """The PEP data that was loaded."""
+        delta: IndexDelta | None = None
+        """The changes from the previous PEP data, if this is a refresh."""
 
     @work(thread=True)
     def load_pep_data(self) -> None:
@@ -225,35 +320,109 @@ class Main(EnhancedScreen[None]):
             return
         try:
             self.notes.load()
-            self.post_message(
-                self.Loaded(
-                    PEPs(
-                        PEP.from_storage(pep, self.notes)
-                        for pep in loads(pep_data().read_text()).values()
-                    )
-                )
-            )
+            peps = [
+                PEP.from_storage(pep, self.notes)
+                for pep in loads(pep_data().read_text()).values()
+            ]
+            # Build the indexes here, off the main thread.
+            self.post_message(self.Loaded(PEPs(peps, facets=Facets(peps))))
         except IOError as error:
             self.notify(str(error), title="Error loading PEP data", severity="error")
 
-    @work(thread=True)
-    async def download_pep_data(self) -> None:
-        """Download a fresh copy of the PEP data."""
-        # Get the raw data from the API.
+    @work(exclusive=True)
+    async def download_pep_data(self, revalidating: bool = False) -> None:
+        """Download a fresh copy of the PEP data.
+
+        Args:
+            revalidating: Is this a background check of existing local data?
+
+        Notes:
+            When revalidating, the local data is only reloaded if the PEP
+            data has actually changed, and the user is only told about
+            anything if there is fresh data, or there was a problem.
+        """
+        # Get the raw data from the API; only making the request conditional
+        # if we've actually got local data to fall back on.
         try:
-            raw_data = await API().get_peps()
+            index = await self._api.get_peps(
+                Validators.load(pep_data_validators()) if pep_data().exists() else None
+            )
         except API.Error as error:
-            self.notify(str(error), title="API Error", severity="error", timeout=8)
+            if revalidating:
+                self.notify(
+                    str(error),
+                    title="Unable to check for fresh PEP data",
+                    severity="warning",
+                )
+            else:
+                self.notify(str(error), title="API Error", severity="error", timeout=8)
             return
-        # Store the raw data.
+
+        def store() -> tuple[str | None, bool]:
+            previous = self._local_pep_data()
+            fresh = None if index.peps is None else dumps(index.peps, indent=4)
+            # If the index hasn't changed since we last downloaded it,
+            # there's no need to store or reload anything; just record that
+            # the local copy is known to be fresh as of now.
+            if unchanged := fresh is None or fresh == previous:
+                pep_data().touch()
+            else:
+                pep_data().write_text(fresh, encoding="utf-8")
+            index.validators.save(pep_data_validators())
+            return previous, not unchanged
+
+        # Turning the data into JSON, and storing it, is slow enough to hold
+        # up the application, so it's done in a thread.
         try:
-            pep_data().write_text(dumps(raw_data, indent=4), encoding="utf-8")
+            previous, changed = await to_thread(store)
         except IOError as error:
             self.notify(str(error), title="Error saving PEP data", severity="error")
             return
-        # Now kick off loading the raw data.
+        if not changed or index.peps is None:
+            if not revalidating:
+                self.notify("The local PEP data is up to date")
+            return
+        # Now kick off applying the fresh data.
         self.notify("Fresh PEP data downloaded from the PEP API")
-        self.load_pep_data()
+        self.refresh_pep_data(previous, index.peps)
+
+    @work(thread=True)
+    def refresh_pep_data(self, previous: str | None, fresh: RawIndex) -> None:
+        """Refresh the PEP data from a freshly-downloaded copy.
+
+        Args:
+            previous: The raw text of the PEP data that is currently loaded.
+            fresh: The freshly-downloaded PEP data.
+
+        Notes:
+            Only the PEPs that have been added or changed are parsed; any
+            PEP that is unchanged carries over as the same object.
+        """
+        # If nothing has been loaded yet, neither have the notes.
+        if not self.all_peps:
+            try:
+                self.notes.load()
+            except IOError as error:
+                self.notify(str(error), title="Error loading notes", severity="error")
+        try:
+            old = loads(previous) if previous else {}
+        except ValueError:
+            old = {}
+        delta = IndexDelta.between(old if isinstance(old, dict) else {}, fresh)
+        peps = delta.apply(self.all_peps, fresh, self.notes)
+        self.post_message(self.Loaded(PEPs(peps, facets=Facets(peps)), delta))
+
+    @staticmethod
+    def _local_pep_data() -> str | None:
+        """Get the raw text of the local copy of the PEP data.
+
+        Returns:
+            The raw text, or `None` if it isn't available.
+        """
+        try:
+            return pep_data().read_text(encoding="utf-8")
+        except IOError:
+            return None
 
     @staticmethod
     def _extract_pep(pep: str) -> int | None:
@@ -287,6 +456,9 @@ class Main(EnhancedScreen[None]):
                 timeout=8,
             )
         config = load_configuration()
+        # If this is a refresh of PEPs that are already on display, note
+        # what changed so it can be applied to the active PEPs as a patch.
+        self._refreshed_by = message.delta if self.all_peps else None
         self.all_peps = message.peps.sorted_by(config.peps_sort_order).reversed(
             config.peps_sort_reversed
         )
@@ -294,6 +466,9 @@ class Main(EnhancedScreen[None]):
             if (pep := self._extract_pep(self._jump_to_on_load)) is not None:
                 self.post_message(GotoPEP(pep))
             self._jump_to_on_load = None
+        if self._revalidate_on_load:
+            self._revalidate_on_load = False
+            self.download_pep_data(revalidating=True)
 
     def on_mount(self) -> None:
         """Configure the application once the DOM is mounted."""
@@ -307,20 +482,46 @@ class Main(EnhancedScreen[None]):
         self.set_class(load_configuration().details_visble, "details-visible")
         # On startup, if we've got local PEP data...
         if pep_data().exists():
-            # ...load and display that.
+            # ...load and display that; if it's getting on a bit, check for
+            # fresh data in the background once it's on display.
+            max_age = load_configuration().pep_data_max_age
+            self._revalidate_on_load = max_age > 0 and pep_data_is_stale(max_age)
             self.load_pep_data()
         else:
             # Given we've got no local data at all, let's force an attempt
             # to download from the API.
             self.download_pep_data()
+        # Catch up with any changes to the cached PEP sources while we were
+        # away, so they're ready to be searched.
+        self._maintain_source_index()
 
     def watch_all_peps(self) -> None:
         """React to the full set of PEPs being updated."""
-        self.active_peps = self.all_peps
+        if (refreshed_by := self._refreshed_by) is not None:
+            self._refreshed_by = None
+            self.active_peps = self.active_peps.refresh_from(
+                self.all_peps, refreshed_by.affected
+            )
+        else:
+            self.active_peps = self.all_peps
         PEPsCommands.peps = self.all_peps
 
-    def watch_active_peps(self) -> None:
-        """React to the active PEPs being updated."""
+    def watch_active_peps(self, old_peps: PEPs, new_peps: PEPs) -> None:
+        """React to the active PEPs being updated.
+
+        Args:
+            old_peps: The PEPs that were active.
+            new_peps: The PEPs that are now active.
+        """
+        # If the user has moved on to a new filter, remember where they
+        # were so they can go back to it. While searching as the text is
+        # typed, where they were is remembered once the search is done.
+        if (
+            not self._travelling
+            and self._live_base is None
+            and old_peps.filters != new_peps.filters
+        ):
+            self._remember(old_peps.filters)
         self.sub_title = f"{self.active_peps.description} ({len(self.active_peps)})"
         AuthorCommands.active_peps = self.active_peps
         PythonVersionCommands.active_peps = self.active_peps
@@ -331,17 +532,66 @@ class Main(EnhancedScreen[None]):
     def select_pep(self, message: PEPsView.PEPHighlighted) -> None:
         """Make the currently-selected PEP the one to view."""
         self.selected_pep = message.pep
+        self.selected_snippet = self.active_peps.snippet(message.pep.number)
 
     @on(PEPsView.Empty)
     def deselect_pep(self) -> None:
         """Handle there being no highlighted PEP."""
         self.selected_pep = None
+        self.selected_snippet = None
 
     @on(ShowAll)
     def action_show_all_command(self) -> None:
         """Show all PEPs."""
         self.active_peps = self.all_peps
 
+    def _remember(self, filters: Filters) -> None:
+        """Remember some filters so they can be gone back to.
+
+        Args:
+            filters: The filters to remember.
+        """
+        self._back.append(filters)
+        self._forward.clear()
+
+    def _travel_to(self, filters: Filters) -> None:
+        """Make the PEPs that match some filters the active PEPs.
+
+        Args:
+            filters: The filters to travel to.
+        """
+        config = load_configuration()
+        peps = self.all_peps.sorted_by(config.peps_sort_order).reversed(
+            config.peps_sort_reversed
+        )
+        # Each step along the way will likely have been taken recently, so
+        # the PEPs will serve them from their results cache.
+        for pep_filter in filters:
+            peps &= pep_filter
+        self._travelling = True
+        try:
+            self.active_peps = peps
+        finally:
+            self._travelling = False
+
+    def action_previous_filter_command(self) -> None:
+        """Go back to the previous filter of the PEPs."""
+        if not self._back:
+            self.notify("There is no earlier filter to go back to.", severity="warning")
+            return
+        self._forward.append(self.active_peps.filters)
+        self._travel_to(self._back.pop())
+
+    def action_next_filter_command(self) -> None:
+        """Go forward to the next filter of the PEPs."""
+        if not self._forward:
+            self.notify(
+                "There is no later filter to go forward to.", severity="warning"
+            )
+            return
+        self._back.append(self.active_peps.filters)
+        self._travel_to(self._forward.pop())
+
     @on(ShowType)
     def show_type(self, command: ShowType) -> None:
         """Filter the PEPs by a given type.
@@ -425,6 +675,151 @@ class Main(EnhancedScreen[None]):
         ):
             self.active_peps = self.active_peps & Containing(search_text)
 
+    @dataclass
+    class LiveSearchFound(Message):
+        """A message sent when a search made as the text is typed is done."""
+
+        base: PEPs
+        """The PEPs that were searched."""
+        text: str
+        """The text that was searched for."""
+        searching: Containing | None
+        """The filter used to search, or `None` if there was no text."""
+        peps: PEPs
+        """The PEPs that were found."""
+        final: bool
+        """Was this the search for the submitted text?"""
+
+    @staticmethod
+    def _search_live(
+        base: PEPs, text: str, previous: tuple[Containing, PEPs] | None
+    ) -> tuple[Containing | None, PEPs]:
+        """Search some PEPs for some text typed so far.
+
+        Args:
+            base: The PEPs to search.
+            text: The text to search for.
+            previous: The last search made, and the PEPs it found, if any.
+
+        Returns:
+            The filter used to search, or `None` if there's no text, and the
+            PEPs that were found.
+
+        Notes:
+            If the text extends the text last searched for, only the PEPs
+            found by the last search are searched.
+        """
+        if not text:
+            return None, base
+        searching = Containing(text)
+        if (
+            previous is not None
+            and previous[0] in previous[1].filters
+            and searching.narrows(previous[0])
+        ):
+            return searching, previous[1].narrowed(previous[0], searching)
+        return searching, base & searching
+
+    @work(thread=True, exclusive=True, group="live-search")
+    def _live_search(
+        self,
+        base: PEPs,
+        text: str,
+        previous: tuple[Containing, PEPs] | None,
+        final: bool = False,
+    ) -> None:
+        """Search the PEPs as the text is typed.
+
+        Args:
+            base: The PEPs to search.
+            text: The text to search for.
+            previous: The last search made, and the PEPs it found, if any.
+            final: Is this the search for the submitted text?
+
+        Notes:
+            Only one search is made at once; a search that is superseded
+            before it starts is skipped, and the result of one superseded
+            while it runs is thrown away.
+        """
+        worker = get_current_worker()
+        with self._live_lock:
+            if worker.is_cancelled:
+                return
+            searching, found = self._search_live(base, text, previous)
+            # Put the PEPs in order now, rather than when they're displayed.
+            iter(found)
+        if not worker.is_cancelled:
+            self.post_message(self.LiveSearchFound(base, text, searching, found, final))
+
+    @on(LiveSearch.Changed)
+    def _live_search_changed(self, message: LiveSearch.Changed) -> None:
+        """Search for the text typed so far.
+
+        Args:
+            message: The message with the text to search for.
+        """
+        if (
+            self._live_base is not None
+            and not self._live_submitted
+            and message.text != self._live_text
+        ):
+            self._live_text = message.text
+            self._live_search(self._live_base, message.text, self._live_found)
+
+    @on(LiveSearchFound)
+    def _live_search_found(self, message: LiveSearchFound) -> None:
+        """Show the PEPs found by a search made as the text is typed.
+
+        Args:
+            message: The message with the result of the search.
+        """
+        if message.base is not self._live_base or message.text != self._live_text:
+            return
+        if message.searching is not None:
+            self._live_found = (message.searching, message.peps)
+        if message.final:
+            self._end_live_search(message.peps)
+        else:
+            with self._live_lock:
+                self.active_peps = message.peps
+
+    def _end_live_search(self, peps: PEPs) -> None:
+        """Finish searching as the text is typed.
+
+        Args:
+            peps: The PEPs to leave active.
+        """
+        if (base := self._live_base) is None:
+            return
+        self._live_base = None
+        self._live_found = None
+        if peps.filters != base.filters:
+            self._remember(base.filters)
+        self._travelling = True
+        try:
+            with self._live_lock:
+                self.active_peps = peps
+        finally:
+            self._travelling = False
+
+    @work
+    async def action_search_as_you_type_command(self) -> None:
+        """Free-text search within the PEPs, as the text is typed."""
+        self._live_base = base = self.active_peps
+        self._live_text = ""
+        self._live_found = None
+        self._live_submitted = False
+        search_text = await self.app.push_screen_wait(
+            LiveSearch(self, "Case-insensitive text to look for in the PEPs")
+        )
+        if search_text is None:
+            self.workers.cancel_group(self, "live-search")
+            self._end_live_search(base)
+        else:
+            self._live_submitted = True
+            self._live_text = search_text
+            self._live_search(base, search_text, self._live_found, final=True)
+
     def action_search_author_command(self) -> None:
         """Search for an author and use them as a filter."""
         self.show_palette(AuthorCommands)
@@ -433,6 +828,97 @@ class Main(EnhancedScreen[None]):
         """Search for a Python version and then use it as a filter."""
         self.show_palette(PythonVersionCommands)
 
+    @work
+    async def action_search_query_command(self) -> None:
+        """Filter the PEPs with a query."""
+        if query := await self.app.push_screen_wait(
+            ModalInput('Query, e.g. status:Final -author:guido "pattern matching"')
+        ):
+            try:
+                matching = parse_query(query)
+            except QueryError as error:
+                self.notify(str(error), title="Invalid query", severity="error")
+                return
+            self.active_peps = self.active_peps & matching
+
+    @work
+    async def action_search_similar_command(self) -> None:
+        """Typo-tolerant search within the PEPs."""
+        if search_text := await self.app.push_screen_wait(
+            ModalInput("Text that resembles the title, authors, topic or notes")
+        ):
+            self.active_peps = self.active_peps & Resembling(search_text)
+
+    @dataclass
+    class SourcesFound(Message):
+        """A message sent when a search of the PEP sources is done."""
+
+        text: str
+        """The text that was searched for."""
+        hits: list[SourceHit]
+        """The PEPs whose sources contain the text, best match first."""
+
+    @work(thread=True, group="source-index")
+    def _maintain_source_index(self, peps: tuple[int, ...] | None = None) -> None:
+        """Bring the index of the cached PEP sources up to date.
+
+        Args:
+            peps: The PEPs whose sources may have changed, or `None` to
+                check all of the cached sources.
+
+        Notes:
+            The index makes its updates one at a time, so if the index is
+            already being brought up to date this waits for that to finish.
+        """
+        try:
+            self._source_index.catch_up(self._sources, peps)
+        except SourceIndexError as error:
+            self.notify(
+                str(error),
+                title="Unable to update the index of the PEP sources",
+                severity="error",
+            )
+
+    @work(thread=True, exclusive=True)
+    def _search_sources(self, search_text: str) -> None:
+        """Search the cached PEP sources.
+
+        Args:
+            search_text: The text to look for.
+
+        Notes:
+            The index is kept up to date in the background, as the cached
+            sources change; the search is of whatever has been indexed so
+            far.
+        """
+        try:
+            hits = self._source_index.search(search_text)
+        except SourceIndexError as error:
+            self.notify(
+                str(error), title="Unable to search the PEP sources", severity="error"
+            )
+            return
+        self.post_message(self.SourcesFound(search_text, hits))
+
+    @on(SourcesFound)
+    def _sources_found(self, message: SourcesFound) -> None:
+        """Filter the PEPs by the result of a search of their sources.
+
+        Args:
+            message: The message with the result of the search.
+        """
+        self.active_peps = self.active_peps & InSource(
+            message.text, {hit.pep: hit.snippet for hit in message.hits}
+        )
+
+    @work
+    async def action_search_sources_command(self) -> None:
+        """Full-text search within the cached PEP sources."""
+        if search_text := await self.app.push_screen_wait(
+            ModalInput("Words to look for in the cached sources of the PEPs")
+        ):
+            self._search_sources(search_text)
+
     def action_search_status_command(self) -> None:
         """Search for a status and use it as a filter."""
         self.show_palette(StatusCommands)
@@ -518,6 +1004,12 @@ class Main(EnhancedScreen[None]):
             config.peps_sort_order = "title"
             self.active_peps = self.active_peps.sorted_by(config.peps_sort_order)
 
+    def action_sort_by_relevance_command(self) -> None:
+        """Sort the PEPs by their relevance to the text being searched for."""
+        with update_configuration() as config:
+            config.peps_sort_order = "relevance"
+            self.active_peps = self.active_peps.sorted_by(config.peps_sort_order)
+
     def action_toggle_sort_order_command(self) -> None:
         """Toggle the current sort order direction of the PEPs."""
         with update_configuration() as config:
@@ -545,11 +1037,15 @@ class Main(EnhancedScreen[None]):
         ) is not None:
             self.notes[self.selected_pep.number] = notes
             self._save_notes()
-            self.active_peps = self.active_peps.rebuild_from(
-                self.all_peps.patch_pep(self.selected_pep.annotate(notes=notes))
+            # Only the PEP with the notes has changed, so only it needs
+            # checking against the filters of the active PEPs.
+            self.active_peps = self.active_peps.refresh_from(
+                self.all_peps.patch_pep(self.selected_pep.annotate(notes=notes)),
+                (self.selected_pep.number,),
             )
 
-    def action_view_pep_command(self) -> None:
+    @work
+    async def action_view_pep_command(self) -> None:
         """View the currently-highlighted PEP's source."""
         if self.selected_pep is None:
             self.notify("Highlight a PEP to view it.", severity="warning")
@@ -557,7 +1053,31 @@ class Main(EnhancedScreen[None]):
         if self.selected_pep.number == 0:
             self.notify("PEP0 has no source to view.", severity="warning")
             return
-        self.app.push_screen(PEPViewer(self.selected_pep))
+        viewing = self.selected_pep.number
+        await self.app.push_screen_wait(PEPViewer(self.selected_pep, self._sources))
+        # Viewing the PEP may have downloaded, or refreshed, its source.
+        self._maintain_source_index((viewing,))
+
+    @work
+    async def action_warm_cache_command(self) -> None:
+        """Download the sources of the active PEPs into the local cache."""
+        if not self.active_peps:
+            self.notify("There are no PEPs to download.", severity="warning")
+            return
+        await self.app.push_screen_wait(
+            CacheWarmer(
+                self._sources,
+                (pep.number for pep in self.active_peps if pep.number != 0),
+                load_configuration().source_download_concurrency,
+            )
+        )
+        self._maintain_source_index()
+
+    @work
+    async def action_warm_cache_from_archive_command(self) -> None:
+        """Download the sources of all PEPs into the local cache, as one archive."""
+        await self.app.push_screen_wait(CacheWarmer(self._sources, None))
+        self._maintain_source_index()
 
 
 ### main.py ends here
@@ -3,7 +3,6 @@
 ##############################################################################
 # Python imports.
 from functools import partial
-from pathlib import Path
 
 ##############################################################################
 # Textual imports.
@@ -25,8 +24,8 @@ from textual_fspicker import FileSave
 
 ##############################################################################
 # Local imports.
-from ...peps import API
-from ..data import PEP, cache_dir
+from ...peps import API, SourceCache
+from ..data import PEP
 
 
 ##############################################################################
@@ -75,15 +74,18 @@ class PEPViewer(ModalScreen[None]):
         ("escape", "close"),
     ]
 
-    def __init__(self, pep: PEP) -> None:
+    def __init__(self, pep: PEP, sources: SourceCache) -> None:
         """Initialise the dialog.
 
         Args:
             pep: The PEP to view.
+            sources: The cache of PEP sources to get the PEP from.
         """
         super().__init__()
         self._pep = pep
         """The PEP to view."""
+        self._sources = sources
+        """The cache of PEP sources to get the PEP from."""
 
     def compose(self) -> ComposeResult:
         """Compose the dialog's content."""
@@ -96,11 +98,6 @@ class PEPViewer(ModalScreen[None]):
                 yield Button(add_key("Refresh", "^r", self), id="refresh")
                 yield Button(add_key("Close", "Esc", self), id="close")
 
-    @property
-    def _cache_name(self) -> Path:
-        """The name of the file that is the cached version of the PEP source."""
-        return cache_dir() / API.pep_file(self._pep.number)
-
     @work
     async def _download_text(self) -> None:
         """Download the text of the PEP.
@@ -111,27 +108,14 @@ class PEPViewer(ModalScreen[None]):
             instead.
         """
         (text := self.query_one(TextViewer)).loading = True
-        pep_source = ""
-
-        if self._cache_name.exists():
-            try:
-                pep_source = self._cache_name.read_text(encoding="utf-8")
-            except IOError:
-                pass
 
-        if not pep_source:
-            try:
-                self._cache_name.write_text(
-                    pep_source := await API().get_pep(self._pep.number),
-                    encoding="utf-8",
-                )
-            except IOError:
-                pass
-            except API.RequestError as error:
-                pep_source = "Error downloading PEP source"
-                self.notify(
-                    str(error), title="Error downloading PEP source", severity="error"
-                )
+        try:
+            pep_source = await self._sources.get(self._pep.number)
+        except API.RequestError as error:
+            pep_source = "Error downloading PEP source"
+            self.notify(
+                str(error), title="Error downloading PEP source", severity="error"
+            )
 
         text.text = pep_source
         text.loading = False
@@ -150,7 +134,7 @@ class PEPViewer(ModalScreen[None]):
     def action_refresh(self) -> None:
         """Refresh the PEP source."""
         try:
-            self._cache_name.unlink(missing_ok=True)
+            self._sources.forget(self._pep.number)
         except IOError:
             pass
         self._download_text()
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 ##############################################################################
 # Python imports.
-from typing import Callable
+from typing import Callable, Iterator
 
 ##############################################################################
 # Rich imports.
@@ -26,10 +26,6 @@ from textual.widgets.option_list import Option
 # Textual enhanced imports.
 from textual_enhanced.widgets import EnhancedOptionList
 
-##############################################################################
-# Typing exception imports.
-from typing_extensions import Self
-
 ##############################################################################
 # Local imports.
 from ..commands import ShowAll
@@ -66,6 +62,41 @@ class Title(Option):
 class CountView(Option):
     """Base class for options that show a count."""
 
+    def __init__(self, caption: str, count: int, id: str) -> None:
+        """Initialise the object.
+
+        Args:
+            caption: The caption for the count.
+            count: The count.
+            id: The ID of the option.
+        """
+        self._caption = caption
+        """The caption for the count."""
+        self._count = count
+        """The count."""
+        super().__init__(self.count_prompt(caption, count), id=id)
+
+    @property
+    def count(self) -> int:
+        """The count being shown."""
+        return self._count
+
+    def recount(self, count: int) -> RenderableType:
+        """Change the count being shown.
+
+        Args:
+            count: The new count.
+
+        Returns:
+            The new prompt for the option.
+
+        Notes:
+            This doesn't update the prompt; that needs to be done via the
+            option list that holds this option.
+        """
+        self._count = count
+        return self.count_prompt(self._caption, count)
+
     def count_prompt(self, caption: str, count: int) -> RenderableType:
         """Create a prompt.
 
@@ -99,8 +130,7 @@ class AllView(CountView):
             peps: The full collection of PEPs.
         """
         super().__init__(
-            self.count_prompt(f"All [{(key_colour or 'dim')}]\\[{key}][/]", len(peps)),
-            id=f"_all_peps",
+            f"All [{(key_colour or 'dim')}]\\[{key}][/]", len(peps), id="_all_peps"
         )
 
     @property
@@ -121,10 +151,7 @@ class TypeView(CountView):
         """
         self._type = pep_type
         """The details of the type to show."""
-        super().__init__(
-            self.count_prompt(pep_type.type, pep_type.count),
-            id=f"_type_{pep_type.type}",
-        )
+        super().__init__(pep_type.type, pep_type.count, id=f"_type_{pep_type.type}")
 
     @property
     def command(self) -> Message:
@@ -144,10 +171,7 @@ class StatusView(CountView):
         """
         self._status = status
         """The details of the status to show."""
-        super().__init__(
-            self.count_prompt(status.status, status.count),
-            id=f"_status_{status.status}",
-        )
+        super().__init__(status.status, status.count, id=f"_status_{status.status}")
 
     @property
     def command(self) -> Message:
@@ -168,7 +192,8 @@ class PythonVersionView(CountView):
         self._version = version
         """The Python version to show."""
         super().__init__(
-            self.count_prompt(version.version or f"[dim i]None[/]", version.count),
+            version.version or "[dim i]None[/]",
+            version.count,
             id=f"_python_version_{version.version}",
         )
 
@@ -190,10 +215,7 @@ class AuthorView(CountView):
         """
         self._author = author
         """The details of the author to show."""
-        super().__init__(
-            self.count_prompt(author.author, author.count),
-            id=f"_author_{author.author}",
-        )
+        super().__init__(author.author, author.count, id=f"_author_{author.author}")
 
     @property
     def command(self) -> Message:
@@ -256,20 +278,18 @@ class Navigation(EnhancedOptionList):
         """Configure the widget once the DOM is mounted."""
         self.app.theme_changed_signal.subscribe(self, lambda _: self.repopulate())
 
-    def add_main(self) -> Self:
-        """Add the main navigation options.
+    def _main_options(self) -> Iterator[Option]:
+        """The main navigation options.
 
-        Returns:
-            Self.
+        Yields:
+            The options.
         """
-        return self.add_option(
-            AllView(
-                self.all_peps,
-                key=ShowAll.key_binding(),
-                key_colour=None
-                if self.app.current_theme is None
-                else self.app.current_theme.accent,
-            )
+        yield AllView(
+            self.all_peps,
+            key=ShowAll.key_binding(),
+            key_colour=None
+            if self.app.current_theme is None
+            else self.app.current_theme.accent,
         )
 
     @staticmethod
@@ -288,69 +308,101 @@ class Navigation(EnhancedOptionList):
 
         return _key
 
-    def add_types(self) -> Self:
-        """Add the PEP types to navigation.
+    def _type_options(self) -> Iterator[Option]:
+        """The PEP type options.
 
-        Returns:
-            Self.
+        Yields:
+            The options.
         """
         if self.active_peps:
-            self.add_option(Title("Type"))
+            yield Title("Type")
             for pep_type in sorted(
                 self.active_peps.types, key=self._filter_key(self.sort_types_by_count)
             ):
-                self.add_option(TypeView(pep_type))
-        return self
+                yield TypeView(pep_type)
 
-    def add_statuses(self) -> Self:
-        """Add the PEP statuses to navigation.
+    def _status_options(self) -> Iterator[Option]:
+        """The PEP status options.
 
-        Returns:
-            Self.
+        Yields:
+            The options.
         """
         if self.active_peps:
-            self.add_option(Title("Status"))
+            yield Title("Status")
             for status in sorted(
                 self.active_peps.statuses,
                 key=self._filter_key(self.sort_statuses_by_count),
             ):
-                self.add_option(StatusView(status))
-        return self
+                yield StatusView(status)
 
-    def add_python_versions(self) -> Self:
-        """Add the PEP python versions to navigation.
+    def _python_version_options(self) -> Iterator[Option]:
+        """The PEP Python version options.
 
-        Returns:
-            Self.
+        Yields:
+            The options.
         """
         if self.active_peps:
-            self.add_option(Title("Python Version"))
+            yield Title("Python Version")
             for version in sorted(
                 self.active_peps.python_versions,
                 key=self._filter_key(self.sort_python_versions_by_count),
             ):
-                self.add_option(PythonVersionView(version))
-        return self
+                yield PythonVersionView(version)
 
-    def add_authors(self) -> Self:
-        """Add the PEP authors to navigation.
+    def _author_options(self) -> Iterator[Option]:
+        """The PEP author options.
 
-        Returns:
-            Self.
+        Yields:
+            The options.
         """
         if self.active_peps:
-            self.add_option(Title("Author"))
+            yield Title("Author")
             for author in sorted(
                 self.active_peps.authors,
                 key=self._filter_key(self.sort_authors_by_count),
             ):
-                self.add_option(AuthorView(author))
-        return self
+                yield AuthorView(author)
+
+    def _wanted_options(self) -> list[Option]:
+        """All of the options for the navigation panel, in order."""
+        return [
+            *self._main_options(),
+            *self._type_options(),
+            *self._status_options(),
+            *self._python_version_options(),
+            *self._author_options(),
+        ]
+
+    def _recount(self, options: list[Option]) -> bool:
+        """Try and update the counts shown, rather than repopulating.
+
+        Args:
+            options: The options that should be shown.
+
+        Returns:
+            `True` if the counts were updated, `False` if a repopulate is needed.
+
+        Notes:
+            The counts can only be updated if the options shown are the
+            options wanted, in the same order; if they are, only the
+            prompts of the options whose counts have changed are replaced.
+        """
+        if [option.id for option in options] != [option.id for option in self.options]:
+            return False
+        for index, (shown, wanted) in enumerate(zip(self.options, options)):
+            if (
+                isinstance(shown, CountView)
+                and isinstance(wanted, CountView)
+                and shown.count != wanted.count
+            ):
+                self.replace_option_prompt_at_index(index, shown.recount(wanted.count))
+        return True
 
     def repopulate(self) -> None:
         """Repopulate navigation panel."""
+        options = self._wanted_options()
         with self.preserved_highlight:
-            self.clear_options().add_main().add_types().add_statuses().add_python_versions().add_authors()
+            self.clear_options().add_options(options)
 
     def watch_all_peps(self) -> None:
         """React to the full list of PEPs being changed."""
@@ -358,7 +410,10 @@ class Navigation(EnhancedOptionList):
 
     def watch_active_peps(self) -> None:
         """React to the active PEPs being changed."""
-        self.repopulate()
+        options = self._wanted_options()
+        with self.preserved_highlight:
+            if not self._recount(options):
+                self.clear_options().add_options(options)
 
     def watch_sort_types_by_count(self) -> None:
         """React to the types sort order being changed."""
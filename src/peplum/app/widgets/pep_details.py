@@ -24,6 +24,7 @@ from rich.emoji import Emoji
 from textual import _widget_navigation, on
 from textual.app import ComposeResult
 from textual.containers import Vertical, VerticalScroll
+from textual.markup import escape
 from textual.reactive import var
 from textual.types import Direction
 from textual.widgets import Label, Markdown
@@ -35,6 +36,7 @@ from textual_enhanced.widgets import EnhancedOptionList
 
 ##############################################################################
 # Local imports.
+from ...peps import SNIPPET_MARKS
 from ..data import PEP, PEPStatus, PEPType, PostHistory
 from ..messages import (
     GotoPEP,
@@ -463,11 +465,16 @@ class PEPDetails(VerticalScroll, can_focus=False):
     pep: var[PEP | None] = var(None)
     """The PEP to show the details of."""
 
+    snippet: var[str | None] = var(None)
+    """A snippet of the PEP's source that was found by a search, if any."""
+
     BINDINGS = [("enter", "visit_pep")]
 
     def compose(self) -> ComposeResult:
         with Field("Title"):
             yield Value(id="title")
+        with Field("Found In Source"):
+            yield Value(id="snippet")
         with Field("Author"):
             yield ClickableValue(id="author")
         with Field("Sponsor"):
@@ -545,6 +552,15 @@ class PEPDetails(VerticalScroll, can_focus=False):
                 self.query_one("#url", ClickableValue).show(URLItem(self.pep.url))
                 self.query_one(Notes).show(self.pep.notes)
 
+    def watch_snippet(self) -> None:
+        """React to the snippet being changed."""
+        start, end = SNIPPET_MARKS
+        self.query_one("#snippet", Value).show(
+            None
+            if self.snippet is None
+            else escape(self.snippet).replace(start, "[bold]").replace(end, "[/bold]")
+        )
+
     def action_visit_pep(self) -> None:
         """Action that visits the current PEP."""
         if self.pep is not None:
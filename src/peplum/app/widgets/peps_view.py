@@ -42,7 +42,20 @@ class PEPView(Option):
         Args:
             pep: The PEP to view.
         """
+        self._pep = pep
+        """The PEP that this option is showing."""
+        super().__init__(self.make_prompt(pep), id=self.make_id(pep.number))
+
+    @classmethod
+    def make_prompt(cls, pep: PEP) -> Group:
+        """Make the prompt for a given PEP.
 
+        Args:
+            pep: The PEP to make the prompt for.
+
+        Returns:
+            The prompt for the PEP.
+        """
         title = Table.grid(expand=True)
         title.add_column(width=6)
         title.add_column(justify="left", ratio=2)
@@ -61,10 +74,7 @@ class PEPView(Option):
             "", f"[dim]{', '.join(pep.author_names)}[/]", f"[dim]{pep.created}[/]"
         )
 
-        self._pep = pep
-        """The PEP that this option is showing."""
-
-        super().__init__(Group(title, info, self.RULE), id=self.make_id(pep.number))
+        return Group(title, info, cls.RULE)
 
     @staticmethod
     def make_id(number: int) -> str:
@@ -83,6 +93,16 @@ class PEPView(Option):
         """The PEP associated with this option."""
         return self._pep
 
+    @pep.setter
+    def pep(self, pep: PEP) -> None:
+        """Set the PEP associated with this option.
+
+        Notes:
+            This doesn't update the prompt; that needs to be done via the
+            option list that holds this option.
+        """
+        self._pep = pep
+
 
 ##############################################################################
 class PEPsView(EnhancedOptionList):
@@ -94,18 +114,71 @@ class PEPsView(EnhancedOptionList):
     This is a list of all PEPs that match your current filter.
     """
 
+    PATCH_LIMIT: Final[int] = 50
+    """The most rows that will be removed or replaced when patching the list."""
+
     active_peps: var[PEPs] = var(PEPs)
     """The currently-active collection of PEPs."""
 
     class Empty(Message):
         """A message sent when the PEPs view falls empty."""
 
+    def _patch(self, peps: list[PEP]) -> bool:
+        """Try and patch the list so that it shows the given PEPs.
+
+        Args:
+            peps: The PEPs that should be shown, in order.
+
+        Returns:
+            `True` if the list was patched, `False` if it needs rebuilding.
+
+        Notes:
+            The list can be patched if, once any PEPs that are no longer
+            wanted are removed, the PEPs that are shown are in the same order
+            as the start of the wanted PEPs. Only the rows for PEPs that have
+            gone or changed are touched, and any new PEPs are added to the
+            end. If too many rows would need touching, it's cheaper to
+            rebuild the list.
+        """
+        wanted = {pep.number for pep in peps}
+        shown = [option.pep for option in self.options if isinstance(option, PEPView)]
+        removed = [pep.number for pep in shown if pep.number not in wanted]
+        kept = [pep for pep in shown if pep.number in wanted]
+        if any(was.number != now.number for was, now in zip(kept, peps)):
+            return False
+        replaced = [index for index, pep in enumerate(kept) if pep is not peps[index]]
+        if len(removed) + len(replaced) > self.PATCH_LIMIT:
+            return False
+        for number in removed:
+            self.remove_option(PEPView.make_id(number))
+        for index in replaced:
+            option = self.get_option_at_index(index)
+            assert isinstance(option, PEPView)
+            option.pep = peps[index]
+            self.replace_option_prompt_at_index(index, PEPView.make_prompt(option.pep))
+        self.add_options(PEPView(pep) for pep in peps[len(kept) :])
+        return True
+
+    @property
+    def _highlighted_pep(self) -> PEP | None:
+        """The PEP that is currently highlighted, if there is one."""
+        if isinstance(option := self.highlighted_option, PEPView):
+            return option.pep
+        return None
+
     def watch_active_peps(self) -> None:
         """React to the PEPs being changed."""
+        peps = list(self.active_peps)
+        highlighted = self._highlighted_pep
         with self.preserved_highlight:
-            self.clear_options().add_options(PEPView(pep) for pep in self.active_peps)
+            if not self._patch(peps):
+                self.clear_options().add_options(PEPView(pep) for pep in peps)
         if not self.option_count:
             self.post_message(self.Empty())
+        elif (pep := self._highlighted_pep) is not None and pep is not highlighted:
+            # The highlight may have stayed put while the PEP under it
+            # changed; make sure everyone knows about the PEP now there.
+            self.post_message(self.PEPHighlighted(pep))
 
     @dataclass
     class PEPHighlighted(Message):
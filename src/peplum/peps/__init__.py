@@ -2,10 +2,31 @@
 
 ##############################################################################
 # Local imports.
-from .api import API
+from .api import API, PEPIndex, Validators
+from .archive import ArchiveError
+from .cache import SourceCache, WarmingProgress, WarmingReporter, WarmingResult
+from .resilience import CircuitBreaker, RetryPolicy
+from .single_flight import SingleFlight
+from .source_index import SNIPPET_MARKS, SourceHit, SourceIndex, SourceIndexError
 
 ##############################################################################
 # Exports.
-__all__ = ["API"]
+__all__ = [
+    "SNIPPET_MARKS",
+    "API",
+    "ArchiveError",
+    "CircuitBreaker",
+    "PEPIndex",
+    "RetryPolicy",
+    "SingleFlight",
+    "SourceCache",
+    "SourceHit",
+    "SourceIndex",
+    "SourceIndexError",
+    "Validators",
+    "WarmingProgress",
+    "WarmingReporter",
+    "WarmingResult",
+]
 
 ### __init__.py ends here
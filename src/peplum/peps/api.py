@@ -1,14 +1,158 @@
 """Provides a PEP API client class."""
 
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
 ##############################################################################
 # Python imports.
+from asyncio import CancelledError, sleep
+from dataclasses import asdict, dataclass
+from json import dumps, loads
 from pathlib import Path
 from ssl import SSLCertVerificationError
-from typing import Any, Final
+from types import TracebackType
+from typing import Any, AsyncGenerator, Final
 
 ##############################################################################
 # HTTPX imports.
-from httpx import AsyncClient, HTTPStatusError, RequestError, Response
+from httpx import (
+    URL,
+    AsyncBaseTransport,
+    AsyncClient,
+    HTTPStatusError,
+    Limits,
+    RequestError,
+    Response,
+    Timeout,
+    codes,
+)
+
+##############################################################################
+# Typing extensions imports.
+from typing_extensions import Self
+
+##############################################################################
+# Local imports.
+from .resilience import (
+    RETRYABLE_STATUSES,
+    CircuitBreaker,
+    RetryPolicy,
+    parse_retry_after,
+)
+from .single_flight import SingleFlight
+
+
+##############################################################################
+def _certificate_failure(error: BaseException) -> bool:
+    """Was an error caused by a failure to verify a server's certificate?
+
+    Args:
+        error: The error to check.
+
+    Returns:
+        `True` if the certificate of the server couldn't be verified.
+
+    Notes:
+        HTTPX reports a certificate that can't be verified as a failure to
+        connect, so the causes of the error are checked too.
+    """
+    checked: set[int] = set()
+    cause: BaseException | None = error
+    while cause is not None and id(cause) not in checked:
+        if isinstance(cause, SSLCertVerificationError):
+            return True
+        checked.add(id(cause))
+        cause = cause.__cause__ or cause.__context__
+    return False
+
+
+##############################################################################
+@dataclass(frozen=True)
+class Validators:
+    """The cache validators for a resource downloaded from the API."""
+
+    etag: str | None = None
+    """The entity tag of the resource."""
+    last_modified: str | None = None
+    """The last-modified time of the resource."""
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """The conditional request headers for these validators."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["if-none-match"] = self.etag
+        if self.last_modified:
+            headers["if-modified-since"] = self.last_modified
+        return headers
+
+    @classmethod
+    def from_response(cls, response: Response) -> Validators:
+        """Create the validators from a response.
+
+        Args:
+            response: The response to get the validators from.
+
+        Returns:
+            The validators found in the response.
+        """
+        return cls(
+            etag=response.headers.get("etag"),
+            last_modified=response.headers.get("last-modified"),
+        )
+
+    @classmethod
+    def load(cls, source: Path) -> Validators:
+        """Load validators from storage.
+
+        Args:
+            source: The location to load the validators from.
+
+        Returns:
+            The validators.
+
+        Notes:
+            If the validators can't be loaded, an empty set of validators is
+            returned; this simply results in an unconditional request.
+        """
+        try:
+            data = loads(source.read_text(encoding="utf-8"))
+        except (IOError, ValueError):
+            return cls()
+        return (
+            cls(etag=data.get("etag"), last_modified=data.get("last_modified"))
+            if isinstance(data, dict)
+            else cls()
+        )
+
+    def save(self, target: Path) -> Self:
+        """Save the validators to storage.
+
+        Args:
+            target: The location to save the validators to.
+
+        Returns:
+            Self.
+        """
+        target.write_text(dumps(asdict(self), indent=4), encoding="utf-8")
+        return self
+
+
+##############################################################################
+@dataclass(frozen=True)
+class PEPIndex:
+    """The result of requesting the PEP index from the API."""
+
+    peps: dict[str, dict[str, Any]] | None
+    """The raw PEP data, or `None` if it hasn't changed."""
+    validators: Validators
+    """The validators for this version of the PEP index."""
+
+    @property
+    def modified(self) -> bool:
+        """Has the index been modified since it was last downloaded?"""
+        return self.peps is not None
 
 
 ##############################################################################
@@ -21,65 +165,237 @@ class API:
     _URL: Final[str] = "https://peps.python.org/api/peps.json"
     """The URL of the PEP download API."""
 
+    _ARCHIVE_URL: Final[str] = (
+        "https://github.com/python/peps/archive/refs/heads/main.tar.gz"
+    )
+    """The URL of an archive of the PEPs repository."""
+
     class Error(Exception):
         """Base class for Raindrop errors."""
 
     class RequestError(Error):
         """Exception raised if there was a problem making an API request."""
 
-    def __init__(self) -> None:
-        """Initialise the client object."""
+    class Unavailable(RequestError):
+        """Exception raised if a server is known to be unavailable for now."""
+
+    def __init__(
+        self,
+        *,
+        timeout: float = 10.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        retry: RetryPolicy | None = None,
+        breaker_threshold: int = 5,
+        breaker_cool_down: float = 30.0,
+        transport: AsyncBaseTransport | None = None,
+    ) -> None:
+        """Initialise the client object.
+
+        Args:
+            timeout: The timeout, in seconds, for network operations.
+            max_connections: The maximum number of concurrent connections.
+            max_keepalive_connections: The maximum number of idle connections to keep alive.
+            keepalive_expiry: How long, in seconds, to keep an idle connection alive.
+            retry: The policy for retrying failed requests.
+            breaker_threshold: The number of consecutive failures that stop calls to a server.
+            breaker_cool_down: How long, in seconds, calls to a failing server are stopped for.
+            transport: Optional transport to use for the requests.
+        """
+        self._timeout = Timeout(timeout)
+        """The timeout configuration for the client."""
+        self._limits = Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        """The connection pool limits for the client."""
+        self._retry = retry or RetryPolicy()
+        """The policy for retrying failed requests."""
+        self._breaker_threshold = breaker_threshold
+        """The number of consecutive failures that stop calls to a server."""
+        self._breaker_cool_down = breaker_cool_down
+        """How long, in seconds, calls to a failing server are stopped for."""
+        self._breakers: dict[str, CircuitBreaker] = {}
+        """The circuit breakers for each of the servers we talk to."""
+        self._transport = transport
+        """The optional transport to use for the requests."""
         self._client_: AsyncClient | None = None
         """The internal reference to the HTTPX client."""
+        self._index_requests: SingleFlight[tuple[str, Validators], PEPIndex] = (
+            SingleFlight()
+        )
+        """The requests for the PEP index that are in flight."""
+        self._pep_requests: SingleFlight[int, str] = SingleFlight()
+        """The requests for PEP sources that are in flight."""
 
     @property
     def _client(self) -> AsyncClient:
-        """The HTTPX client."""
+        """The HTTPX client.
+
+        Notes:
+            The client is created on first use and then reused for the
+            lifetime of the API object, so connections are pooled and kept
+            alive between requests.
+        """
         if self._client_ is None:
-            self._client_ = AsyncClient()
+            self._client_ = AsyncClient(
+                headers={"user-agent": self.AGENT},
+                timeout=self._timeout,
+                limits=self._limits,
+                transport=self._transport,
+            )
         return self._client_
 
-    async def _get(self, url: str) -> Response:
+    async def close(self) -> None:
+        """Close the API client, releasing any pooled connections."""
+        if self._client_ is not None:
+            await self._client_.aclose()
+            self._client_ = None
+
+    async def __aenter__(self) -> Self:
+        """Use the API client as an async context manager.
+
+        Returns:
+            The API client.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the API client when leaving the context.
+
+        Args:
+            exc_type: The type of any exception raised within the context.
+            exc_value: Any exception raised within the context.
+            traceback: The traceback of any exception raised within the context.
+        """
+        await self.close()
+
+    def _breaker(self, url: str) -> CircuitBreaker:
+        """Get the circuit breaker for the server of a URL.
+
+        Args:
+            url: The URL to get the circuit breaker for.
+
+        Returns:
+            The circuit breaker for the server.
+
+        Raises:
+            API.Unavailable: If the breaker is open.
+        """
+        host = URL(url).host
+        if (breaker := self._breakers.get(host)) is None:
+            breaker = self._breakers[host] = CircuitBreaker(
+                self._breaker_threshold, self._breaker_cool_down
+            )
+        if not breaker.allow():
+            raise self.Unavailable(
+                f"{host} is having problems; "
+                + (
+                    f"not trying it again for {breaker.retry_in:.0f} seconds"
+                    if breaker.retry_in
+                    else "waiting to see if it has recovered"
+                )
+            )
+        return breaker
+
+    async def _get(self, url: str, headers: dict[str, str] | None = None) -> Response:
         """Make a GET request.
 
         Args:
             url: The URL to make the request of.
+            headers: Optional extra headers to send with the request.
 
         Returns:
             The response.
 
         Raises:
             API.RequestError: If there was some sort of error.
+            API.Unavailable: If the server is known to be unavailable.
+
+        Notes:
+            Requests that fail in a way that is worth retrying are retried
+            according to the retry policy; a server whose certificate can't
+            be verified isn't worth retrying. If a server keeps failing,
+            calls to it are stopped for a while.
         """
+        breaker = self._breaker(url)
+        attempt = 0
         try:
-            response = await self._client.get(url, headers={"user-agent": self.AGENT})
-        except (RequestError, SSLCertVerificationError) as error:
-            raise self.RequestError(str(error)) from None
+            while True:
+                attempt += 1
+                retry_after: float | None = None
+                try:
+                    response = await self._client.get(url, headers=headers)
+                except RequestError as error:
+                    if _certificate_failure(error):
+                        breaker.abandoned()
+                        raise self.RequestError(str(error)) from None
+                    failure = str(error)
+                else:
+                    if response.status_code not in RETRYABLE_STATUSES:
+                        break
+                    failure = (
+                        f"{response.status_code} {response.reason_phrase} for {url}"
+                    )
+                    retry_after = parse_retry_after(response.headers.get("retry-after"))
+                if (delay := self._retry.delay(attempt, retry_after)) is None:
+                    breaker.failed()
+                    raise self.RequestError(failure)
+                await sleep(delay)
+        except CancelledError:
+            breaker.abandoned()
+            raise
+        breaker.succeeded()
 
         try:
-            response.raise_for_status()
+            # A "not modified" response is a redirect as far as HTTPX is
+            # concerned, but it's one we're expecting in reply to a
+            # conditional request.
+            if response.status_code != codes.NOT_MODIFIED:
+                response.raise_for_status()
         except HTTPStatusError as error:
             raise self.RequestError(str(error)) from None
 
         return response
 
-    async def get_peps(self) -> dict[int, dict[str, Any]]:
+    async def get_peps(self, validators: Validators | None = None) -> PEPIndex:
         """Download a fresh list of all known PEPs.
 
+        Args:
+            validators: Optional validators from the last download.
+
         Returns:
-            The PEP JSON data.
+            The PEP index.
 
         Raises:
             API.RequestError: If there was a problem getting the PEPS.
+
+        Notes:
+            If validators are provided the request is made conditional; if
+            the PEP index hasn't changed since they were obtained the
+            returned index will have no PEP data.
+
+            Concurrent calls with the same validators share a single
+            request.
         """
-        if isinstance(
-            raw_data := (
-                await self._get("https://peps.python.org/api/peps.json")
-            ).json(),
-            dict,
-        ):
-            return raw_data
-        raise self.RequestError("Unexpected data received from the PEP API")
+        validators = validators or Validators()
+
+        async def get_peps() -> PEPIndex:
+            response = await self._get(self._URL, validators.headers)
+            if response.status_code == codes.NOT_MODIFIED:
+                return PEPIndex(None, validators)
+            if isinstance(raw_data := response.json(), dict):
+                return PEPIndex(raw_data, Validators.from_response(response))
+            raise self.RequestError("Unexpected data received from the PEP API")
+
+        return await self._index_requests.call((self._URL, validators), get_peps)
 
     @staticmethod
     def pep_file(pep: int) -> Path:
@@ -113,8 +429,44 @@ class API:
 
         Returns:
             The text for the PEP.
+
+        Notes:
+            Concurrent calls for the same PEP share a single request.
         """
-        return (await self._get(self.pep_url(pep))).text
+
+        async def get_pep() -> str:
+            return (await self._get(self.pep_url(pep))).text
+
+        return await self._pep_requests.call(pep, get_pep)
+
+    async def get_archive(self) -> AsyncGenerator[bytes, None]:
+        """Download an archive of the PEPs repository.
+
+        Yields:
+            The gzipped tarball of the repository, in chunks.
+
+        Raises:
+            API.RequestError: If there was a problem downloading the archive.
+
+        Notes:
+            The archive is streamed, so it is never held in memory in its
+            entirety. Because of this, a failed download is not retried.
+        """
+        breaker = self._breaker(self._ARCHIVE_URL)
+        try:
+            async with self._client.stream(
+                "GET", self._ARCHIVE_URL, follow_redirects=True
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+        except (RequestError, HTTPStatusError) as error:
+            breaker.failed()
+            raise self.RequestError(str(error)) from None
+        except (CancelledError, GeneratorExit):
+            breaker.abandoned()
+            raise
+        breaker.succeeded()
 
 
 ### api.py ends here
@@ -0,0 +1,150 @@
+"""Provides tools for pulling PEP sources out of an archive of the PEPs repository."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from asyncio import AbstractEventLoop, Lock, run_coroutine_threadsafe
+from io import RawIOBase
+from re import Pattern, compile
+from tarfile import TarError
+from tarfile import open as open_tar
+from threading import Event
+from typing import IO, TYPE_CHECKING, AsyncGenerator, Callable, Final
+
+##############################################################################
+# Type checking imports.
+if TYPE_CHECKING:
+    from _typeshed import WriteableBuffer
+
+##############################################################################
+PEP_SOURCE: Final[Pattern[str]] = compile(r"^[^/]+/peps/pep-(?P<number>\d{4})\.rst$")
+"""Regular expression for spotting a PEP source within the repository archive."""
+
+
+##############################################################################
+class ArchiveError(Exception):
+    """Exception raised if there is a problem with an archive."""
+
+
+##############################################################################
+class AsyncStreamReader(RawIOBase):
+    """A synchronous, readable, file-like view of an asynchronous byte stream.
+
+    This is designed to be read from within a thread, pulling chunks of data
+    from an asynchronous generator that is running on an event loop in
+    another thread. Chunks are only pulled from the iterator as the reader
+    asks for them, so no more than one chunk is held in memory at any time.
+    """
+
+    def __init__(
+        self, chunks: AsyncGenerator[bytes, None], loop: AbstractEventLoop
+    ) -> None:
+        """Initialise the reader.
+
+        Args:
+            chunks: The asynchronous generator of chunks of data.
+            loop: The event loop that the generator runs on.
+        """
+        super().__init__()
+        self._chunks = chunks
+        """The asynchronous generator of chunks of data."""
+        self._loop = loop
+        """The event loop that the generator runs on."""
+        self._lock = Lock()
+        """Lock that ensures only one thing at a time works with the generator."""
+        self._pending = b""
+        """The data that has been pulled but not yet read."""
+        self._abandoned = False
+        """Has the reader been abandoned?"""
+
+    def abandon(self) -> None:
+        """Abandon reading; any further attempt to read will fail."""
+        self._abandoned = True
+
+    async def aclose(self) -> None:
+        """Abandon reading and close the underlying generator.
+
+        Notes:
+            This must be awaited on the event loop that the generator runs
+            on.
+        """
+        self.abandon()
+        async with self._lock:
+            await self._chunks.aclose()
+
+    def readable(self) -> bool:
+        return True
+
+    async def _next_chunk(self) -> bytes:
+        """Get the next chunk of data from the stream.
+
+        Returns:
+            The next chunk of data, or an empty chunk at the end of the stream.
+        """
+        async with self._lock:
+            try:
+                return await self._chunks.__anext__()
+            except StopAsyncIteration:
+                return b""
+
+    def readinto(self, buffer: WriteableBuffer) -> int:
+        while not self._pending:
+            if self._abandoned:
+                raise ArchiveError("Reading of the archive was abandoned")
+            if not (
+                chunk := run_coroutine_threadsafe(
+                    self._next_chunk(), self._loop
+                ).result()
+            ):
+                return 0
+            self._pending = chunk
+        target = memoryview(buffer).cast("B")
+        size = min(len(target), len(self._pending))
+        target[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+##############################################################################
+def extract_sources(
+    archive: IO[bytes],
+    store: Callable[[int, str], None],
+    stop: Event | None = None,
+) -> int:
+    """Extract the PEP sources from an archive of the PEPs repository.
+
+    Args:
+        archive: The gzipped tarball of the PEPs repository.
+        store: A function to call to store each PEP source that is found.
+        stop: An optional event that, once set, stops the extraction.
+
+    Returns:
+        The number of PEP sources that were found.
+
+    Raises:
+        ArchiveError: If the archive couldn't be read.
+
+    Notes:
+        The archive is read as a stream, one member at a time, so only the
+        current PEP source is ever held in memory. If the extraction is
+        stopped, the count is of the PEP sources found until then.
+    """
+    found = 0
+    try:
+        with open_tar(fileobj=archive, mode="r|gz") as tarball:
+            for member in tarball:
+                if stop is not None and stop.is_set():
+                    break
+                if member.isfile() and (match := PEP_SOURCE.match(member.name)):
+                    if (source := tarball.extractfile(member)) is not None:
+                        store(int(match["number"]), source.read().decode("utf-8"))
+                        found += 1
+    except (TarError, EOFError, UnicodeDecodeError) as error:
+        raise ArchiveError(f"Unable to read the PEP archive: {error}") from None
+    return found
+
+
+### archive.py ends here
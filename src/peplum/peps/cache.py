@@ -0,0 +1,325 @@
+"""Provides a local cache of PEP sources."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from asyncio import gather, get_running_loop, to_thread
+from contextlib import suppress
+from dataclasses import dataclass, field
+from io import BufferedReader
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Event
+from typing import IO, Callable, Iterable, Iterator
+
+##############################################################################
+# Local imports.
+from .api import API
+from .archive import AsyncStreamReader, extract_sources
+from .single_flight import SingleFlight
+
+
+##############################################################################
+@dataclass(frozen=True)
+class WarmingProgress:
+    """Details of the progress being made warming the source cache."""
+
+    pep: int
+    """The number of the PEP that was just handled."""
+    done: int
+    """The number of PEPs handled so far."""
+    total: int | None
+    """The total number of PEPs that need handling, if known."""
+    error: str | None = None
+    """The error, if the PEP couldn't be downloaded."""
+
+
+##############################################################################
+@dataclass(frozen=True)
+class WarmingResult:
+    """The result of warming the source cache."""
+
+    downloaded: int = 0
+    """The number of PEP sources that were downloaded."""
+    skipped: int = 0
+    """The number of PEP sources that were already in the cache."""
+    failed: dict[int, str] = field(default_factory=dict)
+    """The PEPs that couldn't be downloaded, and why."""
+
+
+##############################################################################
+WarmingReporter = Callable[[WarmingProgress], None]
+"""The type of a function that is told about progress warming the cache."""
+
+
+##############################################################################
+class SourceCache:
+    """A local cache of the sources of PEPs."""
+
+    def __init__(self, api: API, location: Path) -> None:
+        """Initialise the object.
+
+        Args:
+            api: The API client to use to download PEP sources.
+            location: The directory that holds the cached sources.
+        """
+        self._api = api
+        """The API client to use to download PEP sources."""
+        self._location = location
+        """The directory that holds the cached sources."""
+        self._downloads: SingleFlight[int, tuple[str, OSError | None]] = SingleFlight()
+        """The downloads of PEP sources that are in flight."""
+
+    def source_file(self, pep: int) -> Path:
+        """Get the location of the cached source of a PEP.
+
+        Args:
+            pep: The number of the PEP.
+
+        Returns:
+            The path to the cached source of the PEP.
+        """
+        return self._location / API.pep_file(pep)
+
+    def __contains__(self, pep: int) -> bool:
+        """Is the source of the given PEP in the cache?"""
+        return self.source_file(pep).exists()
+
+    def cached(self) -> Iterator[int]:
+        """Get the PEPs whose sources are in the cache.
+
+        Yields:
+            The number of each PEP whose source is in the cache.
+        """
+        for source in self._location.glob("pep-*.rst"):
+            with suppress(ValueError):
+                yield int(source.stem.removeprefix("pep-"))
+
+    def _store(self, pep: int, source: str) -> None:
+        """Store the source of a PEP in the cache.
+
+        Args:
+            pep: The number of the PEP.
+            source: The source of the PEP.
+
+        Raises:
+            OSError: If there was a problem storing the source.
+
+        Notes:
+            The source is written to a temporary file that is then moved
+            into place, so a reader will never see a partially-written
+            source, and an interrupted write never looks like a cached PEP.
+        """
+        target = self.source_file(pep)
+        with NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=self._location,
+            prefix=f".{target.name}.",
+            delete=False,
+        ) as temporary:
+            temporary.write(source)
+        try:
+            Path(temporary.name).replace(target)
+        finally:
+            Path(temporary.name).unlink(missing_ok=True)
+
+    def forget(self, pep: int) -> None:
+        """Remove the cached source of a PEP.
+
+        Args:
+            pep: The number of the PEP.
+
+        Raises:
+            OSError: If there was a problem removing the source.
+        """
+        self.source_file(pep).unlink(missing_ok=True)
+
+    async def download(self, pep: int, must_store: bool = False) -> str:
+        """Download the source of a PEP, placing it in the cache.
+
+        Args:
+            pep: The number of the PEP.
+            must_store: Must the source be stored in the cache?
+
+        Returns:
+            The source of the PEP.
+
+        Raises:
+            API.RequestError: If there was a problem downloading the source.
+            OSError: If `must_store` is set and the source couldn't be stored.
+
+        Notes:
+            Unless `must_store` is set, storing the source in the cache is
+            done on a best-effort basis; if it can't be stored the source
+            is still returned.
+
+            Concurrent downloads of the same PEP share a single download,
+            and a single write to the cache.
+        """
+
+        async def download() -> tuple[str, OSError | None]:
+            source = await self._api.get_pep(pep)
+            try:
+                self._store(pep, source)
+            except OSError as error:
+                return source, error
+            return source, None
+
+        source, error = await self._downloads.call(pep, download)
+        if must_store and error is not None:
+            raise error
+        return source
+
+    async def get(self, pep: int) -> str:
+        """Get the source of a PEP.
+
+        Args:
+            pep: The number of the PEP.
+
+        Returns:
+            The source of the PEP.
+
+        Raises:
+            API.RequestError: If there was a problem downloading the source.
+
+        Notes:
+            If the source is in the cache the cached copy is used,
+            otherwise it is downloaded and then cached.
+        """
+        with suppress(OSError):
+            if source := self.source_file(pep).read_text(encoding="utf-8"):
+                return source
+        return await self.download(pep)
+
+    async def warm(
+        self,
+        peps: Iterable[int],
+        concurrency: int = 8,
+        reporter: WarmingReporter | None = None,
+    ) -> WarmingResult:
+        """Warm the cache by downloading the sources of the given PEPs.
+
+        Args:
+            peps: The numbers of the PEPs to download the sources of.
+            concurrency: The maximum number of downloads to run at once.
+            reporter: Optional function to report progress to.
+
+        Returns:
+            The result of warming the cache.
+
+        Notes:
+            Any PEP whose source is already in the cache is skipped, so if
+            the warming of the cache is cancelled it can be resumed by
+            simply warming the cache again.
+        """
+        peps = tuple(dict.fromkeys(peps))
+        wanted = tuple(pep for pep in peps if pep not in self)
+        pending = iter(wanted)
+        failed: dict[int, str] = {}
+        done = 0
+
+        async def download() -> None:
+            nonlocal done
+            for pep in pending:
+                error: str | None = None
+                try:
+                    await self.download(pep, must_store=True)
+                except (API.RequestError, OSError) as download_error:
+                    failed[pep] = error = str(download_error)
+                done += 1
+                if reporter is not None:
+                    reporter(WarmingProgress(pep, done, len(wanted), error))
+
+        await gather(
+            *(download() for _ in range(min(max(1, concurrency), len(wanted))))
+        )
+        return WarmingResult(
+            downloaded=len(wanted) - len(failed),
+            skipped=len(peps) - len(wanted),
+            failed=failed,
+        )
+
+    def sync_from_archive(
+        self,
+        archive: IO[bytes],
+        reporter: WarmingReporter | None = None,
+        stop: Event | None = None,
+    ) -> WarmingResult:
+        """Populate the cache from an archive of the PEPs repository.
+
+        Args:
+            archive: The gzipped tarball of the PEPs repository.
+            reporter: Optional function to report progress to.
+            stop: An optional event that, once set, stops populating the cache.
+
+        Returns:
+            The result of populating the cache.
+
+        Raises:
+            ArchiveError: If there was a problem reading the archive.
+            OSError: If there was a problem storing a PEP source.
+
+        Notes:
+            Every PEP source found in the archive is stored, replacing any
+            copy that is already in the cache. Once stopped, no further PEP
+            sources are taken from the archive, and no more progress is
+            reported.
+        """
+        done = 0
+
+        def store(pep: int, source: str) -> None:
+            nonlocal done
+            self._store(pep, source)
+            done += 1
+            if reporter is not None and not (stop is not None and stop.is_set()):
+                reporter(WarmingProgress(pep, done, None))
+
+        return WarmingResult(downloaded=extract_sources(archive, store, stop))
+
+    async def sync(self, reporter: WarmingReporter | None = None) -> WarmingResult:
+        """Populate the cache from a freshly-downloaded archive of the PEPs repository.
+
+        Args:
+            reporter: Optional function to report progress to.
+
+        Returns:
+            The result of populating the cache.
+
+        Raises:
+            API.RequestError: If there was a problem downloading the archive.
+            ArchiveError: If there was a problem reading the archive.
+            OSError: If there was a problem storing a PEP source.
+
+        Notes:
+            This makes a single request for the whole repository, rather
+            than one request per PEP. The archive is streamed and unpacked
+            as it arrives, so it is never held in memory in its entirety.
+            The reporter, if given, is called on the calling event loop. If
+            this is cancelled, the thread populating the cache is stopped,
+            and the reporter isn't called again.
+        """
+        loop = get_running_loop()
+        stop = Event()
+
+        def deliver(progress: WarmingProgress) -> None:
+            if reporter is not None and not stop.is_set():
+                reporter(progress)
+
+        def report(progress: WarmingProgress) -> None:
+            loop.call_soon_threadsafe(deliver, progress)
+
+        reader = AsyncStreamReader(self._api.get_archive(), loop)
+        try:
+            return await to_thread(
+                self.sync_from_archive, BufferedReader(reader), report, stop
+            )
+        finally:
+            stop.set()
+            await reader.aclose()
+
+
+### cache.py ends here
@@ -0,0 +1,169 @@
+"""Provides tools for making requests of a server resilient to failure."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from random import uniform
+from time import monotonic
+from typing import Callable, Final
+
+##############################################################################
+RETRYABLE_STATUSES: Final[frozenset[int]] = frozenset({429, 500, 502, 503, 504})
+"""HTTP status codes that indicate that a request is worth retrying."""
+
+
+##############################################################################
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse the value of a `Retry-After` header.
+
+    Args:
+        value: The value of the header.
+
+    Returns:
+        The number of seconds to wait, or `None` if there's no usable value.
+
+    Notes:
+        `Retry-After` can either be a number of seconds, or an HTTP date.
+    """
+    if not (value := (value or "").strip()):
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+##############################################################################
+@dataclass(frozen=True)
+class RetryPolicy:
+    """The policy for retrying failed requests."""
+
+    retries: int = 3
+    """The number of times to retry a failed request."""
+    backoff: float = 0.5
+    """The base delay, in seconds, before the first retry."""
+    max_backoff: float = 10.0
+    """The maximum delay, in seconds, before any retry."""
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float | None:
+        """Get the delay before retrying a request.
+
+        Args:
+            attempt: The number of the attempt that just failed, from 1.
+            retry_after: The delay the server asked for, if it asked.
+
+        Returns:
+            The number of seconds to wait, or `None` if there should be no retry.
+
+        Notes:
+            The delay grows exponentially with each attempt, with "full
+            jitter" applied so that clients that failed together don't
+            retry together. If the server has asked for a specific delay
+            that is honoured; if it's asked for longer than the maximum
+            backoff there will be no retry.
+        """
+        if attempt > self.retries:
+            return None
+        if retry_after is not None:
+            return retry_after if retry_after <= self.max_backoff else None
+        return uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+
+##############################################################################
+class CircuitBreaker:
+    """A circuit breaker that stops calls to a failing service for a while.
+
+    After a number of consecutive failures the breaker opens, and stays
+    open for a cool-down period. Once the cool-down has passed, a single
+    trial call is allowed through, and every other call is stopped until
+    the outcome of that call is known; if it succeeds the breaker closes
+    again, if it fails the breaker opens for another cool-down period.
+    """
+
+    def __init__(
+        self,
+        threshold: int = 5,
+        cool_down: float = 30.0,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """Initialise the circuit breaker.
+
+        Args:
+            threshold: The number of consecutive failures that opens the breaker.
+            cool_down: The number of seconds the breaker stays open for.
+            clock: The clock to use to time the cool-down.
+        """
+        self._threshold = threshold
+        """The number of consecutive failures that opens the breaker."""
+        self._cool_down = cool_down
+        """The number of seconds the breaker stays open for."""
+        self._clock = clock
+        """The clock to use to time the cool-down."""
+        self._failures = 0
+        """The count of consecutive failures."""
+        self._opened_at: float | None = None
+        """The time the breaker was opened, if it is open."""
+        self._trying = False
+        """Is a trial call under way?"""
+
+    @property
+    def retry_in(self) -> float:
+        """The number of seconds until calls will be allowed again.
+
+        This is zero if calls are allowed now.
+        """
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self._cool_down - self._clock())
+
+    @property
+    def is_open(self) -> bool:
+        """Is the breaker open, stopping calls?"""
+        return self._trying or self.retry_in > 0
+
+    def allow(self) -> bool:
+        """Ask to make a call.
+
+        Returns:
+            `True` if the call can be made, `False` if the breaker is open.
+
+        Notes:
+            If the cool-down has passed, the call that is allowed is the
+            trial call; its outcome must then be recorded with `succeeded`,
+            `failed` or `abandoned`.
+        """
+        if self.is_open:
+            return False
+        self._trying = self._opened_at is not None
+        return True
+
+    def succeeded(self) -> None:
+        """Record that a call succeeded."""
+        self._failures = 0
+        self._opened_at = None
+        self._trying = False
+
+    def failed(self) -> None:
+        """Record that a call failed."""
+        self._trying = False
+        self._failures += 1
+        if self._opened_at is not None or self._failures >= self._threshold:
+            self._opened_at = self._clock()
+
+    def abandoned(self) -> None:
+        """Record that a call was given up on before its outcome was known."""
+        self._trying = False
+
+
+### resilience.py ends here
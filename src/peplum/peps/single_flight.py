@@ -0,0 +1,78 @@
+"""Provides a tool for coalescing concurrent requests for the same thing."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from asyncio import Task, create_task, shield
+from typing import Callable, Coroutine, Generic, Hashable, TypeVar
+
+##############################################################################
+KeyT = TypeVar("KeyT", bound=Hashable)
+"""The type of the key that identifies a call."""
+
+ResultT = TypeVar("ResultT")
+"""The type of the result of a call."""
+
+
+##############################################################################
+class SingleFlight(Generic[KeyT, ResultT]):
+    """Ensures that only one call for a given key is in flight at any time.
+
+    If a call is made for a key while a call for that key is already in
+    flight, rather than making a second call the caller waits on the call
+    that is in flight and shares its result, or its exception.
+    """
+
+    def __init__(self) -> None:
+        """Initialise the object."""
+        self._in_flight: dict[KeyT, Task[ResultT]] = {}
+        """The calls that are currently in flight."""
+
+    def __contains__(self, key: KeyT) -> bool:
+        """Is a call for the given key in flight?"""
+        return key in self._in_flight
+
+    def __len__(self) -> int:
+        """The number of calls that are in flight."""
+        return len(self._in_flight)
+
+    def _landed(self, key: KeyT, call: Task[ResultT]) -> None:
+        """Handle a call that has finished.
+
+        Args:
+            key: The key for the call.
+            call: The call that has finished.
+        """
+        if self._in_flight.get(key) is call:
+            del self._in_flight[key]
+        # Every caller could have been cancelled while the call carried on;
+        # retrieve any exception so it isn't reported as never retrieved.
+        if not call.cancelled():
+            call.exception()
+
+    async def call(
+        self, key: KeyT, make_call: Callable[[], Coroutine[None, None, ResultT]]
+    ) -> ResultT:
+        """Make a call, or join the call already in flight for the same key.
+
+        Args:
+            key: The key that identifies the call.
+            make_call: A function that makes the call.
+
+        Returns:
+            The result of the call.
+
+        Notes:
+            Cancelling a caller doesn't cancel the call itself, as other
+            callers may be waiting on it.
+        """
+        if (in_flight := self._in_flight.get(key)) is None:
+            in_flight = self._in_flight[key] = create_task(make_call())
+            in_flight.add_done_callback(lambda call: self._landed(key, call))
+        return await shield(in_flight)
+
+
+### single_flight.py ends here
@@ -0,0 +1,480 @@
+"""Provides an on-disk full-text index of the sources of PEPs."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import closing, contextmanager, redirect_stderr, suppress
+from dataclasses import dataclass
+from hashlib import blake2b
+from multiprocessing import get_context
+from multiprocessing.resource_tracker import ensure_running
+from os import cpu_count
+from os import name as os_name
+from pathlib import Path
+from re import MULTILINE, Match, Pattern, compile
+from sqlite3 import Connection, Error, connect
+from sys import __stderr__
+from threading import Lock
+from typing import Final, Iterable, Iterator, Sequence
+
+##############################################################################
+# Local imports.
+from .cache import SourceCache
+
+##############################################################################
+SNIPPET_TOKENS: Final[int] = 16
+"""The most tokens to show in a snippet of a matching source."""
+
+##############################################################################
+SNIPPET_MARKS: Final[tuple[str, str]] = ("\x02", "\x03")
+"""The marks placed around the matching text within a snippet.
+
+These are control characters so they can't be confused with anything in
+the source, and can be swapped for whatever highlighting the caller wants.
+"""
+
+##############################################################################
+INDEX_VERSION: Final[int] = 1
+"""The version of the way sources are prepared for the index.
+
+If this changes, every source is indexed again.
+"""
+
+##############################################################################
+CHUNK_SIZE: Final[int] = 16
+"""The number of sources prepared for the index as one batch."""
+
+##############################################################################
+BUSY_TIMEOUT: Final[float] = 30.0
+"""How long, in seconds, to wait for another connection to finish with the index."""
+
+##############################################################################
+_TARGETS: Final[Pattern[str]] = compile(r"^[ \t]*\.\. _[^\n]*$", MULTILINE)
+"""Regular expression for the hyperlink targets in reStructuredText."""
+
+_ADORNMENTS: Final[Pattern[str]] = compile(
+    r"^([=\-~^\"'`#*+:.])\1{3,}[ \t]*$", MULTILINE
+)
+"""Regular expression for the adornments of sections in reStructuredText."""
+
+_DIRECTIVES: Final[Pattern[str]] = compile(r"^([ \t]*)\.\.(?: [\w:-]+::)?", MULTILINE)
+"""Regular expression for the start of directives and comments in reStructuredText."""
+
+_LITERALS: Final[Pattern[str]] = compile(r"``(.+?)``")
+"""Regular expression for inline literals in reStructuredText."""
+
+_INTERPRETED: Final[Pattern[str]] = compile(
+    r"(?::[\w:+-]+:`|`)([^`]+)`(?::[\w:+-]+:)?_{0,2}"
+)
+"""Regular expression for roles and hyperlinks in reStructuredText."""
+
+_TARGET: Final[Pattern[str]] = compile(r"(.*?)\s*<([^<>]*)>$", MULTILINE)
+"""Regular expression for the title and target of a role or hyperlink."""
+
+_EMPHASIS: Final[Pattern[str]] = compile(r"\*\*?(?:(?=\w)|(?<=\w\*)|(?<=\w\*\*))")
+"""Regular expression for the markers of emphasis in reStructuredText."""
+
+
+##############################################################################
+def _interpreted(text: Match[str]) -> str:
+    """Get the text to index for a role or hyperlink.
+
+    Args:
+        text: The match of the role or hyperlink.
+
+    Returns:
+        The title of the role or hyperlink, or its target if it has no title.
+    """
+    if target := _TARGET.match(text[1]):
+        return target[1] or target[2]
+    return text[1]
+
+
+##############################################################################
+def plain_text(source: str) -> str:
+    """Reduce the source of a PEP to the text worth indexing.
+
+    Args:
+        source: The reStructuredText source of a PEP.
+
+    Returns:
+        The source, with most of the reStructuredText markup removed.
+
+    Notes:
+        This isn't a full parse of reStructuredText; it just removes the
+        markup that would otherwise get in the way of searching the text,
+        or of reading a snippet of it.
+    """
+    source = _ADORNMENTS.sub("", _TARGETS.sub("", source))
+    source = _DIRECTIVES.sub(r"\1", source)
+    source = _INTERPRETED.sub(_interpreted, _LITERALS.sub(r"\1", source))
+    return _EMPHASIS.sub("", source)
+
+
+##############################################################################
+@dataclass(frozen=True)
+class PreparedSource:
+    """The source of a PEP, prepared for the index."""
+
+    pep: int
+    """The number of the PEP."""
+    size: int
+    """The size of the source file."""
+    modified: int
+    """The modification time of the source file, in nanoseconds."""
+    digest: str
+    """The hash of the content of the source file."""
+    text: str
+    """The text of the source to index."""
+
+
+##############################################################################
+def prepare_sources(files: Sequence[tuple[int, Path]]) -> list[PreparedSource]:
+    """Prepare some PEP sources for the index.
+
+    Args:
+        files: The numbers of the PEPs and the files holding their sources.
+
+    Returns:
+        The prepared sources.
+
+    Notes:
+        This is the part of indexing that can be spread over several
+        processes. A source that can't be read is left out; it'll be tried
+        again the next time the index catches up.
+    """
+    prepared: list[PreparedSource] = []
+    for pep, source_file in files:
+        with suppress(OSError, UnicodeDecodeError):
+            status = source_file.stat()
+            content = source_file.read_bytes()
+            prepared.append(
+                PreparedSource(
+                    pep,
+                    status.st_size,
+                    status.st_mtime_ns,
+                    blake2b(content, digest_size=16).hexdigest(),
+                    plain_text(content.decode("utf-8")),
+                )
+            )
+    return prepared
+
+
+##############################################################################
+class SourceIndexError(Exception):
+    """Exception raised if there is a problem with the index of PEP sources."""
+
+
+##############################################################################
+@dataclass(frozen=True)
+class SourceHit:
+    """A PEP whose source matches a search."""
+
+    pep: int
+    """The number of the PEP."""
+    rank: float
+    """The BM25 rank of the match; lower is better."""
+    snippet: str
+    """A snippet of the source around the matching text."""
+
+
+##############################################################################
+class SourceIndex:
+    """An on-disk full-text index of the sources of PEPs.
+
+    The index is a SQLite FTS5 table, with the number of each PEP as the
+    row ID; matches are ranked with BM25. Searching the index never reads
+    the sources themselves.
+
+    Alongside the index, the size, modification time and hash of each
+    cached source that was indexed is kept, so that bringing the index up
+    to date only needs to read the sources that have changed.
+
+    When a lot of sources need to be indexed, the work of reading and
+    preparing them is spread over a pool of processes, in batches; the
+    prepared sources are added to the index, by this process, as each batch
+    comes back, and each batch is committed as it's added.
+
+    Updates of the index made through one `SourceIndex` are made one at a
+    time; searches can be made while the index is being updated.
+    """
+
+    def __init__(
+        self, database: Path, workers: int = 0, chunk_size: int = CHUNK_SIZE
+    ) -> None:
+        """Initialise the object.
+
+        Args:
+            database: The file that holds the index.
+            workers: The number of processes to prepare sources with.
+            chunk_size: The number of sources prepared as one batch.
+
+        Notes:
+            If `workers` is zero or less, one process for each CPU core is
+            used; if it is one, sources are prepared within this process.
+        """
+        self._database = database
+        """The file that holds the index."""
+        self._workers = workers if workers > 0 else cpu_count() or 1
+        """The number of processes to prepare sources with."""
+        self._chunk_size = max(1, chunk_size)
+        """The number of sources prepared as one batch."""
+        self._updating = Lock()
+        """The lock held while the index is being updated."""
+
+    @contextmanager
+    def _connection(self) -> Iterator[Connection]:
+        """Connect to the index, creating it if needed.
+
+        Yields:
+            The connection, within a transaction.
+
+        Raises:
+            SourceIndexError: If there was a problem using the index.
+
+        Notes:
+            Each use of the index has its own connection, so the index can
+            be used from any thread.
+        """
+        try:
+            self._database.parent.mkdir(parents=True, exist_ok=True)
+            with (
+                closing(connect(self._database, timeout=BUSY_TIMEOUT)) as connection,
+                connection,
+            ):
+                connection.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS sources "
+                    "USING fts5(source, tokenize='porter unicode61')"
+                )
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS files ("
+                    "pep INTEGER PRIMARY KEY, size INTEGER, modified INTEGER, "
+                    "digest TEXT)"
+                )
+                # If the sources were prepared differently when they were
+                # indexed, forget what was known about them so that they
+                # all get indexed again.
+                (version,) = connection.execute("PRAGMA user_version").fetchone()
+                if version != INDEX_VERSION:
+                    connection.execute("DELETE FROM files")
+                    connection.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+                    connection.commit()
+                yield connection
+        except (Error, OSError) as error:
+            raise SourceIndexError(str(error)) from error
+
+    def __len__(self) -> int:
+        """The count of PEP sources in the index."""
+        with self._connection() as index:
+            return int(index.execute("SELECT count(*) FROM sources").fetchone()[0])
+
+    @property
+    def indexed(self) -> set[int]:
+        """The numbers of the PEPs whose sources are in the index."""
+        with self._connection() as index:
+            return {pep for (pep,) in index.execute("SELECT rowid FROM sources")}
+
+    def add(self, pep: int, source: str) -> None:
+        """Add the source of a PEP to the index.
+
+        Args:
+            pep: The number of the PEP.
+            source: The source of the PEP.
+
+        Raises:
+            SourceIndexError: If there was a problem updating the index.
+
+        Notes:
+            Any source already indexed for the PEP is replaced. As the source
+            didn't come from the cache, the cached source will be checked
+            again the next time the index catches up.
+        """
+        with self._updating, self._connection() as index:
+            self._replace(index, pep, source)
+            index.execute("DELETE FROM files WHERE pep = ?", (pep,))
+
+    @staticmethod
+    def _replace(index: Connection, pep: int, source: str) -> None:
+        """Replace the indexed source of a PEP.
+
+        Args:
+            index: The connection to the index.
+            pep: The number of the PEP.
+            source: The source of the PEP.
+        """
+        index.execute("DELETE FROM sources WHERE rowid = ?", (pep,))
+        index.execute(
+            "INSERT INTO sources (rowid, source) VALUES (?, ?)", (pep, source)
+        )
+
+    def forget(self, pep: int) -> None:
+        """Remove the source of a PEP from the index.
+
+        Args:
+            pep: The number of the PEP.
+
+        Raises:
+            SourceIndexError: If there was a problem updating the index.
+        """
+        with self._updating, self._connection() as index:
+            index.execute("DELETE FROM sources WHERE rowid = ?", (pep,))
+            index.execute("DELETE FROM files WHERE pep = ?", (pep,))
+
+    def catch_up(self, cache: SourceCache, peps: Iterable[int] | None = None) -> int:
+        """Bring the index up to date with a cache of sources.
+
+        Args:
+            cache: The cache of PEP sources.
+            peps: The PEPs to check, or `None` to check every PEP.
+
+        Returns:
+            The number of sources that were added to, updated in, or
+            removed from the index.
+
+        Raises:
+            SourceIndexError: If there was a problem updating the index.
+
+        Notes:
+            Only a source whose size or modification time differs from when
+            it was last indexed is read; and it is only indexed again if its
+            content has actually changed. Sources that are no longer cached
+            are removed from the index. A source that can't be read is
+            skipped; it'll be tried again the next time the index catches
+            up. The sources are reduced to plain text, with `plain_text`,
+            before they're indexed. Each batch of sources is committed as
+            it's indexed, so the index is never locked for long, and what's
+            been indexed so far can be searched.
+        """
+        changed = 0
+        checking = None if peps is None else set(peps)
+        with self._updating, self._connection() as index:
+            known: dict[int, tuple[int, int, str]] = {
+                pep: (size, modified, digest)
+                for pep, size, modified, digest in index.execute(
+                    "SELECT pep, size, modified, digest FROM files"
+                )
+            }
+            indexed = {pep for (pep,) in index.execute("SELECT rowid FROM sources")}
+            cached = set(cache.cached())
+            stale: list[tuple[int, Path]] = []
+            for pep in sorted(cached if checking is None else cached & checking):
+                try:
+                    status = (source_file := cache.source_file(pep)).stat()
+                except OSError:
+                    continue
+                if known.get(pep, ())[:2] != (status.st_size, status.st_mtime_ns):
+                    stale.append((pep, source_file))
+            for batch in self._prepared(stale):
+                for source in batch:
+                    tracked = known.get(source.pep)
+                    if (
+                        source.pep not in indexed
+                        or tracked is None
+                        or tracked[2] != source.digest
+                    ):
+                        self._replace(index, source.pep, source.text)
+                        changed += 1
+                    index.execute(
+                        "INSERT OR REPLACE INTO files (pep, size, modified, digest) "
+                        "VALUES (?, ?, ?, ?)",
+                        (source.pep, source.size, source.modified, source.digest),
+                    )
+                index.commit()
+            gone = (indexed | known.keys()) - cached
+            for pep in gone if checking is None else gone & checking:
+                index.execute("DELETE FROM sources WHERE rowid = ?", (pep,))
+                index.execute("DELETE FROM files WHERE pep = ?", (pep,))
+                if pep in indexed:
+                    changed += 1
+        return changed
+
+    def _prepared(
+        self, files: Sequence[tuple[int, Path]]
+    ) -> Iterator[list[PreparedSource]]:
+        """Prepare some sources for the index.
+
+        Args:
+            files: The numbers of the PEPs and the files holding their sources.
+
+        Yields:
+            Batches of prepared sources.
+
+        Notes:
+            If there's more than one batch, and more than one worker, the
+            batches are prepared by a pool of processes; if the pool can't
+            be used, whatever batches are left are prepared within this
+            process.
+        """
+        batches = [
+            files[start : start + self._chunk_size]
+            for start in range(0, len(files), self._chunk_size)
+        ]
+        done = 0
+        if self._workers > 1 and len(batches) > 1:
+            with suppress(OSError, NotImplementedError, BrokenProcessPool, ValueError):
+                if os_name == "posix":
+                    # The process that tracks the resources of the pool is
+                    # handed our stderr; the application may have swapped
+                    # that for something with no file descriptor, so make
+                    # sure the tracker gets the real one.
+                    with redirect_stderr(__stderr__):
+                        ensure_running()
+                with ProcessPoolExecutor(
+                    min(self._workers, len(batches)), mp_context=get_context("spawn")
+                ) as pool:
+                    for batch in pool.map(prepare_sources, batches):
+                        yield batch
+                        done += 1
+        for remaining in batches[done:]:
+            yield prepare_sources(remaining)
+
+    @staticmethod
+    def _match(text: str) -> str:
+        """Turn some text into a full-text query.
+
+        Args:
+            text: The text to look for.
+
+        Returns:
+            A query that matches sources containing all of the words of the
+            text.
+
+        Notes:
+            Each word is quoted, so nothing in the text is taken as query
+            syntax.
+        """
+        return " ".join('"{}"'.format(word.replace('"', '""')) for word in text.split())
+
+    def search(self, text: str) -> list[SourceHit]:
+        """Search the index.
+
+        Args:
+            text: The text to look for.
+
+        Returns:
+            The PEPs whose sources contain all of the words of the text,
+            best match first.
+
+        Raises:
+            SourceIndexError: If there was a problem searching the index.
+        """
+        if not (query := self._match(text)):
+            return []
+        with self._connection() as index:
+            return [
+                SourceHit(pep, rank, " ".join(snippet.split()))
+                for pep, rank, snippet in index.execute(
+                    "SELECT rowid, bm25(sources), "
+                    "snippet(sources, 0, ?, ?, '…', ?) "
+                    "FROM sources WHERE sources MATCH ? ORDER BY rank",
+                    (*SNIPPET_MARKS, SNIPPET_TOKENS, query),
+                )
+            ]
+
+
+### source_index.py ends here
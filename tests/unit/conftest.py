@@ -0,0 +1,81 @@
+"""Fixtures shared by the unit tests."""
+
+##############################################################################
+# Python imports.
+from asyncio import run
+from pathlib import Path
+from typing import Callable, Iterator
+
+##############################################################################
+# HTTPX imports.
+from httpx import MockTransport, Request, Response
+
+##############################################################################
+# Pytest imports.
+from pytest import fixture
+
+##############################################################################
+# Local imports.
+from peplum.app.data import PEP
+from peplum.peps import API, SourceCache
+
+
+##############################################################################
+@fixture
+def make_pep() -> Callable[..., PEP]:
+    """A builder of PEPs to test with."""
+
+    def make(
+        number: int,
+        status: str,
+        pep_type: str,
+        versions: str | None,
+        authors: str = "Author",
+        title: str | None = None,
+    ) -> PEP:
+        return PEP.from_api(
+            {
+                "number": number,
+                "title": f"PEP {number}" if title is None else title,
+                "authors": authors,
+                "author_names": authors.split(", "),
+                "status": status,
+                "type": pep_type,
+                "topic": "",
+                "created": "01-Jan-2000",
+                "python_version": versions,
+                "requires": None,
+                "replaces": None,
+                "superseded_by": None,
+                "url": "",
+            }
+        )
+
+    return make
+
+
+##############################################################################
+def source_server(request: Request) -> Response:
+    """A stand-in for the PEP source server."""
+    if request.url.path.endswith("pep-0404.rst"):
+        return Response(404)
+    return Response(200, text=f"Source of {request.url.path.split('/')[-1]}")
+
+
+##############################################################################
+@fixture
+def source_api() -> Iterator[API]:
+    """An API client that talks to the stand-in PEP source server."""
+    api = API(transport=MockTransport(source_server))
+    yield api
+    run(api.close())
+
+
+##############################################################################
+@fixture
+def source_cache(source_api: API, tmp_path: Path) -> SourceCache:
+    """A source cache, in a temporary directory, that talks to the stand-in server."""
+    return SourceCache(source_api, tmp_path)
+
+
+### conftest.py ends here
@@ -0,0 +1,105 @@
+"""Tests for the PEP API client."""
+
+##############################################################################
+# Python imports.
+from asyncio import run
+from pathlib import Path
+
+##############################################################################
+# HTTPX imports.
+from httpx import MockTransport, Request, Response
+
+##############################################################################
+# Local imports.
+from peplum.peps import API, Validators
+
+##############################################################################
+ETAG = '"meaning-of-life"'
+"""The ETag to use in the tests."""
+
+LAST_MODIFIED = "Wed, 21 Oct 2015 07:28:00 GMT"
+"""The last-modified time to use in the tests."""
+
+
+##############################################################################
+def index_server(request: Request) -> Response:
+    """A stand-in for the PEP API that honours conditional requests."""
+    if request.headers.get("if-none-match") == ETAG:
+        return Response(304)
+    return Response(
+        200,
+        json={"1": {"number": 1}},
+        headers={"etag": ETAG, "last-modified": LAST_MODIFIED},
+    )
+
+
+##############################################################################
+def test_empty_validators_have_no_headers() -> None:
+    """Empty validators should result in no conditional headers."""
+    assert Validators().headers == {}
+
+
+##############################################################################
+def test_validators_headers() -> None:
+    """Validators should turn into conditional request headers."""
+    assert Validators(ETAG, LAST_MODIFIED).headers == {
+        "if-none-match": ETAG,
+        "if-modified-since": LAST_MODIFIED,
+    }
+
+
+##############################################################################
+def test_validators_round_trip(tmp_path: Path) -> None:
+    """Validators should survive being saved and loaded."""
+    validators = Validators(ETAG, LAST_MODIFIED).save(tmp_path / "validators.json")
+    assert Validators.load(tmp_path / "validators.json") == validators
+
+
+##############################################################################
+def test_load_missing_validators(tmp_path: Path) -> None:
+    """Loading validators that don't exist should give empty validators."""
+    assert Validators.load(tmp_path / "missing.json") == Validators()
+
+
+##############################################################################
+def test_unconditional_download() -> None:
+    """A download without validators should get the data and validators."""
+    index = run(API(transport=MockTransport(index_server)).get_peps())
+    assert index.modified
+    assert index.peps is not None
+    assert list(index.peps.values()) == [{"number": 1}]
+    assert index.validators == Validators(ETAG, LAST_MODIFIED)
+
+
+##############################################################################
+def test_conditional_download() -> None:
+    """A download with matching validators should report no modification."""
+    index = run(
+        API(transport=MockTransport(index_server)).get_peps(
+            Validators(ETAG, LAST_MODIFIED)
+        )
+    )
+    assert not index.modified
+    assert index.peps is None
+    assert index.validators == Validators(ETAG, LAST_MODIFIED)
+
+
+##############################################################################
+def test_agent_is_sent() -> None:
+    """Every request should identify itself with the agent string."""
+    agents: list[str | None] = []
+
+    def server(request: Request) -> Response:
+        agents.append(request.headers.get("user-agent"))
+        return Response(200, text="PEP")
+
+    async def fetch() -> None:
+        async with API(transport=MockTransport(server)) as api:
+            await api.get_pep(1)
+            await api.get_pep(2)
+
+    run(fetch())
+    assert agents == [API.AGENT, API.AGENT]
+
+
+### test_api.py ends here
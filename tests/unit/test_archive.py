@@ -0,0 +1,156 @@
+"""Tests for populating the source cache from an archive of the PEPs repository."""
+
+##############################################################################
+# Python imports.
+from asyncio import CancelledError, create_task, run, sleep
+from io import BytesIO
+from pathlib import Path
+from tarfile import TarInfo
+from tarfile import open as open_tar
+from threading import Event
+from time import sleep as time_sleep
+from typing import AsyncIterator
+
+##############################################################################
+# HTTPX imports.
+from httpx import MockTransport, Request, Response
+
+##############################################################################
+# Pytest imports.
+from pytest import MonkeyPatch, raises
+
+##############################################################################
+# Local imports.
+from peplum.peps import API, ArchiveError, SourceCache, WarmingProgress
+
+
+##############################################################################
+def make_archive() -> bytes:
+    """Make a small archive that looks like the PEPs repository."""
+    archive = BytesIO()
+    with open_tar(fileobj=archive, mode="w:gz") as tarball:
+        for name, content in (
+            ("peps-main/README.rst", "Not a PEP"),
+            ("peps-main/peps/conf.py", "Not a PEP either"),
+            ("peps-main/peps/pep-0001.rst", "PEP 1"),
+            ("peps-main/peps/pep-0008.rst", "PEP 8 " * 10_000),
+            ("peps-main/peps/pep-0001/diagram.png", "Not a PEP"),
+        ):
+            member = TarInfo(name)
+            member.size = len(data := content.encode("utf-8"))
+            tarball.addfile(member, BytesIO(data))
+    return archive.getvalue()
+
+
+##############################################################################
+def archive_server(request: Request) -> Response:
+    """A stand-in for the server of the PEPs repository archive."""
+
+    async def chunks() -> AsyncIterator[bytes]:
+        archive = make_archive()
+        for offset in range(0, len(archive), 512):
+            yield archive[offset : offset + 512]
+
+    return Response(200, content=chunks())
+
+
+##############################################################################
+def test_sync_from_local_archive(tmp_path: Path) -> None:
+    """We should be able to populate the cache from a local archive file."""
+    (archive := tmp_path / "peps.tar.gz").write_bytes(make_archive())
+    (cache_dir := tmp_path / "cache").mkdir()
+    cache = SourceCache(API(), cache_dir)
+    progress: list[WarmingProgress] = []
+    with archive.open("rb") as source:
+        assert cache.sync_from_archive(source, progress.append).downloaded == 2
+    assert sorted(path.name for path in cache_dir.iterdir()) == [
+        "pep-0001.rst",
+        "pep-0008.rst",
+    ]
+    assert cache.source_file(1).read_text(encoding="utf-8") == "PEP 1"
+    assert [report.pep for report in progress] == [1, 8]
+
+
+##############################################################################
+def test_sync_replaces_cached_sources(tmp_path: Path) -> None:
+    """Syncing from an archive should replace what's already in the cache."""
+    cache = SourceCache(API(), tmp_path)
+    cache.source_file(1).write_text("Stale", encoding="utf-8")
+    cache.sync_from_archive(BytesIO(make_archive()))
+    assert cache.source_file(1).read_text(encoding="utf-8") == "PEP 1"
+
+
+##############################################################################
+def test_sync_from_bad_archive(tmp_path: Path) -> None:
+    """Syncing from something that isn't an archive should be an error."""
+    with raises(ArchiveError):
+        SourceCache(API(), tmp_path).sync_from_archive(BytesIO(b"Not an archive"))
+
+
+##############################################################################
+def test_sync_from_streamed_archive(tmp_path: Path) -> None:
+    """We should be able to populate the cache from a streamed archive."""
+    cache = SourceCache(API(transport=MockTransport(archive_server)), tmp_path)
+    progress: list[WarmingProgress] = []
+    assert run(cache.sync(progress.append)).downloaded == 2
+    assert cache.source_file(8).read_text(encoding="utf-8") == "PEP 8 " * 10_000
+    assert [report.done for report in progress] == [1, 2]
+
+
+##############################################################################
+def test_sync_from_missing_archive(tmp_path: Path) -> None:
+    """A failure to download the archive should be an API error."""
+    cache = SourceCache(API(transport=MockTransport(lambda _: Response(404))), tmp_path)
+    with raises(API.RequestError):
+        run(cache.sync())
+
+
+##############################################################################
+def test_sync_from_archive_stops(tmp_path: Path) -> None:
+    """Once told to stop, nothing more should be taken from the archive."""
+    cache = SourceCache(API(), tmp_path)
+    stop = Event()
+    progress: list[WarmingProgress] = []
+
+    def report(update: WarmingProgress) -> None:
+        progress.append(update)
+        stop.set()
+
+    result = cache.sync_from_archive(BytesIO(make_archive()), report, stop)
+    assert result.downloaded == 1
+    assert [report.pep for report in progress] == [1]
+    assert sorted(cache.cached()) == [1]
+
+
+##############################################################################
+def test_cancelled_sync_stops_reporting(
+    tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Once the sync is cancelled, there should be no more progress reports."""
+    cache = SourceCache(API(transport=MockTransport(archive_server)), tmp_path)
+    store = cache._store
+
+    def slow_store(pep: int, source: str) -> None:
+        # Still be busy with PEP 8 when the sync is cancelled.
+        if pep == 8:
+            time_sleep(0.2)
+        store(pep, source)
+
+    monkeypatch.setattr(cache, "_store", slow_store)
+    progress: list[WarmingProgress] = []
+
+    async def cancel_sync() -> None:
+        def report(update: WarmingProgress) -> None:
+            progress.append(update)
+            syncing.cancel()
+
+        syncing = create_task(cache.sync(report))
+        with raises(CancelledError):
+            await syncing
+        await sleep(0.4)
+
+    run(cancel_sync())
+    assert [report.pep for report in progress] == [1]
+
+
+### test_archive.py ends here
@@ -0,0 +1,91 @@
+"""Tests for the bitmap indexes of the facets of PEPs."""
+
+##############################################################################
+# Python imports.
+from dataclasses import replace
+from operator import attrgetter
+from typing import Callable, get_args
+
+##############################################################################
+# Pytest imports.
+from pytest import fixture, mark
+
+##############################################################################
+# Local imports.
+from peplum.app.data import PEP
+from peplum.app.data.facets import RANK_SORT_LIMIT, Facets, IndexedSortOrder
+
+
+##############################################################################
+@fixture
+def sample_peps(make_pep: Callable[..., PEP]) -> tuple[PEP, ...]:
+    """Some PEPs to test with."""
+    return (
+        make_pep(1, "Active", "Process", None),
+        make_pep(8, "Active", "Process", None),
+        make_pep(20, "Final", "Informational", None),
+        make_pep(484, "Final", "Standards Track", "3.5"),
+        make_pep(572, "Final", "Standards Track", "3.8"),
+        make_pep(634, "Final", "Standards Track", "3.10"),
+        make_pep(703, "Accepted", "Standards Track", "3.13"),
+        make_pep(750, "Draft", "Standards Track", "3.14"),
+    )
+
+
+##############################################################################
+def test_bitmap_round_trip(sample_peps: tuple[PEP, ...]) -> None:
+    """A set of PEPs should survive being turned into a bitmap and back."""
+    facets = Facets(sample_peps)
+    wanted = [sample_peps[index].number for index in (0, 3, 7)]
+    assert list(facets.numbers(facets.bitmap(wanted))) == wanted
+    assert list(facets.numbers(0)) == []
+
+
+##############################################################################
+def test_lookup(sample_peps: tuple[PEP, ...]) -> None:
+    """Looking up a facet value should find the PEPs with that value."""
+    facets = Facets(sample_peps)
+    assert sorted(facets.numbers(facets.lookup("type", "Process"))) == sorted(
+        pep.number for pep in sample_peps if pep.type == "Process"
+    )
+    assert facets.lookup("status", "Not a status") == 0
+
+
+##############################################################################
+def test_counts_within_a_subset(sample_peps: tuple[PEP, ...]) -> None:
+    """Counting should only count within the given PEPs."""
+    peps = (
+        *sample_peps,
+        replace(sample_peps[0], number=9999, status="Final"),
+    )
+    facets = Facets(peps)
+    subset = facets.bitmap(pep.number for pep in peps if pep.status != "Draft")
+    counts = dict(facets.counts("status", subset))
+    assert "Draft" not in counts
+    assert counts["Final"] == 5
+    assert sum(counts.values()) == len(peps) - 1
+
+
+##############################################################################
+@mark.parametrize("sort_order", get_args(IndexedSortOrder))
+def test_ordered(sample_peps: tuple[PEP, ...], sort_order: IndexedSortOrder) -> None:
+    """Putting PEPs in order should give the same order however it's done."""
+    peps = tuple(
+        replace(pep, number=pep.number + copy * 1000)
+        for copy in range(5)
+        for pep in sample_peps
+    )
+    facets = Facets(peps)
+    expected = [
+        pep.number for pep in sorted(peps, key=attrgetter(sort_order, "number"))
+    ]
+    assert facets.ordered(sort_order, facets.everything) == expected
+    few = expected[::-10]
+    assert len(few) * RANK_SORT_LIMIT <= len(peps)
+    assert facets.ordered(sort_order, facets.bitmap(few)) == few[::-1]
+    many = [pep for pep in expected if pep % 2]
+    assert len(many) * RANK_SORT_LIMIT > len(peps)
+    assert facets.ordered(sort_order, facets.bitmap(many)) == many
+
+
+### test_facets.py ends here
@@ -0,0 +1,88 @@
+"""Tests for working out what changed between two copies of the PEP index."""
+
+##############################################################################
+# Python imports.
+from typing import Any
+
+##############################################################################
+# Local imports.
+from peplum.app.data import IndexDelta, Notes, RawIndex
+
+
+##############################################################################
+def raw_pep(number: int, **changes: Any) -> dict[str, Any]:
+    """Make the raw data for a PEP, as found in the index."""
+    return {
+        "number": number,
+        "title": f"PEP {number}",
+        "authors": "Author",
+        "author_names": ["Author"],
+        "discussions_to": None,
+        "status": "Draft",
+        "type": "Process",
+        "topic": "",
+        "created": "01-Jan-2000",
+        "python_version": None,
+        "post_history": None,
+        "resolution": None,
+        "requires": None,
+        "replaces": None,
+        "superseded_by": None,
+        "url": f"https://peps.python.org/pep-{number:04}/",
+        **changes,
+    }
+
+
+##############################################################################
+def raw_index(*peps: dict[str, Any]) -> RawIndex:
+    """Make a raw index from some raw PEPs."""
+    return {str(pep["number"]): pep for pep in peps}
+
+
+##############################################################################
+OLD = raw_index(raw_pep(1), raw_pep(2), raw_pep(3))
+"""An old copy of the index."""
+NEW = raw_index(raw_pep(1), raw_pep(2, status="Final", topic="x"), raw_pep(4))
+"""A new copy of the index."""
+
+
+##############################################################################
+def test_no_changes() -> None:
+    """Two identical copies of the index should have no differences."""
+    assert not IndexDelta.between(OLD, OLD)
+
+
+##############################################################################
+def test_changes() -> None:
+    """The differences between two copies of the index should be found."""
+    delta = IndexDelta.between(OLD, NEW)
+    assert delta
+    assert delta.added == {4}
+    assert delta.removed == {3}
+    assert delta.changed == {2: {"status", "topic"}}
+    assert delta.affected == {2, 3, 4}
+
+
+##############################################################################
+def test_everything_is_added_to_nothing() -> None:
+    """Everything in an index should be new compared to an empty index."""
+    assert IndexDelta.between({}, OLD).added == {1, 2, 3}
+
+
+##############################################################################
+def test_apply_keeps_unchanged_peps() -> None:
+    """Applying the differences should only create PEPs for what changed."""
+    notes = Notes()
+    old_peps = IndexDelta.between({}, OLD).apply((), OLD, notes)
+    new_peps = {
+        pep.number: pep
+        for pep in IndexDelta.between(OLD, NEW).apply(old_peps, NEW, notes)
+    }
+    assert sorted(new_peps) == [1, 2, 4]
+    assert new_peps[1] is old_peps[0]
+    assert new_peps[2] is not old_peps[1]
+    assert new_peps[2].status == "Final"
+    assert new_peps[4].title == "PEP 4"
+
+
+### test_index_delta.py ends here
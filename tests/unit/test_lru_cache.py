@@ -0,0 +1,38 @@
+"""Tests for the bounded, least-recently-used, cache."""
+
+##############################################################################
+# Local imports.
+from peplum.app.data.lru_cache import LRUCache
+
+
+##############################################################################
+def test_values_are_made_once() -> None:
+    """A value should only be made the first time it's asked for."""
+    made: list[str] = []
+
+    def make(key: str) -> str:
+        made.append(key)
+        return key.upper()
+
+    cache = LRUCache[str, str](2)
+    assert cache.get("a", lambda: make("a")) == "A"
+    assert cache.get("a", lambda: make("a")) == "A"
+    assert made == ["a"]
+    assert "a" in cache and len(cache) == 1
+
+
+##############################################################################
+def test_least_recently_used_is_forgotten() -> None:
+    """When full, the value least recently used should be forgotten."""
+    cache = LRUCache[str, int](2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: 1)
+    cache.get("c", lambda: 3)
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+### test_lru_cache.py ends here
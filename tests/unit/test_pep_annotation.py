@@ -52,4 +52,14 @@ def test_add_note(example_pep: PEP) -> None:
     assert example_pep.annotate(notes="test").notes == "test"
 
 
+##############################################################################
+def test_annotation_is_searchable(example_pep: PEP) -> None:
+    """A note added to a PEP that has been searched should be searchable."""
+    assert "Note Worthy" not in example_pep
+    annotated = example_pep.annotate(notes="Something note worthy")
+    assert "Note Worthy" in annotated
+    assert "Note Worthy" not in example_pep
+    assert annotated == example_pep.annotate(notes="Something note worthy")
+
+
 ### test_pep_annotation.py ends here
@@ -0,0 +1,37 @@
+"""Tests for checking the age of the local copy of the PEP data."""
+
+##############################################################################
+# Python imports.
+from os import utime
+from pathlib import Path
+from time import time
+
+##############################################################################
+# Pytest imports.
+from pytest import MonkeyPatch
+
+##############################################################################
+# Local imports.
+from peplum.app.data import peps
+from peplum.app.data.peps import pep_data_is_stale
+
+
+##############################################################################
+def test_missing_data_is_stale(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Local PEP data that doesn't exist should be considered stale."""
+    monkeypatch.setattr(peps, "pep_data", lambda: tmp_path / "peps.json")
+    assert pep_data_is_stale(60)
+
+
+##############################################################################
+def test_data_age(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Local PEP data should become stale once it's older than the maximum age."""
+    (data := tmp_path / "peps.json").write_text("{}", encoding="utf-8")
+    monkeypatch.setattr(peps, "pep_data", lambda: data)
+    assert not pep_data_is_stale(60)
+    utime(data, (time() - 120, time() - 120))
+    assert pep_data_is_stale(60)
+    assert not pep_data_is_stale(180)
+
+
+### test_pep_data_age.py ends here
@@ -2,24 +2,30 @@
 
 ##############################################################################
 # Python imports.
+from dataclasses import replace
+from operator import attrgetter
 from typing import Final, get_args
 
 ##############################################################################
 # Pytest imports.
-from pytest import mark
+from pytest import MonkeyPatch, mark, raises
 
 ##############################################################################
 # Local imports.
 from peplum.app.data import (
     Containing,
+    Facets,
+    IndexedSortOrder,
+    InSource,
     PEPs,
+    Resembling,
     WithAuthor,
     WithPythonVersion,
     WithStatus,
     WithType,
 )
 from peplum.app.data.pep import PEP, PEPStatus, PEPType
-from peplum.app.data.peps import Filter
+from peplum.app.data.peps import Filter, Plan
 
 ##############################################################################
 SAMPLE_PEPS: Final[tuple[PEP, ...]] = (
@@ -295,4 +301,337 @@ def test_filter(pep_filter: Filter, expected: int) -> None:
     assert len(PEPs(SAMPLE_PEPS) & pep_filter) == expected
 
 
+##############################################################################
+def test_refresh_from() -> None:
+    """Refreshing a filtered collection should only re-check affected PEPs."""
+    peps = {pep.number: pep for pep in SAMPLE_PEPS}
+    processes = PEPs(SAMPLE_PEPS) & WithType("Process")
+    refreshed = PEPs(
+        [
+            *(pep for number, pep in peps.items() if number not in (1, 3, 458)),
+            replace(peps[3], type="Informational"),
+            replace(peps[458], type="Process"),
+        ]
+    )
+    result = processes.refresh_from(refreshed, (1, 3, 458))
+    assert [pep.number for pep in result] == [458, 639]
+    assert next(iter(result & WithType("Process"))) is not peps[458]
+    assert [pep for pep in result if pep.number == 639] == [peps[639]]
+
+
+##############################################################################
+def test_pep_records_are_compact() -> None:
+    """PEP records should have no instance dictionary and share repeated values."""
+    assert not hasattr(SAMPLE_PEPS[0], "__dict__")
+    standards = [pep for pep in SAMPLE_PEPS if pep.type == "Standards Track"]
+    assert len(standards) > 1
+    assert all(pep.type is standards[0].type for pep in standards)
+
+
+##############################################################################
+@mark.parametrize(
+    "search_text, expected",
+    (
+        ("1234", True),
+        ("123", False),
+        ("4321", True),
+        ("purpose and", True),
+        ("guidelines\0", False),
+        ("active process", False),
+    ),
+)
+def test_search_document(search_text: str, expected: bool) -> None:
+    """Searching should look within fields, and for exact related PEPs."""
+    pep = replace(SAMPLE_PEPS[0], requires=(1234,), superseded_by=(4321,))
+    assert (search_text in pep) is expected
+
+
+##############################################################################
+def test_filter_chain() -> None:
+    """A chain of filters should find the PEPs that match all of them."""
+    filters: tuple[Filter, ...] = (
+        WithAuthor("author 1"),
+        WithType("Standards Track"),
+        Containing("JR"),
+    )
+    chained = PEPs(SAMPLE_PEPS)
+    for pep_filter in filters:
+        chained &= pep_filter
+    expected = [
+        pep.number
+        for pep in SAMPLE_PEPS
+        if all(pep & pep_filter for pep_filter in filters)
+    ]
+    assert sorted(pep.number for pep in chained) == sorted(expected)
+    assert [pep.number for pep in chained.rebuild_from(PEPs(SAMPLE_PEPS))] == [
+        pep.number for pep in chained
+    ]
+
+
+##############################################################################
+def test_patch_that_changes_facets() -> None:
+    """Patching a PEP in a way that changes its facets should be reflected in filters."""
+    peps = PEPs(SAMPLE_PEPS)
+    assert len(peps & WithStatus("Final")) == 1
+    peps.patch_pep(replace(SAMPLE_PEPS[0], status="Final"))
+    assert len(peps & WithStatus("Final")) == 2
+    assert len(peps & WithStatus("Active")) == 0
+
+
+##############################################################################
+def test_sorted_order_is_reused(monkeypatch: MonkeyPatch) -> None:
+    """The PEPs should only be put in order once for each order until patched."""
+    orderings = 0
+    ordered = Facets.ordered
+
+    def counting_ordered(
+        facets: Facets, sort_order: IndexedSortOrder, peps: int
+    ) -> list[int]:
+        nonlocal orderings
+        orderings += 1
+        return ordered(facets, sort_order, peps)
+
+    monkeypatch.setattr(Facets, "ordered", counting_ordered)
+    by_title = sorted(SAMPLE_PEPS, key=attrgetter("title", "number"))
+    peps = PEPs(SAMPLE_PEPS).sorted_by("title")
+    for _ in range(3):
+        assert list(peps) == by_title
+    assert len(peps.authors) > 0 and len(peps.statuses) > 0
+    assert orderings == 1
+    assert list(peps.reversed(True)) == by_title[::-1]
+    assert list(peps.reversed(True).sorted_by("number")) == sorted(
+        SAMPLE_PEPS, key=attrgetter("number"), reverse=True
+    )
+    assert orderings == 2
+    peps.patch_pep(replace(SAMPLE_PEPS[0], title="ZZZ"))
+    assert list(peps)[-1].title == "ZZZ"
+    assert orderings == 3
+
+
+##############################################################################
+def test_patching_a_view() -> None:
+    """Patching a view should only affect that view."""
+    peps = PEPs(SAMPLE_PEPS)
+    view = (peps & WithAuthor("author 1") & WithType("Standards Track")).reversed()
+    assert SAMPLE_PEPS[0] not in view
+    before = len(view)
+    patched = replace(SAMPLE_PEPS[0], title="Patched")
+    view.patch_pep(patched)
+    assert len(view) == before + 1
+    assert patched in view and patched in list(view)
+    assert list(peps)[0] is SAMPLE_PEPS[0]
+    withdrawn = len(peps & WithStatus("Withdrawn"))
+    view.patch_pep(replace(patched, status="Withdrawn"))
+    assert len(view) == before + 1
+    assert patched.number in view & WithStatus("Withdrawn")
+    assert len(peps & WithStatus("Withdrawn")) == withdrawn
+
+
+##############################################################################
+def test_refresh_after_annotating() -> None:
+    """Annotating a PEP should only change whether that PEP is in a view."""
+    peps = PEPs(SAMPLE_PEPS)
+    view = peps & WithType("Standards Track") & Containing("xyzzy")
+    assert len(view) == 0
+    target = next(iter(peps & WithType("Standards Track")))
+    view = view.refresh_from(
+        peps.patch_pep(target.annotate(notes="Xyzzy")), (target.number,)
+    )
+    assert [pep.number for pep in view] == [target.number]
+    assert list(view)[0].notes == "Xyzzy"
+    view = view.refresh_from(
+        peps.patch_pep(target.annotate(notes="")), (target.number,)
+    )
+    assert len(view) == 0
+
+
+##############################################################################
+def test_filters_are_hashable() -> None:
+    """Filters that are equal should hash the same."""
+    assert hash(Containing("PEP")) == hash(Containing("pep"))
+    assert hash(WithStatus("Final")) == hash(WithStatus("Final"))
+    assert len({WithStatus("Final"), WithType("Process"), WithStatus("Final")}) == 2
+
+
+##############################################################################
+def test_filter_results_are_remembered(monkeypatch: MonkeyPatch) -> None:
+    """Filtering the same PEPs the same way should reuse the earlier result."""
+    selections = 0
+    select = PEPs._select
+
+    def counting_select(peps: PEPs, filters: tuple[Filter, ...]) -> tuple[int, Plan]:
+        nonlocal selections
+        selections += 1
+        return select(peps, filters)
+
+    monkeypatch.setattr(PEPs, "_select", counting_select)
+    peps = PEPs(SAMPLE_PEPS)
+    by_author = peps & WithAuthor("author 1")
+    narrowed = by_author & WithType("Standards Track")
+    assert selections == 2
+    assert [pep.number for pep in peps & WithAuthor("author 1")] == [
+        pep.number for pep in by_author
+    ]
+    again = (peps & WithAuthor("author 1")).sorted_by("title") & WithType(
+        "Standards Track"
+    )
+    assert [pep.number for pep in again] == sorted(
+        (pep.number for pep in narrowed),
+        key=lambda number: next(p.title for p in SAMPLE_PEPS if p.number == number),
+    )
+    both = (WithType("Standards Track"), WithAuthor("author 1"))
+    assert len(PEPs(SAMPLE_PEPS, filters=both).rebuild_from(peps)) == len(narrowed)
+    assert selections == 3
+    assert len(PEPs(SAMPLE_PEPS, filters=both[::-1]).rebuild_from(peps)) == len(
+        narrowed
+    )
+    assert selections == 3
+    peps.patch_pep(SAMPLE_PEPS[0].annotate(notes="Patched"))
+    _ = peps & WithAuthor("author 1")
+    assert selections == 4
+
+
+##############################################################################
+def test_filters_are_planned() -> None:
+    """Filters should be applied most selective and cheapest first."""
+    peps = PEPs(SAMPLE_PEPS)
+    filters = (
+        Containing("PEP"),
+        WithStatus("Final"),
+        WithAuthor("author 1"),
+        WithType("Standards Track"),
+    )
+    filtered = PEPs(filters=filters).rebuild_from(peps)
+    indexed = [step for step in filtered.plan if step.indexed]
+    assert [step.pep_filter for step in filtered.plan[len(indexed) :]] == [
+        Containing("PEP")
+    ]
+    assert len(indexed) == 3
+    assert [step.candidates for step in indexed] == sorted(
+        (step.candidates for step in indexed), reverse=True
+    )
+    assert filtered.plan[-1].candidates == len(filtered)
+    assert not any(step.skipped for step in filtered.plan)
+    assert list(filtered) == list(PEPs(filters=filters[::-1]).rebuild_from(peps))
+
+
+##############################################################################
+def test_empty_selection_skips_tests(monkeypatch: MonkeyPatch) -> None:
+    """Once no PEPs are selected, no PEPs should be tested against a filter."""
+
+    def no_testing(*_: object) -> bool:
+        raise AssertionError("PEP tested against a filter")
+
+    monkeypatch.setattr(Containing, "__rand__", no_testing)
+    filtered = PEPs(filters=(Containing("PEP"), WithAuthor("Nobody"))).rebuild_from(
+        PEPs(SAMPLE_PEPS)
+    )
+    assert len(filtered) == 0
+    assert [step.skipped for step in filtered.plan] == [False, True]
+    assert filtered.plan[-1].pep_filter == Containing("PEP")
+
+
+##############################################################################
+def test_resembling() -> None:
+    """Text that resembles the text of PEPs should find them, despite typos."""
+    peps = PEPs(SAMPLE_PEPS) & Resembling("guidlines")
+    assert sorted(pep.number for pep in peps) == [1, 3, 5]
+    assert sorted(pep.number for pep in peps.sorted_by("relevance")) == [1, 3, 5]
+    assert peps.description == "Like guidlines; Sorted by PEP Number"
+
+
+##############################################################################
+def test_sort_by_relevance() -> None:
+    """Sorting by relevance should put the best match first."""
+    peps = PEPs(SAMPLE_PEPS)
+    ranked = (peps & Resembling("guidelines for handling")).sorted_by("relevance")
+    assert [pep.number for pep in ranked][0] == 3
+    assert [pep.number for pep in ranked.reversed(True)][-1] == 3
+    packaging = (peps & Containing("packaging")).sorted_by("relevance")
+    assert [pep.number for pep in packaging] == [458, 639]
+    assert [
+        pep.number for pep in (packaging & Containing("license")).sorted_by("relevance")
+    ] == [639]
+    assert [pep.number for pep in peps.sorted_by("relevance")] == sorted(
+        pep.number for pep in SAMPLE_PEPS
+    )
+
+
+##############################################################################
+def test_resembling_after_annotating() -> None:
+    """Annotating a PEP should change what text it resembles."""
+    peps = PEPs(SAMPLE_PEPS)
+    assert len(peps & Resembling("xyzzy plugh")) == 0
+    view = peps & Resembling("xyzzy plugh")
+    view = view.refresh_from(
+        peps.patch_pep(SAMPLE_PEPS[2].annotate(notes="Xyzzy Plough")),
+        (SAMPLE_PEPS[2].number,),
+    )
+    assert [pep.number for pep in view] == [SAMPLE_PEPS[2].number]
+    assert [pep.number for pep in peps & Resembling("xyzzy plugh")] == [
+        SAMPLE_PEPS[2].number
+    ]
+
+
+##############################################################################
+def test_in_source() -> None:
+    """Filtering by a search of the sources should keep the search's ranking."""
+    found = {639: "…license…", 9999: "…not a known PEP…", 458: "…license…"}
+    peps = PEPs(SAMPLE_PEPS) & InSource("license", found)
+    assert sorted(pep.number for pep in peps) == [458, 639]
+    assert [pep.number for pep in peps.sorted_by("relevance")] == [639, 458]
+    assert [pep.number for pep in SAMPLE_PEPS if pep & InSource("license", found)] == [
+        458,
+        639,
+    ]
+    assert peps.snippet(639) == "…license…"
+    assert peps.snippet(1) is None
+    assert PEPs(SAMPLE_PEPS).snippet(639) is None
+    assert peps.description == "Source containing license; Sorted by PEP Number"
+    assert InSource("license", found) != InSource("license", {639: "…license…"})
+
+
+##############################################################################
+def test_narrows() -> None:
+    """A filter should know when it only matches what another filter matches."""
+    assert Containing("PyPI").narrows(Containing("py"))
+    assert Containing("secure pypi").narrows(Containing("E P"))
+    assert not Containing("py").narrows(Containing("PyPI"))
+    assert not Containing("py").narrows(WithAuthor("py"))
+    assert WithAuthor("Author 1").narrows(WithAuthor("Author 1"))
+    assert not WithAuthor("Author 1").narrows(WithAuthor("Author 2"))
+
+
+##############################################################################
+def test_narrowed() -> None:
+    """Narrowing a filter should find what applying the narrower filter would."""
+    peps = PEPs(SAMPLE_PEPS) & WithAuthor("Author 1")
+    found = peps & Containing("p")
+    narrowed = found.narrowed(Containing("p"), Containing("PyPI"))
+    assert narrowed.filters == (WithAuthor("Author 1"), Containing("PyPI"))
+    assert [pep.number for pep in narrowed] == [
+        pep.number for pep in peps & Containing("PyPI")
+    ]
+    assert len(narrowed.narrowed(Containing("pypi"), Containing("nothing pypi"))) == 0
+    with raises(ValueError):
+        found.narrowed(Containing("p"), Containing("q"))
+    with raises(ValueError):
+        found.narrowed(Containing("x"), Containing("xy"))
+
+
+##############################################################################
+def test_narrowing_related_numbers() -> None:
+    """Text that could be the number of a related PEP shouldn't be narrowed."""
+    peps = PEPs(SAMPLE_PEPS)
+    assert not Containing("45").narrows(Containing("4"))
+    assert not Containing("387").narrows(Containing("38"))
+    assert Containing("pep 45").narrows(Containing("pep 4"))
+    # PEP 5 is superseded by PEP 387, so is found by "387" but not by "38".
+    assert [pep.number for pep in peps & Containing("387")] == [5]
+    found = peps & Containing("38")
+    assert len(found) == 0
+    with raises(ValueError):
+        found.narrowed(Containing("38"), Containing("387"))
+
+
 ### test_peps.py ends here
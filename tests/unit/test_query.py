@@ -0,0 +1,171 @@
+"""Tests for querying PEPs."""
+
+##############################################################################
+# Python imports.
+from typing import Callable
+
+##############################################################################
+# Pytest imports.
+from pytest import fixture, mark, raises
+
+##############################################################################
+# Local imports.
+from peplum.app.data import PEP, PEPs, QueryError, parse_query
+
+
+##############################################################################
+@fixture
+def sample_peps(make_pep: Callable[..., PEP]) -> tuple[PEP, ...]:
+    """Some PEPs to test with."""
+    return (
+        make_pep(
+            1,
+            "Active",
+            "Process",
+            None,
+            "Barry Warsaw, Guido van Rossum",
+            title="PEP 1 about pattern matching",
+        ),
+        make_pep(
+            8,
+            "Active",
+            "Process",
+            None,
+            "Guido van Rossum, Barry Warsaw, Alyssa Coghlan",
+        ),
+        make_pep(20, "Active", "Informational", None, "Tim Peters"),
+        make_pep(
+            484,
+            "Final",
+            "Standards Track",
+            "3.5",
+            "Guido van Rossum, Jukka Lehtosalo",
+        ),
+        make_pep(
+            572,
+            "Final",
+            "Standards Track",
+            "3.8",
+            "Chris Angelico, Tim Peters, Guido van Rossum",
+        ),
+        make_pep(
+            634,
+            "Final",
+            "Standards Track",
+            "3.10",
+            "Brandt Bucher, Guido van Rossum",
+        ),
+        make_pep(
+            695,
+            "Accepted",
+            "Standards Track",
+            "3.12",
+            "Eric Traut",
+            title="PEP 695 about pattern matching",
+        ),
+        make_pep(
+            701,
+            "Accepted",
+            "Standards Track",
+            "3.12",
+            "Pablo Galindo Salgado",
+            title="PEP 701 about pattern matching",
+        ),
+        make_pep(
+            703,
+            "Accepted",
+            "Standards Track",
+            "3.13",
+            "Sam Gross",
+            title="PEP 703 about pattern matching",
+        ),
+        make_pep(750, "Draft", "Standards Track", "3.14", "Jim Baker, Paul Everitt"),
+    )
+
+
+##############################################################################
+@mark.parametrize(
+    "query, expected",
+    (
+        ("status:Final", {484, 572, 634}),
+        ("status:final", {484, 572, 634}),
+        ('type:"standards track" -author:guido', {695, 701, 703, 750}),
+        ("python:3.12 OR python:3.13", {695, 701, 703}),
+        ("python:none", {1, 8, 20}),
+        ("author:Guido author:Barry", {1, 8}),
+        ("NOT author:guido AND status:active", {20}),
+        ('"pattern matching"', {1, 695, 701, 703}),
+        ("pattern -matching", set()),
+        ("status:Accepted (python:3.12 OR python:3.13) -pattern", set()),
+        ("(status:Final OR pattern) -python:3.8", {1, 484, 634, 695, 701, 703}),
+        ("status:Draft OR author:tim status:Active", {20, 750}),
+        ('-(author:guido OR "PEP 7")', {20, 695}),
+        ('author:"van rossum"', {1, 8, 484, 572, 634}),
+        ("author:Tim OR author:warsaw", {1, 8, 20, 572}),
+        ("author:nobody", set()),
+    ),
+)
+def test_query(sample_peps: tuple[PEP, ...], query: str, expected: set[int]) -> None:
+    """A query should select the expected PEPs, however it's evaluated."""
+    matching = parse_query(query)
+    peps = PEPs(sample_peps)
+    assert {pep.number for pep in peps & matching} == expected
+    assert {pep.number for pep in sample_peps if pep & matching} == expected
+    filtered = PEPs(sample_peps) & parse_query("status:Final OR python:3.12")
+    assert {pep.number for pep in filtered & matching} == expected & {
+        484,
+        572,
+        634,
+        695,
+        701,
+    }
+
+
+##############################################################################
+def test_indexed_query_is_looked_up(sample_peps: tuple[PEP, ...]) -> None:
+    """A query of only indexed terms should be looked up in the indexes."""
+    peps = PEPs(sample_peps) & parse_query(
+        "type:process OR (-author:guido status:final)"
+    )
+    assert [step.indexed for step in peps.plan] == [True]
+    assert (PEPs(sample_peps) & parse_query("type:process OR pattern")).plan[
+        0
+    ].indexed is False
+
+
+##############################################################################
+def test_equal_queries() -> None:
+    """Queries that compile the same should be the same filter."""
+    assert parse_query("status:final Pattern") == parse_query(
+        'status:Final AND "pattern"'
+    )
+    assert parse_query("status:final") != parse_query("status:active")
+    assert str(parse_query("  status:final  ")) == "status:final"
+
+
+##############################################################################
+@mark.parametrize(
+    "query",
+    (
+        "",
+        "   ",
+        "(status:final",
+        "status:final)",
+        "OR status:final",
+        "status:final AND",
+        "status:finished",
+        "type:other",
+        '"pattern matching',
+        '""',
+        'author:""',
+        'author:"  "',
+        "NOT",
+    ),
+)
+def test_invalid_query(query: str) -> None:
+    """An invalid query should be reported as such."""
+    with raises(QueryError):
+        parse_query(query)
+
+
+### test_query.py ends here
@@ -0,0 +1,214 @@
+"""Tests for the retrying and circuit breaking of API requests."""
+
+##############################################################################
+# Python imports.
+from asyncio import run
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from ssl import SSLCertVerificationError
+
+##############################################################################
+# HTTPX imports.
+from httpx import ConnectError, MockTransport, Request, Response
+
+##############################################################################
+# Pytest imports.
+from pytest import mark, raises
+
+##############################################################################
+# Local imports.
+from peplum.peps import API, CircuitBreaker, RetryPolicy
+from peplum.peps.resilience import parse_retry_after
+
+##############################################################################
+NO_WAITING = RetryPolicy(retries=3, backoff=0, max_backoff=1)
+"""A retry policy that doesn't make the tests wait."""
+
+
+##############################################################################
+class FlakyServer:
+    """A stand-in server that fails a given number of times before succeeding."""
+
+    def __init__(self, failures: int, failure: Response | None = None) -> None:
+        self.failures = failures
+        self.failure = failure
+        self.requests = 0
+
+    def __call__(self, request: Request) -> Response:
+        self.requests += 1
+        if self.requests <= self.failures:
+            if self.failure is None:
+                raise ConnectError("Flaky", request=request)
+            return self.failure
+        return Response(200, text="PEP")
+
+
+##############################################################################
+@mark.parametrize(
+    "value, expected",
+    (
+        (None, None),
+        ("", None),
+        ("10", 10.0),
+        ("Not a valid value", None),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+    ),
+)
+def test_parse_retry_after(value: str | None, expected: float | None) -> None:
+    """We should be able to parse the value of Retry-After."""
+    assert parse_retry_after(value) == expected
+
+
+##############################################################################
+def test_parse_retry_after_future_date() -> None:
+    """A Retry-After date in the future should give a delay."""
+    delay = parse_retry_after(
+        format_datetime(datetime.now(timezone.utc) + timedelta(seconds=60), usegmt=True)
+    )
+    assert delay is not None and 55 < delay <= 60
+
+
+##############################################################################
+def test_backoff_grows_within_limits() -> None:
+    """The delay before a retry should be jittered within an exponential limit."""
+    policy = RetryPolicy(retries=10, backoff=1, max_backoff=8)
+    for attempt, limit in ((1, 1), (2, 2), (3, 4), (4, 8), (5, 8), (10, 8)):
+        for _ in range(100):
+            delay = policy.delay(attempt)
+            assert delay is not None and 0 <= delay <= limit
+
+
+##############################################################################
+def test_no_retry_when_out_of_retries() -> None:
+    """There should be no retry once the retries are used up."""
+    assert RetryPolicy(retries=2).delay(3) is None
+
+
+##############################################################################
+def test_retry_after_is_honoured() -> None:
+    """A delay the server asked for should be used, within reason."""
+    policy = RetryPolicy(retries=3, max_backoff=10)
+    assert policy.delay(1, 5) == 5
+    assert policy.delay(1, 60) is None
+
+
+##############################################################################
+def test_breaker_opens_and_cools_down() -> None:
+    """The breaker should open after enough failures, then allow a trial call."""
+    now = 0.0
+    breaker = CircuitBreaker(threshold=2, cool_down=10, clock=lambda: now)
+    breaker.failed()
+    assert not breaker.is_open
+    breaker.failed()
+    assert breaker.is_open
+    now = 10.0
+    assert not breaker.is_open
+    breaker.failed()
+    assert breaker.is_open
+    now = 20.0
+    breaker.succeeded()
+    breaker.failed()
+    assert not breaker.is_open
+
+
+##############################################################################
+def test_breaker_allows_one_trial_call() -> None:
+    """Once cooled down, the breaker should allow one call until it's known how it went."""
+    now = 0.0
+    breaker = CircuitBreaker(threshold=1, cool_down=10, clock=lambda: now)
+    assert breaker.allow() and breaker.allow()
+    breaker.failed()
+    assert not breaker.allow()
+    now = 10.0
+    assert breaker.allow()
+    assert not breaker.allow()
+    assert breaker.is_open
+    breaker.failed()
+    assert not breaker.allow()
+    now = 20.0
+    assert breaker.allow()
+    breaker.abandoned()
+    assert breaker.allow()
+    assert not breaker.allow()
+    breaker.succeeded()
+    assert breaker.allow() and breaker.allow()
+
+
+##############################################################################
+def test_transient_failures_are_retried() -> None:
+    """A request that fails a couple of times should be retried to success."""
+    server = FlakyServer(2)
+    assert (
+        run(API(retry=NO_WAITING, transport=MockTransport(server)).get_pep(1)) == "PEP"
+    )
+    assert server.requests == 3
+
+
+##############################################################################
+def test_retryable_statuses_are_retried() -> None:
+    """A request that gets a retryable status should be retried."""
+    server = FlakyServer(2, Response(503, headers={"retry-after": "0"}))
+    assert (
+        run(API(retry=NO_WAITING, transport=MockTransport(server)).get_pep(1)) == "PEP"
+    )
+    assert server.requests == 3
+
+
+##############################################################################
+def test_persistent_failures_give_up() -> None:
+    """A request that keeps failing should give up after the retries."""
+    server = FlakyServer(10)
+    with raises(API.RequestError):
+        run(API(retry=NO_WAITING, transport=MockTransport(server)).get_pep(1))
+    assert server.requests == 4
+
+
+##############################################################################
+def test_client_errors_are_not_retried() -> None:
+    """A request that fails because of the request itself shouldn't be retried."""
+    server = FlakyServer(10, Response(404))
+    with raises(API.RequestError):
+        run(API(retry=NO_WAITING, transport=MockTransport(server)).get_pep(1))
+    assert server.requests == 1
+
+
+##############################################################################
+def test_breaker_stops_requests() -> None:
+    """Once a server has failed enough, requests should stop being made."""
+    server = FlakyServer(10)
+    api = API(
+        retry=RetryPolicy(retries=0),
+        breaker_threshold=2,
+        transport=MockTransport(server),
+    )
+
+    async def hammer() -> None:
+        for _ in range(2):
+            with raises(API.RequestError):
+                await api.get_pep(1)
+        with raises(API.Unavailable):
+            await api.get_pep(1)
+
+    run(hammer())
+    assert server.requests == 2
+
+
+##############################################################################
+def test_certificate_failures_are_not_retried() -> None:
+    """A request to a server whose certificate can't be verified shouldn't be retried."""
+    requests = 0
+
+    def untrusted_server(request: Request) -> Response:
+        nonlocal requests
+        requests += 1
+        try:
+            raise SSLCertVerificationError("certificate verify failed")
+        except SSLCertVerificationError:
+            raise ConnectError("Untrusted", request=request)
+
+    with raises(API.RequestError):
+        run(API(retry=NO_WAITING, transport=MockTransport(untrusted_server)).get_pep(1))
+    assert requests == 1
+
+
+### test_resilience.py ends here
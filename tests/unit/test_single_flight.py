@@ -0,0 +1,150 @@
+"""Tests for coalescing concurrent requests for the same thing."""
+
+##############################################################################
+# Python imports.
+from asyncio import TimeoutError, gather, run, sleep, wait_for
+from functools import partial
+from pathlib import Path
+
+##############################################################################
+# HTTPX imports.
+from httpx import MockTransport, Request, Response
+
+##############################################################################
+# Pytest imports.
+from pytest import raises
+
+##############################################################################
+# Local imports.
+from peplum.peps import API, SingleFlight, SourceCache, Validators
+
+
+##############################################################################
+class SlowServer:
+    """A stand-in server that takes a moment to reply, and counts requests."""
+
+    def __init__(self) -> None:
+        self.requests: list[str] = []
+
+    async def __call__(self, request: Request) -> Response:
+        self.requests.append(request.url.path)
+        await sleep(0.01)
+        if request.url.path.endswith("peps.json"):
+            return Response(200, json={"1": {"number": 1}})
+        return Response(200, text=f"Source of {request.url.path.split('/')[-1]}")
+
+
+##############################################################################
+def test_concurrent_calls_share_one_call() -> None:
+    """Concurrent calls with the same key should result in one call."""
+    calls = 0
+
+    async def call() -> int:
+        nonlocal calls
+        calls += 1
+        await sleep(0.01)
+        return calls
+
+    async def make_calls() -> list[int]:
+        flights = SingleFlight[str, int]()
+        results = await gather(*(flights.call("key", call) for _ in range(5)))
+        assert "key" not in flights
+        return results
+
+    assert run(make_calls()) == [1] * 5
+
+
+##############################################################################
+def test_calls_with_different_keys_are_separate() -> None:
+    """Calls with different keys should not be coalesced."""
+
+    async def make_calls() -> list[str]:
+        flights = SingleFlight[str, str]()
+
+        async def call(key: str) -> str:
+            await sleep(0.01)
+            return key
+
+        return await gather(*(flights.call(key, partial(call, key)) for key in "abc"))
+
+    assert run(make_calls()) == ["a", "b", "c"]
+
+
+##############################################################################
+def test_failures_are_shared() -> None:
+    """Every caller of a call that fails should see the failure."""
+
+    async def fail() -> None:
+        await sleep(0.01)
+        raise ValueError("Failed")
+
+    async def make_calls() -> None:
+        flights = SingleFlight[str, None]()
+        results = await gather(
+            *(flights.call("key", fail) for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(result, ValueError) for result in results)
+        assert len(flights) == 0
+
+    run(make_calls())
+
+
+##############################################################################
+def test_cancelled_caller_does_not_cancel_call() -> None:
+    """Cancelling one caller should leave the call going for the others."""
+
+    async def call() -> str:
+        await sleep(0.05)
+        return "Done"
+
+    async def make_calls() -> str:
+        flights = SingleFlight[str, str]()
+        with raises(TimeoutError):
+            await wait_for(flights.call("key", call), 0.01)
+        return await flights.call("key", call)
+
+    assert run(make_calls()) == "Done"
+
+
+##############################################################################
+def test_concurrent_pep_requests_are_coalesced(tmp_path: Path) -> None:
+    """Concurrent requests for the same PEP should make one request."""
+    server = SlowServer()
+    cache = SourceCache(API(transport=MockTransport(server)), tmp_path)
+
+    async def fetch() -> list[str]:
+        return list(
+            await gather(cache.get(1), cache.get(1), cache.download(1), cache.get(2))
+        )
+
+    assert run(fetch()) == [
+        "Source of pep-0001.rst",
+        "Source of pep-0001.rst",
+        "Source of pep-0001.rst",
+        "Source of pep-0002.rst",
+    ]
+    assert len(server.requests) == 2
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "pep-0001.rst",
+        "pep-0002.rst",
+    ]
+
+
+##############################################################################
+def test_concurrent_index_requests_are_coalesced() -> None:
+    """Concurrent requests for the same PEP index should make one request."""
+    server = SlowServer()
+    api = API(transport=MockTransport(server))
+
+    async def fetch() -> None:
+        first, second, third = await gather(
+            api.get_peps(), api.get_peps(), api.get_peps(Validators(etag="x"))
+        )
+        assert first is second
+        assert third is not first
+
+    run(fetch())
+    assert len(server.requests) == 2
+
+
+### test_single_flight.py ends here
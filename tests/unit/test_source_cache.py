@@ -0,0 +1,143 @@
+"""Tests for the local cache of PEP sources."""
+
+##############################################################################
+# Python imports.
+from asyncio import create_task, run, sleep
+from pathlib import Path
+
+##############################################################################
+# HTTPX imports.
+from httpx import MockTransport, Request, Response
+
+##############################################################################
+# Pytest imports.
+from pytest import MonkeyPatch
+
+##############################################################################
+# Local imports.
+from peplum.peps import API, SourceCache, WarmingProgress
+
+
+##############################################################################
+def test_get_downloads_and_caches(source_cache: SourceCache) -> None:
+    """Getting a source that isn't cached should download and cache it."""
+    assert 1 not in source_cache
+    assert run(source_cache.get(1)) == "Source of pep-0001.rst"
+    assert 1 in source_cache
+    assert (
+        source_cache.source_file(1).read_text(encoding="utf-8")
+        == "Source of pep-0001.rst"
+    )
+
+
+##############################################################################
+def test_get_prefers_the_cache(source_cache: SourceCache) -> None:
+    """Getting a source that is cached should not download it."""
+    source_cache.source_file(1).write_text("Local copy", encoding="utf-8")
+    assert run(source_cache.get(1)) == "Local copy"
+
+
+##############################################################################
+def test_forget(source_cache: SourceCache) -> None:
+    """Forgetting a source should remove it from the cache."""
+    run(source_cache.get(1))
+    source_cache.forget(1)
+    assert 1 not in source_cache
+
+
+##############################################################################
+def test_warm_cache(source_cache: SourceCache) -> None:
+    """Warming the cache should download everything that isn't cached."""
+    source_cache.source_file(1).write_text("Local copy", encoding="utf-8")
+    progress: list[WarmingProgress] = []
+    result = run(source_cache.warm((1, 2, 3, 404, 3), reporter=progress.append))
+    assert result.downloaded == 2
+    assert result.skipped == 1
+    assert list(result.failed) == [404]
+    assert all(pep in source_cache for pep in (1, 2, 3))
+    assert 404 not in source_cache
+    assert sorted(report.done for report in progress) == [1, 2, 3]
+    assert all(report.total == 3 for report in progress)
+    assert source_cache.source_file(1).read_text(encoding="utf-8") == "Local copy"
+
+
+##############################################################################
+def test_warm_cache_resumes(source_cache: SourceCache) -> None:
+    """Warming the cache a second time should only retry what's missing."""
+    run(source_cache.warm((1, 2, 404)))
+    result = run(source_cache.warm((1, 2, 404)))
+    assert result.downloaded == 0
+    assert result.skipped == 2
+    assert list(result.failed) == [404]
+
+
+##############################################################################
+def test_warm_cache_concurrency(tmp_path: Path) -> None:
+    """Warming the cache should not exceed the requested concurrency."""
+    active = 0
+    most_active = 0
+
+    async def slow_server(request: Request) -> Response:
+        nonlocal active, most_active
+        active += 1
+        most_active = max(most_active, active)
+        await sleep(0.01)
+        active -= 1
+        return Response(200, text="Source")
+
+    cache = SourceCache(API(transport=MockTransport(slow_server)), tmp_path)
+    assert run(cache.warm(range(1, 21), concurrency=3)).downloaded == 20
+    assert most_active == 3
+
+
+##############################################################################
+def test_no_partial_files_left_behind(
+    source_cache: SourceCache, tmp_path: Path
+) -> None:
+    """Warming the cache should leave nothing but PEP sources behind."""
+    run(source_cache.warm((1, 2, 404)))
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "pep-0001.rst",
+        "pep-0002.rst",
+    ]
+
+
+##############################################################################
+def test_warm_cache_shares_downloads(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    """Warming the cache should share a download that's already under way."""
+
+    async def slow_server(request: Request) -> Response:
+        await sleep(0.01)
+        return Response(200, text="Source")
+
+    cache = SourceCache(API(transport=MockTransport(slow_server)), tmp_path)
+    stored: list[int] = []
+    store = cache._store
+
+    def counted_store(pep: int, source: str) -> None:
+        stored.append(pep)
+        store(pep, source)
+
+    monkeypatch.setattr(cache, "_store", counted_store)
+
+    async def get_and_warm() -> None:
+        getting = create_task(cache.get(1))
+        await sleep(0)
+        assert (await cache.warm((1, 2))).downloaded == 2
+        assert await getting == "Source"
+
+    run(get_and_warm())
+    assert sorted(stored) == [1, 2]
+
+
+##############################################################################
+def test_warm_cache_counts_failures_to_store(source_api: API, tmp_path: Path) -> None:
+    """A source that can't be stored should count as a failure to warm the cache."""
+    cache = SourceCache(source_api, tmp_path / "missing")
+    assert run(cache.get(1)) == "Source of pep-0001.rst"
+    result = run(cache.warm((1, 2)))
+    assert result.downloaded == 0
+    assert sorted(result.failed) == [1, 2]
+
+
+### test_source_cache.py ends here
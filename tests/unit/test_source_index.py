@@ -0,0 +1,212 @@
+"""Tests for the full-text index of the sources of PEPs."""
+
+##############################################################################
+# Python imports.
+from os import utime
+from pathlib import Path
+from threading import Thread
+
+##############################################################################
+# Pytest imports.
+from pytest import MonkeyPatch, fixture
+
+##############################################################################
+# Local imports.
+from peplum.peps import SNIPPET_MARKS, SourceCache, SourceIndex, source_index
+from peplum.peps.source_index import PreparedSource, plain_text
+
+
+##############################################################################
+@fixture
+def cache(source_cache: SourceCache) -> SourceCache:
+    """A source cache with some sources in it."""
+    for pep, source in (
+        (8, "Style Guide for Python Code\n\nIndentation uses four spaces."),
+        (20, "The Zen of Python\n\nBeautiful is better than ugly."),
+        (634, "Structural Pattern Matching\n\nThe match statement matches patterns."),
+        (636, "Pattern matching tutorial; patterns, patterns and more patterns."),
+    ):
+        source_cache.source_file(pep).write_text(source, encoding="utf-8")
+    return source_cache
+
+
+##############################################################################
+def test_cached(cache: SourceCache, tmp_path: Path) -> None:
+    """The cache should know which sources it holds."""
+    (tmp_path / "pep-nope.rst").write_text("Not a PEP", encoding="utf-8")
+    assert sorted(cache.cached()) == [8, 20, 634, 636]
+
+
+##############################################################################
+def test_catch_up(cache: SourceCache, tmp_path: Path) -> None:
+    """Catching up should only index sources that aren't indexed."""
+    index = SourceIndex(tmp_path / "index" / "sources.db")
+    assert len(index) == 0
+    assert index.catch_up(cache) == 4
+    assert index.indexed == {8, 20, 634, 636}
+    assert index.catch_up(cache) == 0
+    cache.source_file(1).write_text("PEP Purpose and Guidelines", encoding="utf-8")
+    assert index.catch_up(cache) == 1
+    assert len(SourceIndex(tmp_path / "index" / "sources.db")) == 5
+
+
+##############################################################################
+def test_search(cache: SourceCache, tmp_path: Path) -> None:
+    """Searching should find the matching sources, best match first."""
+    index = SourceIndex(tmp_path / "sources.db")
+    index.catch_up(cache)
+    hits = index.search("pattern")
+    assert [hit.pep for hit in hits] == [636, 634]
+    assert hits[0].rank <= hits[1].rank
+    start, end = SNIPPET_MARKS
+    assert f"{start}Pattern{end}" in hits[0].snippet
+    assert sorted(hit.pep for hit in index.search("match patterns")) == [634, 636]
+    assert [hit.pep for hit in index.search("patterns statement")] == [634]
+    assert [hit.pep for hit in index.search("ZEN")] == [20]
+    assert index.search("spaces ugly") == []
+    assert index.search("") == []
+
+
+##############################################################################
+def test_search_ignores_query_syntax(cache: SourceCache, tmp_path: Path) -> None:
+    """Text that looks like full-text query syntax should just be searched for."""
+    index = SourceIndex(tmp_path / "sources.db")
+    index.catch_up(cache)
+    assert [hit.pep for hit in index.search('"zen" OR NEAR(style*')] == []
+    assert [hit.pep for hit in index.search("Zen: Python")] == [20]
+
+
+##############################################################################
+def test_add_and_forget(cache: SourceCache, tmp_path: Path) -> None:
+    """Adding a source should replace it, and forgetting it should remove it."""
+    index = SourceIndex(tmp_path / "sources.db")
+    index.catch_up(cache)
+    index.add(20, "Something else entirely")
+    assert index.search("zen") == []
+    assert [hit.pep for hit in index.search("entirely")] == [20]
+    index.forget(20)
+    assert index.search("entirely") == []
+    assert index.indexed == {8, 634, 636}
+
+
+##############################################################################
+def test_catch_up_with_changes(cache: SourceCache, tmp_path: Path) -> None:
+    """Catching up should only index the sources that have changed."""
+    index = SourceIndex(tmp_path / "sources.db")
+    index.catch_up(cache)
+    cache.source_file(20).write_text("The Zen of Something Else", encoding="utf-8")
+    source = cache.source_file(8)
+    utime(source, ns=(source.stat().st_atime_ns, source.stat().st_mtime_ns + 10**9))
+    cache.source_file(636).unlink()
+    assert index.catch_up(cache) == 2
+    assert index.indexed == {8, 20, 634}
+    assert [hit.pep for hit in index.search("something")] == [20]
+    assert index.search("beautiful") == []
+    assert [hit.pep for hit in index.search("indentation")] == [8]
+    assert index.catch_up(cache) == 0
+
+
+##############################################################################
+def test_catch_up_with_some_peps(cache: SourceCache, tmp_path: Path) -> None:
+    """Catching up with some PEPs should leave the other PEPs alone."""
+    index = SourceIndex(tmp_path / "sources.db")
+    assert index.catch_up(cache, (8, 20, 1)) == 2
+    assert index.indexed == {8, 20}
+    cache.source_file(20).unlink()
+    assert index.catch_up(cache, iter((634,))) == 1
+    assert index.indexed == {8, 20, 634}
+    assert index.catch_up(cache, iter((20,))) == 1
+    assert index.indexed == {8, 634}
+
+
+##############################################################################
+def test_catch_up_after_add(cache: SourceCache, tmp_path: Path) -> None:
+    """A source added from elsewhere should be replaced by the cached source."""
+    index = SourceIndex(tmp_path / "sources.db")
+    index.catch_up(cache)
+    index.add(20, "Something else entirely")
+    assert index.catch_up(cache) == 1
+    assert [hit.pep for hit in index.search("zen")] == [20]
+
+
+##############################################################################
+def test_plain_text() -> None:
+    """The markup of a source should be removed before it's indexed."""
+    assert (
+        plain_text(
+            "Introduction\n"
+            "============\n"
+            "\n"
+            ".. _docs: https://docs.python.org/\n"
+            "See ``match``, :pep:`634`, `the docs <https://docs.python.org/>`_\n"
+            "and :ref:`<target>`, **very** *much*.\n"
+            "\n"
+            ".. note::\n"
+            "   A note.\n"
+        ).split()
+        == (
+            "Introduction See match, 634, the docs and target, very much. A note."
+        ).split()
+    )
+
+
+##############################################################################
+def test_catch_up_with_workers(cache: SourceCache, tmp_path: Path) -> None:
+    """Preparing sources in other processes should index the same as this one."""
+    in_process = SourceIndex(tmp_path / "in-process.db", workers=1)
+    in_process.catch_up(cache)
+    pooled = SourceIndex(tmp_path / "pooled.db", workers=2, chunk_size=1)
+    assert pooled.catch_up(cache) == 4
+    for text in ("pattern", "zen", "indentation spaces"):
+        assert pooled.search(text) == in_process.search(text)
+
+
+##############################################################################
+def test_catch_up_without_workers(
+    cache: SourceCache, tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """If other processes can't be used, sources should be prepared in this one."""
+
+    def no_processes(*_: object, **__: object) -> None:
+        raise NotImplementedError
+
+    monkeypatch.setattr(source_index, "ProcessPoolExecutor", no_processes)
+    index = SourceIndex(tmp_path / "sources.db", workers=4, chunk_size=1)
+    assert index.catch_up(cache) == 4
+    assert [hit.pep for hit in index.search("zen")] == [20]
+
+
+##############################################################################
+def test_catch_up_commits_each_batch(
+    cache: SourceCache, tmp_path: Path, monkeypatch: MonkeyPatch
+) -> None:
+    """Each batch of sources should be searchable as soon as it's indexed."""
+    seen: list[set[int]] = []
+    prepare_sources = source_index.prepare_sources
+
+    def watched(files: list[tuple[int, Path]]) -> list[PreparedSource]:
+        seen.append(SourceIndex(tmp_path / "sources.db").indexed)
+        return prepare_sources(files)
+
+    monkeypatch.setattr(source_index, "prepare_sources", watched)
+    SourceIndex(tmp_path / "sources.db", workers=1, chunk_size=1).catch_up(cache)
+    assert seen == [set(), {8}, {8, 20}, {8, 20, 634}]
+
+
+##############################################################################
+def test_catch_up_from_threads(cache: SourceCache, tmp_path: Path) -> None:
+    """Catching up from several threads at once should index each source once."""
+    index = SourceIndex(tmp_path / "sources.db", workers=1, chunk_size=1)
+    changed: list[int] = []
+    threads = [
+        Thread(target=lambda: changed.append(index.catch_up(cache))) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sorted(changed) == [0, 0, 0, 4]
+    assert index.indexed == {8, 20, 634, 636}
+
+
+### test_source_index.py ends here
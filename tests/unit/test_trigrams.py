@@ -0,0 +1,106 @@
+"""Tests for the trigram index of the text of PEPs."""
+
+##############################################################################
+# Python imports.
+from typing import Final
+
+##############################################################################
+# Pytest imports.
+from pytest import mark
+
+##############################################################################
+# Local imports.
+from peplum.app.data.trigrams import TrigramIndex, resembles, trigrams
+
+##############################################################################
+DOCUMENTS: Final[tuple[str, ...]] = (
+    "Structural Pattern Matching: Specification",
+    "Structural Pattern Matching: Motivation and Rationale",
+    "Structural Pattern Matching: Tutorial",
+    "Type Hints",
+    "Syntax for Variable Annotations",
+    "Assignment Expressions",
+    "Style Guide for Python Code",
+    "The Zen of Python",
+    "Pattern recognition in the wild",
+    "",
+)
+"""Some documents to test with."""
+
+
+##############################################################################
+def test_trigrams() -> None:
+    """The trigrams of some text should be found regardless of case."""
+    assert trigrams("Zen") == {"  z", " ze", "zen", "en "}
+    assert trigrams("The ZEN!") == trigrams("the zen")
+    assert trigrams("") == frozenset()
+
+
+##############################################################################
+@mark.parametrize(
+    "text",
+    (
+        "pattern matching",
+        "pattern matchng",
+        "PATERN",
+        "zen python",
+        "annotations",
+        "anotations",
+        "nothing like this",
+        "a",
+        "",
+    ),
+)
+def test_resembling(text: str) -> None:
+    """The index should find the same documents as checking each document."""
+    index = TrigramIndex(DOCUMENTS)
+    everything = (1 << len(DOCUMENTS)) - 1
+    found = index.resembling(text, everything)
+    assert [bool(found >> ordinal & 1) for ordinal in range(len(DOCUMENTS))] == [
+        resembles(text, document) for document in DOCUMENTS
+    ]
+    assert index.resembling(text, found & 0b111) == found & 0b111
+
+
+##############################################################################
+def test_typo_tolerance() -> None:
+    """Slightly misspelt text should still be found."""
+    index = TrigramIndex(DOCUMENTS)
+    everything = (1 << len(DOCUMENTS)) - 1
+    assert index.resembling("pattern matchng", everything) == 0b111
+    assert index.resembling("sytax for anotations", everything) == 0b10000
+
+
+##############################################################################
+def test_ranked() -> None:
+    """Documents should be ranked by how many of the trigrams they contain."""
+    index = TrigramIndex(DOCUMENTS)
+    everything = (1 << len(DOCUMENTS)) - 1
+    ranked = list(index.ranked("pattern matching", everything))
+    assert ranked[0] == 0b111
+    assert ranked[1] == 1 << 8
+    assert sum(ranked) == everything
+    counts = [
+        len(trigrams("pattern matching") & trigrams(DOCUMENTS[found.bit_length() - 1]))
+        for found in ranked
+    ]
+    assert counts == sorted(counts, reverse=True)
+
+
+##############################################################################
+def test_patched() -> None:
+    """Patching the index should be the same as building it afresh."""
+    index = TrigramIndex(DOCUMENTS)
+    changed = list(DOCUMENTS)
+    changed[3] = "Type Hints, and pattern matching"
+    patched = index.patched(3, DOCUMENTS[3], changed[3])
+    fresh = TrigramIndex(changed)
+    everything = (1 << len(DOCUMENTS)) - 1
+    for text in ("pattern matching", "type hints", "hints"):
+        assert patched.resembling(text, everything) == fresh.resembling(
+            text, everything
+        )
+    assert index.resembling("pattern matching", everything) == 0b111
+
+
+### test_trigrams.py ends here